@@ -0,0 +1,121 @@
+"""
+Бенчмарк накладных расходов аутентификации на запрос
+
+Сравнивает прежний JWTMiddlewareHTTP (BaseHTTPMiddleware, новый
+JWTManager и три декодирования токена на запрос) с ASGI JWTMiddleware
+без кэша и с кэшем проверенных токенов.
+Запросы вызываются напрямую через ASGI интерфейс минимального приложения,
+поэтому разница показывает только стоимость middleware.
+
+Запуск: python -m benchmarks.auth
+"""
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+
+from starlette.applications import Starlette
+from starlette.authentication import AuthCredentials
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.middleware.jwt import JWTMiddleware
+from src.models.auth import AuthenticatedUser, UnauthenticatedUser
+from src.services.auth import JWTManager, VerifiedTokenCache, ReauthSessionCache
+
+REQUESTS = 5_000
+
+CONFIG = SimpleNamespace(JWT=SimpleNamespace(ACCESS_SECRET_KEY="access" * 8, REFRESH_SECRET_KEY="refresh" * 8))
+
+
+class LegacyJWTMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        jwt = JWTManager(config=request.app.state.config)
+        reauth_session_dict = request.app.state.reauth_session_dict
+
+        session_id = request.cookies.get("session_id")
+        current_tokens = jwt.get_jwt_cookie(request)
+        is_valid_session = False
+
+        is_valid_access_token = jwt.is_valid_access_token(current_tokens.access_token)
+        is_valid_refresh_token = jwt.is_valid_refresh_token(current_tokens.refresh_token)
+
+        if session_id and current_tokens.refresh_token:
+            bad_ref_token = reauth_session_dict.get(session_id)
+            is_valid_session = (bad_ref_token != current_tokens.refresh_token)
+
+        if is_valid_access_token and is_valid_refresh_token and is_valid_session:
+            payload = jwt.decode_access_token(current_tokens.access_token)
+            request.scope["user"] = AuthenticatedUser(**payload.model_dump())
+            request.scope["auth"] = AuthCredentials(["authenticated"])
+        else:
+            request.scope["user"] = UnauthenticatedUser()
+            request.scope["auth"] = AuthCredentials()
+
+        return await call_next(request)
+
+
+async def endpoint(request):
+    return PlainTextResponse(str("user" in request.scope and request.user.is_authenticated))
+
+
+def make_app(middleware=None, **options) -> Starlette:
+    app = Starlette(routes=[Route("/", endpoint)])
+    app.state.config = CONFIG
+    app.state.reauth_session_dict = dict()
+    app.state.reauth_sessions = ReauthSessionCache()
+    if middleware:
+        app.add_middleware(middleware, **options)
+    return app
+
+
+def make_cookie() -> bytes:
+    jwt = JWTManager(config=CONFIG)
+    payload = dict(id=str(uuid.uuid4()), username="user", permissions=[], state_id=1)
+    access = jwt._generate_token(3600, CONFIG.JWT.ACCESS_SECRET_KEY, **payload)
+    refresh = jwt._generate_token(3600, CONFIG.JWT.REFRESH_SECRET_KEY, **payload)
+    return f"access_token={access}; refresh_token={refresh}; session_id={uuid.uuid4()}".encode()
+
+
+async def measure(app: Starlette, cookie: bytes) -> float:
+    body = set()
+    scope = {
+        "type": "http", "method": "GET", "path": "/", "raw_path": b"/", "root_path": "",
+        "query_string": b"", "headers": [(b"cookie", cookie)], "http_version": "1.1",
+        "scheme": "http", "server": ("bench", 80), "client": ("bench", 1),
+    }
+
+    async def receive():
+        # Как у сервера: тело запроса пустое, дальше receive ждет отключения клиента
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message["body"]:
+            body.add(message["body"])
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    elapsed = (time.perf_counter() - start) / REQUESTS
+
+    assert body == ({b"True"} if app.user_middleware else {b"False"}), body
+    return elapsed
+
+
+async def main():
+    cookie = make_cookie()
+    baseline = await measure(make_app(), cookie)
+    print(f"{'middleware':>16} {'us/request':>12} {'overhead, us':>14}")
+    print(f"{'none':>16} {baseline * 1e6:12.1f} {'-':>14}")
+    for name, app in (
+            ("legacy", make_app(LegacyJWTMiddleware)),
+            ("asgi", make_app(JWTMiddleware, config=CONFIG)),
+            ("asgi + cache", make_app(JWTMiddleware, config=CONFIG, token_cache=VerifiedTokenCache())),
+    ):
+        elapsed = await measure(app, cookie)
+        print(f"{name:>16} {elapsed * 1e6:12.1f} {(elapsed - baseline) * 1e6:14.1f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
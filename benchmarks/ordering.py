@@ -0,0 +1,68 @@
+"""
+Микро-бенчмарк сортировки задач по цепочке child_id
+
+Сравнивает прежний квадратичный обход (поиск следующего элемента
+перебором всего списка) с src.utils.ordering.sort_by_chain.
+
+Запуск: python -m benchmarks.ordering
+"""
+import random
+import timeit
+import uuid
+from types import SimpleNamespace
+
+from src.utils.ordering import sort_by_chain
+
+SIZES = (100, 1_000, 2_000, 5_000, 10_000, 50_000)
+QUADRATIC_LIMIT = 2_000
+
+
+def make_chain(size: int) -> list[SimpleNamespace]:
+    ids = [uuid.uuid4() for _ in range(size)]
+    nodes = [
+        SimpleNamespace(id=ids[i], child_id=ids[i + 1] if i + 1 < size else None)
+        for i in range(size)
+    ]
+    random.shuffle(nodes)
+    return nodes
+
+
+def quadratic_sort(nodes: list) -> list:
+    ids = {el.id for el in nodes}
+    child_ids = {el.child_id for el in nodes}
+    result = list(ids - child_ids)
+    if not result:
+        return []
+
+    sorted_nodes = []
+    current = [el for el in nodes if el.id == result[0]][0]
+    while True:
+        sorted_nodes.append(current)
+        searched = [el for el in nodes if el.id == current.child_id]
+        if searched:
+            current = searched[0]
+            continue
+        break
+    return sorted_nodes
+
+
+def measure(func, nodes: list) -> float:
+    runs = max(1, 20_000 // len(nodes))
+    return min(timeit.repeat(lambda: func(nodes), number=runs, repeat=3)) / runs
+
+
+def main():
+    print(f"{'size':>8} {'linear, ms':>12} {'quadratic, ms':>14}")
+    for size in SIZES:
+        nodes = make_chain(size)
+        linear = measure(sort_by_chain, nodes) * 1000
+        if size <= QUADRATIC_LIMIT:
+            assert sort_by_chain(nodes) == quadratic_sort(nodes)
+            quadratic = f"{measure(quadratic_sort, nodes) * 1000:14.2f}"
+        else:
+            quadratic = f"{'-':>14}"
+        print(f"{size:>8} {linear:12.3f} {quadratic}")
+
+
+if __name__ == '__main__':
+    main()
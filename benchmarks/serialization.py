@@ -0,0 +1,123 @@
+"""
+Бенчмарк сериализации доски проекта
+
+Сравнивает путь через pydantic (схемы, валидация response_model и
+JSONResponse, как для обычных endpoint) с быстрым путем: записи
+src.models.records из строк get_board и FastJSONResponse. Строки
+генерируются в памяти, база данных не нужна. Для каждого размера доски
+выводится время сериализации, пиковая память (tracemalloc) и размер ответа;
+ответы обоих путей сравниваются.
+
+    python -m benchmarks.serialization
+"""
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.services.kanban import _board_from_rows
+from src.models import schemas
+from src.utils.serialization import FastJSONResponse, orjson
+from src.views import ColumnsResponse
+
+COLUMNS = 10
+SIZES = (1_000, 10_000, 20_000)
+TAGS = 20
+TAGS_PER_TASK = 3
+REPEAT = 5
+
+
+class Row(dict):
+    def _asdict(self) -> dict:
+        return self
+
+
+def make_rows(task_count: int) -> list[Row]:
+    now = datetime.now(timezone.utc)
+    tags = [(uuid.uuid4(), f"tag {i}", now) for i in range(TAGS)]
+    rows = []
+    for column in range(COLUMNS):
+        column_id = uuid.uuid4()
+        column_fields = dict(
+            column_id=column_id,
+            column_title=f"column {column}",
+            column_project_id=uuid.uuid4(),
+            column_child_id=None,
+            column_wip_limit=None,
+            column_position="a",
+            column_created_at=now,
+            column_updated_at=None,
+        )
+        for i in range(task_count // COLUMNS):
+            task_tags = sorted(random.sample(tags, TAGS_PER_TASK), key=lambda tag: tag[1])
+            rows.append(Row(
+                **column_fields,
+                task_id=uuid.uuid4(),
+                task_title=f"task {i}",
+                task_color="#ffffff",
+                task_content_data=("Описание задачи " * 4).encode(),
+                task_content_compressed=False,
+                task_story_point=1,
+                task_start_time=now,
+                task_end_time=now + timedelta(days=1),
+                task_executor_id=uuid.uuid4(),
+                task_column_id=column_id,
+                task_child_id=None,
+                task_position=f"a{i}",
+                task_created_at=now,
+                task_updated_at=now,
+                tag_ids=[tag[0] for tag in task_tags],
+                tag_titles=[tag[1] for tag in task_tags],
+                tag_created_ats=[tag[2] for tag in task_tags],
+            ))
+    return rows
+
+
+async def pydantic_path(rows) -> bytes:
+    field = create_response_field(name="board", type_=ColumnsResponse)
+    view = ColumnsResponse(
+        content=[schemas.Column.model_validate(column) for column in _board_from_rows(rows)]
+    )
+    content = await serialize_response(field=field, response_content=view, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def fast_path(rows) -> bytes:
+    return FastJSONResponse({"content": _board_from_rows(rows), "error": None}).body
+
+
+async def measure(func, rows) -> tuple[float, float, int]:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        body = await func(rows)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    await func(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings) * 1000, peak / 2 ** 20, len(body)
+
+
+async def main() -> None:
+    print(f"encoder: {'orjson' if orjson else 'json'}")
+    for size in SIZES:
+        rows = make_rows(size)
+        assert json.loads(await pydantic_path(rows)) == json.loads(await fast_path(rows))
+
+        print(f"\n{size} задач")
+        for name, func in (("pydantic", pydantic_path), ("fast", fast_path)):
+            elapsed, peak, length = await measure(func, rows)
+            print(f"  {name:<10} {elapsed:8.1f} ms  {peak:7.1f} MiB peak  {length / 2 ** 20:5.1f} MiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,25 +10,29 @@ from src.config import load_consul_config
 from src.models.tables import Base
 
 
-# App Config
-app_config = load_consul_config(
-    os.getenv('CONSUL_ROOT'),
-    host=os.getenv('CONSUL_HOST'),
-    port=int(os.getenv('CONSUL_PORT'))
-)
-
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
-# Init config vars
-section = config.config_ini_section
-config.set_section_option(section, "USERNAME", app_config.DB.POSTGRESQL.USERNAME)
-config.set_section_option(section, "PASSWORD", app_config.DB.POSTGRESQL.PASSWORD)
-config.set_section_option(section, "HOST", app_config.DB.POSTGRESQL.HOST)
-config.set_section_option(section, "PORT", str(app_config.DB.POSTGRESQL.PORT))
-config.set_section_option(section, "DATABASE", app_config.DB.POSTGRESQL.DATABASE)
+# Соединение, переданное программно (config.attributes["connection"]),
+# например из тестов; иначе параметры БД берутся из Consul
+shared_connection = config.attributes.get("connection")
+
+if shared_connection is None:
+    # App Config
+    app_config = load_consul_config(
+        os.getenv('CONSUL_ROOT'),
+        host=os.getenv('CONSUL_HOST'),
+        port=int(os.getenv('CONSUL_PORT'))
+    )
+
+    # Init config vars
+    section = config.config_ini_section
+    config.set_section_option(section, "USERNAME", app_config.DB.POSTGRESQL.USERNAME)
+    config.set_section_option(section, "PASSWORD", app_config.DB.POSTGRESQL.PASSWORD)
+    config.set_section_option(section, "HOST", app_config.DB.POSTGRESQL.HOST)
+    config.set_section_option(section, "PORT", str(app_config.DB.POSTGRESQL.PORT))
+    config.set_section_option(section, "DATABASE", app_config.DB.POSTGRESQL.DATABASE)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -78,6 +82,10 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    if shared_connection is not None:
+        run_migrations(shared_connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -85,12 +93,16 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+        run_migrations(connection)
 
-        with context.begin_transaction():
-            context.run_migrations()
+
+def run_migrations(connection) -> None:
+    context.configure(
+        connection=connection, target_metadata=target_metadata
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
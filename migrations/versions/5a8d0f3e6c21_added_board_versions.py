@@ -0,0 +1,32 @@
+"""added board versions
+
+Revision ID: 5a8d0f3e6c21
+Revises: e3f91a7c2b60
+Create Date: 2026-10-18 17:05:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8d0f3e6c21'
+down_revision: Union[str, None] = 'e3f91a7c2b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'board_versions',
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('version', sa.BIGINT(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('project_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('board_versions')
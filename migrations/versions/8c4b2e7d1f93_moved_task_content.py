@@ -0,0 +1,90 @@
+"""moved task content
+
+Revision ID: 8c4b2e7d1f93
+Revises: 5a8d0f3e6c21
+Create Date: 2026-10-18 19:42:17.604518
+
+"""
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4b2e7d1f93'
+down_revision: Union[str, None] = '5a8d0f3e6c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Формат хранения на момент миграции (src.utils.compression), скопирован,
+# чтобы миграция не зависела от модулей приложения
+COMPRESS_MIN_SIZE = 256
+COMPRESS_LEVEL = 6
+
+
+def compress_text(text: str) -> tuple[bytes, bool]:
+    data = text.encode("utf-8")
+    if len(data) >= COMPRESS_MIN_SIZE:
+        compressed = zlib.compress(data, COMPRESS_LEVEL)
+        if len(compressed) < len(data):
+            return compressed, True
+    return data, False
+
+
+def decompress_text(data: bytes, compressed: bool) -> str:
+    if compressed:
+        data = zlib.decompress(data)
+    return bytes(data).decode("utf-8")
+
+
+def move_content(select: str, insert: str, convert) -> None:
+    """
+    Переносит содержание задач пачками по BATCH_SIZE в порядке id
+    """
+    connection = op.get_bind()
+    last_id = None
+    while True:
+        rows = connection.execute(sa.text(select), dict(last_id=last_id, limit=BATCH_SIZE)).all()
+        if not rows:
+            break
+
+        connection.execute(sa.text(insert), [convert(row) for row in rows])
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_contents',
+        sa.Column('task_id', sa.UUID(), nullable=False),
+        sa.Column('data', postgresql.BYTEA(), nullable=False),
+        sa.Column('compressed', sa.BOOLEAN(), server_default=sa.false(), nullable=False),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('task_id')
+    )
+    # Длинное содержание сжимается приложением, повторное сжатие TOAST не нужно
+    op.execute("ALTER TABLE task_contents ALTER COLUMN data SET STORAGE EXTERNAL")
+
+    move_content(
+        "SELECT id, content FROM tasks WHERE content <> '' "
+        "AND (CAST(:last_id AS UUID) IS NULL OR id > CAST(:last_id AS UUID)) ORDER BY id LIMIT :limit",
+        "INSERT INTO task_contents (task_id, data, compressed) VALUES (:task_id, :data, :compressed)",
+        lambda row: dict(zip(("task_id", "data", "compressed"), (row.id, *compress_text(row.content)))),
+    )
+    op.drop_column('tasks', 'content')
+
+
+def downgrade() -> None:
+    op.add_column('tasks', sa.Column('content', sa.VARCHAR(length=10000), nullable=True))
+
+    move_content(
+        "SELECT task_id AS id, data, compressed FROM task_contents "
+        "WHERE CAST(:last_id AS UUID) IS NULL OR task_id > CAST(:last_id AS UUID) ORDER BY task_id LIMIT :limit",
+        "UPDATE tasks SET content = :content WHERE id = :id",
+        lambda row: dict(id=row.id, content=decompress_text(row.data, row.compressed)),
+    )
+    op.drop_table('task_contents')
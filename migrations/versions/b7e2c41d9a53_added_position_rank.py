@@ -0,0 +1,142 @@
+"""added position rank
+
+Revision ID: b7e2c41d9a53
+Revises: 4369f2ccf446
+Create Date: 2026-10-18 12:04:31.518211
+
+"""
+import logging
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c41d9a53'
+down_revision: Union[str, None] = '4369f2ccf446'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Замороженные копии src.utils.rank.spread_keys и src.utils.ordering.sort_by_chain
+# на момент этой ревизии: миграция не должна меняться вместе с модулями
+# приложения, поэтому копии не изменяются при правке исходных функций
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+
+def encode_key(value: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        chars.append(DIGITS[digit])
+    return "".join(reversed(chars)).rstrip(DIGITS[0])
+
+
+def spread_keys(count: int) -> list[str]:
+    """
+    Возвращает count равномерно распределенных ключей одинаковой длины
+    """
+    width = 1
+    while BASE ** width <= count * 2:
+        width += 1
+
+    step = BASE ** width // (count + 1)
+    return [encode_key(step * (i + 1), width) for i in range(count)]
+
+
+def sort_by_chain(rows: list, key) -> list:
+    """
+    Сортирует строки по цепочке child_id за O(n) (копия src.utils.ordering.sort_by_chain)
+
+    Основная цепочка - самая длинная (при равной длине - первая по key),
+    за ней остальные головы со своими цепочками в порядке key, затем
+    элементы циклов. Строки не теряются при разрывах и циклах цепочки.
+
+    :param rows: строки с полями id и child_id
+    :param key: ключ сортировки для разрешения неоднозначностей
+    :return: отсортированный список
+    """
+    rows = sorted(rows, key=key)
+    index = {}
+    for row in rows:
+        index.setdefault(row.id, row)
+
+    referenced = {row.child_id for row in index.values() if row.child_id not in (None, row.id)}
+    heads = [row for row in index.values() if row.id not in referenced]
+
+    # Длина цепочки от каждого элемента, цепочки разных голов могут сливаться
+    lengths = {}
+    for head in heads:
+        path, path_ids = [], set()
+        row = head
+        while row is not None and row.id not in lengths and row.id not in path_ids:
+            path.append(row)
+            path_ids.add(row.id)
+            row = index.get(row.child_id)
+        length = lengths.get(row.id, 0) if row is not None else 0
+        for row in reversed(path):
+            length += 1
+            lengths[row.id] = length
+
+    if heads:
+        main = max(heads, key=lambda row: lengths[row.id])
+        heads.remove(main)
+        heads.insert(0, main)
+
+    result = []
+    visited = set()
+    for row in [*heads, *index.values()]:
+        while row is not None and row.id not in visited:
+            visited.add(row.id)
+            result.append(row)
+            row = index.get(row.child_id)
+
+    if len(heads) != 1 or len(result) != len(rows):
+        logging.warning(
+            "Нарушена цепочка child_id: голов %d, элементов %d, дубликатов %d",
+            len(heads), len(index), len(rows) - len(index)
+        )
+    return result
+
+
+def backfill_position(table: str, scope: str) -> None:
+    """
+    Заполняет position по существующим цепочкам child_id
+    """
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        f"SELECT id, child_id, created_at, {scope} AS scope_id FROM {table} ORDER BY {scope}"
+    )).all()
+
+    values = []
+    for _, scope_rows in groupby(rows, key=lambda row: row.scope_id):
+        ordered = sort_by_chain(list(scope_rows), key=lambda row: (row.created_at, row.id))
+        values.extend(
+            dict(id=row.id, position=key) for row, key in zip(ordered, spread_keys(len(ordered)))
+        )
+
+    if values:
+        connection.execute(sa.text(f"UPDATE {table} SET position = :position WHERE id = :id"), values)
+
+
+def upgrade() -> None:
+    op.add_column('columns', sa.Column('position', sa.VARCHAR(length=128, collation='C'), nullable=True))
+    op.add_column('tasks', sa.Column('position', sa.VARCHAR(length=128, collation='C'), nullable=True))
+
+    backfill_position('columns', 'project_id')
+    backfill_position('tasks', 'column_id')
+
+    op.alter_column('columns', 'position', nullable=False)
+    op.alter_column('tasks', 'position', nullable=False)
+    op.create_index('ix_columns_project_id_position', 'columns', ['project_id', 'position'], unique=False)
+    op.create_index('ix_tasks_column_id_position', 'tasks', ['column_id', 'position'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_column_id_position', table_name='tasks')
+    op.drop_index('ix_columns_project_id_position', table_name='columns')
+    op.drop_column('tasks', 'position')
+    op.drop_column('columns', 'position')
@@ -0,0 +1,84 @@
+"""added lookup indexes
+
+Revision ID: e3f91a7c2b60
+Revises: b7e2c41d9a53
+Create Date: 2026-10-18 14:37:12.204816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3f91a7c2b60'
+down_revision: Union[str, None] = 'b7e2c41d9a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# tasks.column_id и columns.project_id покрываются индексами (.., position),
+# tags.project_id - уникальным индексом (project_id, title)
+INDEXES = [
+    ('ix_tasks_child_id', 'tasks', ['child_id']),
+    ('ix_columns_child_id', 'columns', ['child_id']),
+    ('ix_task_tags_tag_id', 'task_tags', ['tag_id']),
+]
+
+UNIQUE_CONSTRAINTS = [
+    ('uq_task_tags_task_id_tag_id', 'task_tags', ['task_id', 'tag_id']),
+    ('uq_tags_project_id_title', 'tags', ['project_id', 'title']),
+]
+
+
+def remove_duplicates() -> None:
+    # Дубликаты тегов проекта: связи переносятся на самый ранний тег
+    op.execute("""
+        WITH duplicates AS (
+            SELECT id, first_value(id) OVER (
+                PARTITION BY project_id, title ORDER BY created_at, id
+            ) AS keep_id
+            FROM tags
+        )
+        UPDATE task_tags SET tag_id = duplicates.keep_id
+        FROM duplicates
+        WHERE task_tags.tag_id = duplicates.id AND duplicates.id <> duplicates.keep_id
+    """)
+    op.execute("""
+        DELETE FROM tags a USING tags b
+        WHERE a.project_id = b.project_id AND a.title = b.title
+          AND (a.created_at, a.id) > (b.created_at, b.id)
+    """)
+    op.execute("""
+        DELETE FROM task_tags a USING task_tags b
+        WHERE a.task_id = b.task_id AND a.tag_id = b.tag_id AND a.ctid > b.ctid
+    """)
+
+
+def upgrade() -> None:
+    remove_duplicates()
+
+    # CREATE INDEX CONCURRENTLY не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES + UNIQUE_CONSTRAINTS:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=(name, table, columns) in UNIQUE_CONSTRAINTS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+    for name, table, _ in UNIQUE_CONSTRAINTS:
+        op.execute(sa.text(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}"))
+
+
+def downgrade() -> None:
+    for name, table, _ in UNIQUE_CONSTRAINTS:
+        op.drop_constraint(name, table, type_='unique')
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
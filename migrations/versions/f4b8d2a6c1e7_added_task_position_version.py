@@ -0,0 +1,26 @@
+"""added task position version
+
+Revision ID: f4b8d2a6c1e7
+Revises: 8c4b2e7d1f93
+Create Date: 2026-10-18 19:12:06.274381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8d2a6c1e7'
+down_revision: Union[str, None] = '8c4b2e7d1f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('columns', sa.Column('task_position_version', sa.INTEGER(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('columns', 'task_position_version')
@@ -7,8 +7,9 @@ from fastapi.exceptions import RequestValidationError
 from src.config import load_consul_config
 from src.exceptions import APIError, handle_api_error, handle_404_error, handle_pydantic_error
 from src.lifespan import create_start_app_handler, create_stop_app_handler
-from src.middleware.jwt import JWTMiddlewareHTTP
+from src.middleware.jwt import JWTMiddleware
 from src.router import register_api_router
+from src.services.auth import VerifiedTokenCache
 from src.utils import custom_openapi
 
 
@@ -33,6 +34,7 @@ app = FastAPI(
 
 app.openapi = lambda: custom_openapi(app, logo_url="https://avatars.githubusercontent.com/u/107867909?s=200&v=4")
 app.state.config = config
+app.state.token_cache = VerifiedTokenCache(config.JWT.TOKEN_CACHE_SIZE) if config.JWT.TOKEN_CACHE_SIZE else None
 
 app.add_event_handler("startup", create_start_app_handler(app, config))
 app.add_event_handler("shutdown", create_stop_app_handler(app))
@@ -44,4 +46,4 @@ app.add_exception_handler(APIError, handle_api_error)
 app.add_exception_handler(404, handle_404_error)
 app.add_exception_handler(RequestValidationError, handle_pydantic_error)
 logging.debug("Регистрация middleware.")
-app.add_middleware(JWTMiddlewareHTTP)
+app.add_middleware(JWTMiddleware, config=config, token_cache=app.state.token_cache)
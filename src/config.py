@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from importlib.util import find_spec
 from src.version import __version__
 
 import consul
@@ -14,9 +15,24 @@ class PostgresConfig:
     PORT: int = 5432
 
 
+@dataclass
+class PoolConfig:
+    SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    TIMEOUT: float = 30
+    RECYCLE: int = 1800
+    PRE_PING: bool = True
+
+
 @dataclass
 class DbConfig:
     POSTGRESQL: PostgresConfig
+    POOL: PoolConfig
+    REPLICA: PostgresConfig | None = None
+    STATEMENT_CACHE_SIZE: int = 100
+    PGBOUNCER: bool = False
+    STATEMENT_TIMEOUT_MS: int = 30000
+    ECHO: bool = False
 
 
 @dataclass
@@ -30,6 +46,7 @@ class Contact:
 class JWT:
     ACCESS_SECRET_KEY: str
     REFRESH_SECRET_KEY: str
+    TOKEN_CACHE_SIZE: int = 10000
 
 
 @dataclass
@@ -44,12 +61,21 @@ class Base:
 class UMSGRPC:
     HOST: str
     PORT: int
+    POOL_SIZE: int = 1
+    KEEPALIVE_TIME_MS: int = 30000
+    KEEPALIVE_TIMEOUT_MS: int = 10000
 
 
 @dataclass
 class ProjectServiceGRPC:
     HOST: str
     PORT: int
+    POOL_SIZE: int = 2
+    KEEPALIVE_TIME_MS: int = 30000
+    KEEPALIVE_TIMEOUT_MS: int = 10000
+    MEMBERSHIP_CACHE_SIZE: int = 10000
+    MEMBERSHIP_TTL: int = 60
+    MEMBERSHIP_NEGATIVE_TTL: int = 5
 
 
 @dataclass
@@ -60,12 +86,25 @@ class Config:
     JWT: JWT
     BASE: Base
     DB: DbConfig
+    FAST_SERIALIZATION: frozenset[str] = frozenset()
+    RUNTIME_STATS: bool = False
 
 
 def to_bool(value) -> bool:
     return str(value).strip().lower() in ("yes", "true", "t", "1")
 
 
+def to_set(value) -> frozenset[str]:
+    return frozenset(item.strip() for item in str(value).split(",") if item.strip())
+
+
+def default(value, default_value):
+    """
+    Значение ключа или default_value, если ключ не задан
+    """
+    return default_value if value is None else value
+
+
 class KVManager:
     def __init__(self, kv, *, root_name: str):
         self.config = kv
@@ -85,6 +124,24 @@ class KVManager:
         return None
 
 
+def load_replica_config(config: KVManager, primary: PostgresConfig) -> PostgresConfig | None:
+    """
+    Реплика для чтения, если задан DATABASE/REPLICA/HOST.
+    Не заданные параметры берутся из основной БД
+    """
+    host = config("DATABASE", "REPLICA", "HOST")
+    if not host:
+        return None
+
+    return PostgresConfig(
+        HOST=host,
+        PORT=default(config("DATABASE", "REPLICA", "PORT"), primary.PORT),
+        USERNAME=default(config("DATABASE", "REPLICA", "USERNAME"), primary.USERNAME),
+        PASSWORD=default(config("DATABASE", "REPLICA", "PASSWORD"), primary.PASSWORD),
+        DATABASE=default(config("DATABASE", "REPLICA", "DATABASE"), primary.DATABASE),
+    )
+
+
 def load_consul_config(
         root_name: str,
         *,
@@ -109,15 +166,31 @@ def load_consul_config(
         ).kv,
         root_name=root_name
     )
+    postgresql = PostgresConfig(
+        HOST=config("DATABASE", "POSTGRESQL", "HOST"),
+        PORT=config("DATABASE", "POSTGRESQL", "PORT"),
+        USERNAME=config("DATABASE", "POSTGRESQL", "USERNAME"),
+        PASSWORD=config("DATABASE", "POSTGRESQL", "PASSWORD"),
+        DATABASE=config("DATABASE", "POSTGRESQL", "DATABASE")
+    )
     return Config(
         DEBUG=to_bool(os.getenv('DEBUG', 1)),
         UMS_GRPC=UMSGRPC(
             HOST=os.getenv("UMS_GRPC_HOST"),
-            PORT=int(os.getenv("UMS_GRPC_PORT"))
+            PORT=int(os.getenv("UMS_GRPC_PORT")),
+            POOL_SIZE=int(os.getenv("UMS_GRPC_POOL_SIZE", 1)),
+            KEEPALIVE_TIME_MS=int(os.getenv("UMS_GRPC_KEEPALIVE_TIME_MS", 30000)),
+            KEEPALIVE_TIMEOUT_MS=int(os.getenv("UMS_GRPC_KEEPALIVE_TIMEOUT_MS", 10000)),
         ),
         PROJECT_SERVICE_GRPC=ProjectServiceGRPC(
             HOST=os.getenv("PROJECT_SERVICE_GRPC_HOST"),
-            PORT=int(os.getenv("PROJECT_SERVICE_GRPC_PORT"))
+            PORT=int(os.getenv("PROJECT_SERVICE_GRPC_PORT")),
+            POOL_SIZE=int(os.getenv("PROJECT_SERVICE_GRPC_POOL_SIZE", 2)),
+            KEEPALIVE_TIME_MS=int(os.getenv("PROJECT_SERVICE_GRPC_KEEPALIVE_TIME_MS", 30000)),
+            KEEPALIVE_TIMEOUT_MS=int(os.getenv("PROJECT_SERVICE_GRPC_KEEPALIVE_TIMEOUT_MS", 10000)),
+            MEMBERSHIP_CACHE_SIZE=int(os.getenv("PROJECT_SERVICE_MEMBERSHIP_CACHE_SIZE", 10000)),
+            MEMBERSHIP_TTL=int(os.getenv("PROJECT_SERVICE_MEMBERSHIP_TTL", 60)),
+            MEMBERSHIP_NEGATIVE_TTL=int(os.getenv("PROJECT_SERVICE_MEMBERSHIP_NEGATIVE_TTL", 5)),
         ),
         BASE=Base(
             TITLE=config("BASE", "TITLE"),
@@ -131,15 +204,28 @@ def load_consul_config(
         ),
         JWT=JWT(
             ACCESS_SECRET_KEY=config("JWT", "ACCESS_SECRET_KEY"),
-            REFRESH_SECRET_KEY=config("JWT", "REFRESH_SECRET_KEY")
+            REFRESH_SECRET_KEY=config("JWT", "REFRESH_SECRET_KEY"),
+            TOKEN_CACHE_SIZE=int(os.getenv("JWT_TOKEN_CACHE_SIZE", 10000)),
         ),
         DB=DbConfig(
-            POSTGRESQL=PostgresConfig(
-                HOST=config("DATABASE", "POSTGRESQL", "HOST"),
-                PORT=config("DATABASE", "POSTGRESQL", "PORT"),
-                USERNAME=config("DATABASE", "POSTGRESQL", "USERNAME"),
-                PASSWORD=config("DATABASE", "POSTGRESQL", "PASSWORD"),
-                DATABASE=config("DATABASE", "POSTGRESQL", "DATABASE")
-            )
+            POSTGRESQL=postgresql,
+            REPLICA=load_replica_config(config, postgresql),
+            POOL=PoolConfig(
+                # KVManager приводит к int только неотрицательные целые ("-1" и "2.5" - строки)
+                SIZE=int(default(config("DATABASE", "POOL", "SIZE"), 5)),
+                MAX_OVERFLOW=int(default(config("DATABASE", "POOL", "MAX_OVERFLOW"), 10)),
+                TIMEOUT=float(default(config("DATABASE", "POOL", "TIMEOUT"), 30)),
+                RECYCLE=int(default(config("DATABASE", "POOL", "RECYCLE"), 1800)),
+                PRE_PING=to_bool(default(config("DATABASE", "POOL", "PRE_PING"), 1)),
+            ),
+            STATEMENT_CACHE_SIZE=int(default(config("DATABASE", "STATEMENT_CACHE_SIZE"), 100)),
+            PGBOUNCER=to_bool(default(config("DATABASE", "PGBOUNCER"), 0)),
+            STATEMENT_TIMEOUT_MS=int(default(config("DATABASE", "STATEMENT_TIMEOUT_MS"), 30000)),
+            ECHO=to_bool(default(config("DATABASE", "ECHO"), 0)),
         ),
+        # Без orjson быстрый путь медленнее pydantic, поэтому по умолчанию он включен только с orjson
+        FAST_SERIALIZATION=to_set(os.getenv(
+            "FAST_SERIALIZATION", "board,column_list,task_list" if find_spec("orjson") else ""
+        )),
+        RUNTIME_STATS=to_bool(os.getenv("RUNTIME_STATS", 0)),
     )
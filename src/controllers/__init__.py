@@ -2,3 +2,4 @@ from . import stats
 from . import column
 from . import task
 from . import permission
+from . import board
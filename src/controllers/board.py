@@ -0,0 +1,42 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi import status as http_status
+
+from src.dependencies.services import get_services
+from src.models.state import TaskInclude
+from src.services import ServiceFactory
+from src.utils.serialization import FastJSONResponse, fast_serialization
+from src.views import ColumnsResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=ColumnsResponse, status_code=http_status.HTTP_200_OK)
+async def board(
+        project_id: UUID,
+        request: Request,
+        include: list[TaskInclude] = Query([]),
+        services: ServiceFactory = Depends(get_services)
+):
+    """
+    Получить доску проекта: колонки с задачами и тегами
+
+    Псевдоним /column/list без preview, fields и ETag: тот же ответ
+    (KanbanApplicationService.column_list), загружаемый одним запросом
+    к БД и сериализуемый быстрым путем (FAST_SERIALIZATION)
+
+    Содержание задач (content) загружается только с include=content
+
+    Требуемое состояние: Active
+
+    Требуемые права доступа: GET_COLUMN
+
+    """
+    as_records = fast_serialization(request, "board")
+    columns = await services.kanban.column_list(
+        project_id, as_records=as_records, include_content=TaskInclude.CONTENT in include
+    )
+    if as_records:
+        return FastJSONResponse({"content": columns, "error": None})
+    return ColumnsResponse(content=columns)
@@ -1,29 +1,81 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from fastapi import status as http_status
 
 from src.dependencies.services import get_services
 from src.models import schemas
+from src.models.state import TaskInclude
 from src.services import ServiceFactory
-from src.views import ColumnResponse, ColumnsResponse
+from src.utils.etag import make_etag, etag_matches, not_modified
+from src.utils.formators import split_list
+from src.utils.serialization import FastJSONResponse, fast_serialization
+from src.views import ColumnResponse, ColumnsResponse, ColumnPreviewsResponse
 
 router = APIRouter()
 
 
-@router.get("/list", response_model=ColumnsResponse, status_code=http_status.HTTP_200_OK)
-async def column_list(project_id: UUID, services: ServiceFactory = Depends(get_services)):
+@router.get(
+    "/list",
+    response_model=ColumnPreviewsResponse | ColumnsResponse,
+    status_code=http_status.HTTP_200_OK,
+    responses={http_status.HTTP_304_NOT_MODIFIED: {"description": "Доска не изменилась"}},
+)
+async def column_list(
+        project_id: UUID,
+        request: Request,
+        response: Response,
+        preview: int = Query(None, ge=1, le=100),
+        include: list[TaskInclude] = Query([]),
+        fields: str = Query(None, description="Поля задач через запятую"),
+        exclude: str = Query(None, description="Исключаемые поля задач через запятую"),
+        if_none_match: str = Header(None),
+        services: ServiceFactory = Depends(get_services)
+):
     """
     Получить список колонок проекта
 
+    Ответ содержит ETag версии доски. Если он совпадает с If-None-Match,
+    возвращается 304 без загрузки колонок и задач
+
+    С preview=N каждая колонка содержит только первые N задач, общее число
+    задач task_count и next_cursor для догрузки остальных через /task/list
+
+    Содержание задач (content) загружается только с include=content
+
+    fields=id,title,... выбирает только перечисленные поля задач (id - всегда),
+    exclude=... исключает поля; tags.id - только id тегов. Невыбранные поля
+    не читаются из БД, такой ответ не проходит через схемы. Пустой fields
+    или неизвестное поле - ошибка 400
+
     Требуемое состояние: Active
 
-    Требуемые права доступа: GET_COLUMN
+    Требуемые права доступа: GET_COLUMN (с preview - также GET_TASK)
 
     """
-    return ColumnsResponse(
-        content=await services.kanban.column_list(project_id)
+    etag = make_etag(await services.kanban.column_list_version(project_id))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    fields, exclude = split_list(fields), split_list(exclude)
+    options = dict(
+        as_records=fields is not None or exclude is not None or fast_serialization(request, "column_list"),
+        include_content=TaskInclude.CONTENT in include,
+        fields=fields,
+        exclude=exclude,
     )
+    if preview:
+        columns = await services.kanban.column_preview(project_id, preview, **options)
+    else:
+        columns = await services.kanban.column_list(project_id, **options)
+
+    if options["as_records"]:
+        return FastJSONResponse({"content": columns, "error": None}, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    if preview:
+        return ColumnPreviewsResponse(content=columns)
+    return ColumnsResponse(content=columns)
 
 
 @router.post("/new", response_model=ColumnResponse, status_code=http_status.HTTP_201_CREATED)
@@ -68,6 +120,23 @@ async def update_column(
     await services.kanban.update_column(column_id, data)
 
 
+@router.post("/{column_id}/move", response_model=None, status_code=http_status.HTTP_204_NO_CONTENT)
+async def move_column(
+        column_id: UUID,
+        data: schemas.ColumnMove,
+        services: ServiceFactory = Depends(get_services)
+):
+    """
+    Переместить колонку перед child_id (в конец, если child_id не указан)
+
+    Требуемое состояние: ACTIVE
+
+    Требуемые права доступа: UPDATE_COLUMN
+
+    """
+    await services.kanban.move_column(column_id, data)
+
+
 @router.delete("/{column_id}", response_model=None, status_code=http_status.HTTP_204_NO_CONTENT)
 async def delete_column(column_id: UUID, services: ServiceFactory = Depends(get_services)):
     """
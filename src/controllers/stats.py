@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends
 from fastapi import status as http_status
 
 from src.dependencies.services import get_services
+from src.models.state import TaskStatus
 from src.services import ServiceFactory
 from src.views.stats import TagStatResponse, TaskCountStatResponse
 
@@ -20,30 +21,52 @@ async def version(details: bool = False, services: ServiceFactory = Depends(get_
     return await services.stats.get_stats(details)
 
 
+@router.get("/stats/runtime", response_model=dict, status_code=http_status.HTTP_200_OK)
+async def runtime_stats(services: ServiceFactory = Depends(get_services)):
+    """
+    Получить метрики кэшей сервиса (членство в проектах, проверенные токены)
+
+    Доступно, только если включено в конфигурации (RUNTIME_STATS)
+
+    Требуемое состояние: Active
+    """
+    return await services.stats.get_runtime_stats()
+
+
 @router.get("/ping", response_model=str, status_code=http_status.HTTP_200_OK)
 def ping():
     return "pong"
 
 
 @router.get("/stats/tag", response_model=TagStatResponse, status_code=http_status.HTTP_200_OK)
-async def tag_stat(project_id: UUID, services: ServiceFactory = Depends(get_services)):
+async def tag_stat(
+        project_id: UUID,
+        column_id: UUID = None,
+        status: TaskStatus = TaskStatus.ALL,
+        services: ServiceFactory = Depends(get_services)
+):
     """
     Получить статистику по тегам проекта
 
+    Можно ограничить задачами колонки (column_id) и статусом задач (status)
+
     Требуемое состояние: Active
 
     Требуемые права доступа: GET_TASK
     """
-    return TagStatResponse(content=await services.stats.get_tag_stat(project_id))
+    return TagStatResponse(content=await services.stats.get_tag_stat(project_id, column_id, status))
 
 
 @router.get("/stats/task/count", response_model=TaskCountStatResponse, status_code=http_status.HTTP_200_OK)
-async def tag_stat(project_id: UUID, services: ServiceFactory = Depends(get_services)):
+async def tag_stat(project_id: UUID, by_column: bool = False, services: ServiceFactory = Depends(get_services)):
     """
     Получить статистику по задачам проекта
 
+    Количество задач и сумма story point по статусам (all, active, done);
+    с by_column=true дополнительно - в разрезе колонок (поле column_id)
+
     Требуемое состояние: Active
 
     Требуемые права доступа: GET_TASK
     """
-    return TaskCountStatResponse(content=await services.stats.get_task_stat(project_id))
\ No newline at end of file
+    return TaskCountStatResponse(content=await services.stats.get_task_stat(project_id, by_column))
\ No newline at end of file
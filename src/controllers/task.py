@@ -1,29 +1,88 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from fastapi import status as http_status
 
 from src.dependencies.services import get_services
 from src.models import schemas
+from src.models.state import TaskInclude
 from src.services import ServiceFactory
+from src.utils.etag import make_etag, etag_matches, not_modified
+from src.utils.formators import split_list
+from src.utils.serialization import FastJSONResponse, fast_serialization
 from src.views import TaskResponse, TasksResponse
 from src.views.task import TagResponse, TagsResponse
 
 router = APIRouter()
 
 
-@router.get("/list", response_model=TasksResponse, status_code=http_status.HTTP_200_OK)
-async def task_list(column_id: UUID, services: ServiceFactory = Depends(get_services)):
+@router.get(
+    "/list",
+    response_model=TasksResponse,
+    status_code=http_status.HTTP_200_OK,
+    responses={http_status.HTTP_304_NOT_MODIFIED: {"description": "Доска не изменилась"}},
+)
+async def task_list(
+        column_id: UUID,
+        request: Request,
+        response: Response,
+        limit: int = Query(None, ge=1, le=500),
+        cursor: str = None,
+        include: list[TaskInclude] = Query([]),
+        fields: str = Query(None, description="Поля задач через запятую"),
+        exclude: str = Query(None, description="Исключаемые поля задач через запятую"),
+        if_none_match: str = Header(None),
+        services: ServiceFactory = Depends(get_services)
+):
     """
     Получить список задач колонки
 
+    Ответ содержит ETag версии доски. Если он совпадает с If-None-Match,
+    возвращается 304 без загрузки задач
+
+    С limit задачи возвращаются постранично: next_cursor ответа передается
+    в cursor для получения следующей страницы, на последней странице он null.
+    Если между запросами ключи позиций колонки были перебалансированы,
+    курсор устаревает: запрос с ним возвращает 400, список нужно загрузить
+    с первой страницы
+
+    Содержание задач (content) загружается только с include=content
+
+    fields=id,title,... выбирает только перечисленные поля задач (id - всегда),
+    exclude=... исключает поля; tags.id - только id тегов. Невыбранные поля
+    не читаются из БД, такой ответ не проходит через схемы. Пустой fields
+    или неизвестное поле - ошибка 400
+
     Требуемое состояние: Active
 
     Требуемые права доступа: GET_TASK
 
     """
+    etag = make_etag(await services.kanban.task_list_version(column_id))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    fields, exclude = split_list(fields), split_list(exclude)
+    as_records = fields is not None or exclude is not None or fast_serialization(request, "task_list")
+    page = await services.kanban.task_list(
+        column_id,
+        limit=limit,
+        cursor=cursor,
+        as_records=as_records,
+        include_content=TaskInclude.CONTENT in include,
+        fields=fields,
+        exclude=exclude,
+    )
+    if as_records:
+        return FastJSONResponse(
+            {"content": page.tasks, "error": None, "next_cursor": page.next_cursor},
+            headers={"ETag": etag}
+        )
+
+    response.headers["ETag"] = etag
     return TasksResponse(
-        content=await services.kanban.task_list(column_id)
+        content=page.tasks,
+        next_cursor=page.next_cursor
     )
 
 
@@ -69,6 +128,25 @@ async def update_task(
     await services.kanban.update_task(task_id, data)
 
 
+@router.post("/{task_id}/move", response_model=None, status_code=http_status.HTTP_204_NO_CONTENT)
+async def move_task(
+        task_id: UUID,
+        data: schemas.TaskMove,
+        services: ServiceFactory = Depends(get_services)
+):
+    """
+    Переместить задачу перед child_id (в конец колонки, если child_id не указан)
+
+    Если column_id не указан, задача перемещается внутри своей колонки
+
+    Требуемое состояние: ACTIVE
+
+    Требуемые права доступа: UPDATE_TASK
+
+    """
+    await services.kanban.move_task(task_id, data)
+
+
 @router.delete("/{task_id}", response_model=None, status_code=http_status.HTTP_204_NO_CONTENT)
 async def delete_task(task_id: UUID, services: ServiceFactory = Depends(get_services)):
     """
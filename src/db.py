@@ -1,5 +1,10 @@
 import urllib.parse
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
@@ -25,7 +30,40 @@ def create_psql_async_session(
         port: int,
         database: str,
         echo: bool = False,
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        statement_cache_size: int = 100,
+        pgbouncer: bool = False,
+        statement_timeout_ms: int = 0,
 ) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    """
+    :param pool_size: постоянные соединения пула
+    :param max_overflow: дополнительные соединения сверх pool_size
+    :param pool_timeout: ожидание свободного соединения, секунды
+    :param pool_recycle: пересоздание соединений старше N секунд (-1 - без ограничения)
+    :param pool_pre_ping: проверка соединения перед выдачей из пула
+    :param statement_cache_size: размер кэша подготовленных запросов asyncpg
+    :param pgbouncer: режим PgBouncer (transaction pooling): без кэша подготовленных
+        запросов и с уникальными именами подготовленных запросов
+    :param statement_timeout_ms: statement_timeout PostgreSQL (0 - без ограничения)
+    """
+    connect_args = {}
+    if pgbouncer:
+        # Подготовленные запросы не переживают смену серверного соединения
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid.uuid4()}__",
+        )
+    else:
+        connect_args.update(prepared_statement_cache_size=statement_cache_size)
+        if statement_timeout_ms:
+            connect_args.update(server_settings={"statement_timeout": str(statement_timeout_ms)})
+
     engine = create_async_engine(
         "postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}".format(
             username=urllib.parse.quote_plus(username),
@@ -35,9 +73,79 @@ def create_psql_async_session(
             database=database
         ),
         echo=echo,
-        future=True
+        future=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        connect_args=connect_args,
     )
+
+    if pgbouncer and statement_timeout_ms:
+        # PgBouncer не передает параметры подключения серверу, а SET
+        # на уровне сессии может достаться другому клиенту
+        event.listen(
+            engine.sync_engine,
+            "begin",
+            lambda conn: conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(statement_timeout_ms)}")
+        )
+
+    instrument(engine)
     return engine, async_sessionmaker(engine, expire_on_commit=False)
 
 
+class QueryCounter:
+    """
+    Количество запросов к БД и полученных строк
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: queries={self.queries}, rows={self.rows}>'
+
+
+_query_counter: ContextVar[QueryCounter | None] = ContextVar("query_counter", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Считает запросы к БД, выполненные внутри блока:
+
+        with count_queries() as counter:
+            ...
+        counter.queries, counter.rows
+
+    Счетчик хранится в контексте текущей задачи asyncio,
+    поэтому одновременные запросы считаются раздельно
+    """
+    counter = QueryCounter()
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _query_counter.get()
+    if counter is None:
+        return
+
+    counter.queries += 1
+    if cursor.description is not None and cursor.rowcount > 0:
+        counter.rows += cursor.rowcount
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """
+    Подключает к движку подсчет запросов (см. count_queries)
+    """
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
 Base = declarative_base()
@@ -1,7 +1,10 @@
+import logging
+
 from fastapi.requests import Request
 from fastapi.websockets import WebSocket
 
-from src.services.repository import RepoFactory
+from src.db import count_queries
+from src.services.repository import RepoFactory, UnitOfWork
 
 
 async def get_repos(request: Request = None, websocket: WebSocket = None) -> RepoFactory:
@@ -9,5 +12,14 @@ async def get_repos(request: Request = None, websocket: WebSocket = None) -> Rep
         app = request.app
     else:
         app = websocket.app
-    async with app.state.db_session() as session:
-        yield RepoFactory(session)
+
+    # Сессии открываются при первом обращении к репозиторию
+    uow = UnitOfWork(app.state.db_session, app.state.db_replica_session)
+    with count_queries() as counter:
+        try:
+            yield RepoFactory(uow)
+        finally:
+            await uow.release()
+
+    logging.debug(f"Сессий БД за запрос: {uow.session_count}, фиксаций транзакций: {uow.commit_count}")
+    logging.debug(f"Запросов к БД за запрос: {counter.queries}, получено строк: {counter.rows}")
@@ -17,4 +17,6 @@ async def get_services(
         repos,
         current_user=local_scope.get("user"),
         config=global_scope.config,
+        project_service=global_scope.project_service,
+        token_cache=global_scope.token_cache,
     )
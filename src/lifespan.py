@@ -5,31 +5,81 @@ from typing import Callable
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 
-from src.config import Config
+from src.config import Config, PostgresConfig
 
 from src.db import create_psql_async_session
+from src.services.auth import ReauthSessionCache
 from src.services.auth.scheduler import update_reauth_list
+from src.services.channels import ChannelManager
+from src.services.project import MembershipCache, UserProjectsCache, ProjectServiceClient
 
 
-async def init_db(app: FastAPI, config: Config):
+def create_db_session(config: Config, postgresql: PostgresConfig):
     engine, session = create_psql_async_session(
-        host=config.DB.POSTGRESQL.HOST,
-        port=config.DB.POSTGRESQL.PORT,
-        username=config.DB.POSTGRESQL.USERNAME,
-        password=config.DB.POSTGRESQL.PASSWORD,
-        database=config.DB.POSTGRESQL.DATABASE,
-        echo=config.DEBUG,
+        host=postgresql.HOST,
+        port=postgresql.PORT,
+        username=postgresql.USERNAME,
+        password=postgresql.PASSWORD,
+        database=postgresql.DATABASE,
+        echo=config.DB.ECHO,
+        pool_size=config.DB.POOL.SIZE,
+        max_overflow=config.DB.POOL.MAX_OVERFLOW,
+        pool_timeout=config.DB.POOL.TIMEOUT,
+        pool_recycle=config.DB.POOL.RECYCLE,
+        pool_pre_ping=config.DB.POOL.PRE_PING,
+        statement_cache_size=config.DB.STATEMENT_CACHE_SIZE,
+        pgbouncer=config.DB.PGBOUNCER,
+        statement_timeout_ms=config.DB.STATEMENT_TIMEOUT_MS,
+    )
+    logging.info(
+        f"БД {postgresql.HOST}:{postgresql.PORT}/{postgresql.DATABASE}: "
+        f"pool_size={config.DB.POOL.SIZE}, max_overflow={config.DB.POOL.MAX_OVERFLOW}, "
+        f"pool_timeout={config.DB.POOL.TIMEOUT}, pool_recycle={config.DB.POOL.RECYCLE}, "
+        f"pre_ping={config.DB.POOL.PRE_PING}, statement_cache_size={config.DB.STATEMENT_CACHE_SIZE}, "
+        f"pgbouncer={config.DB.PGBOUNCER}, statement_timeout_ms={config.DB.STATEMENT_TIMEOUT_MS}, "
+        f"echo={config.DB.ECHO}"
+    )
+    return engine, session
+
+
+async def init_db(app: FastAPI, config: Config):
+    app.state.db_engine, app.state.db_session = create_db_session(config, config.DB.POSTGRESQL)
+
+    app.state.db_replica_engine, app.state.db_replica_session = None, None
+    if config.DB.REPLICA:
+        logging.info("Чтения вне транзакций направляются в реплику")
+        app.state.db_replica_engine, app.state.db_replica_session = create_db_session(config, config.DB.REPLICA)
+
+
+async def init_grpc_channels(app: FastAPI, config: Config):
+    app.state.grpc_channels = ChannelManager(config)
+
+
+async def init_project_service(app: FastAPI, config: Config):
+    app.state.project_service = ProjectServiceClient(
+        app.state.grpc_channels.project_service,
+        membership_cache=MembershipCache(
+            maxsize=config.PROJECT_SERVICE_GRPC.MEMBERSHIP_CACHE_SIZE,
+            positive_ttl=config.PROJECT_SERVICE_GRPC.MEMBERSHIP_TTL,
+            negative_ttl=config.PROJECT_SERVICE_GRPC.MEMBERSHIP_NEGATIVE_TTL,
+        ),
+        user_projects_cache=UserProjectsCache(
+            maxsize=config.PROJECT_SERVICE_GRPC.MEMBERSHIP_CACHE_SIZE,
+            ttl=config.PROJECT_SERVICE_GRPC.MEMBERSHIP_TTL,
+        ),
     )
-    app.state.db_session = session
 
 
 async def init_reauth_checker(app: FastAPI, config: Config):
+    app.state.reauth_sessions = ReauthSessionCache()
+    await update_reauth_list(app, app.state.grpc_channels.ums)
+
     scheduler = AsyncIOScheduler()
     scheduler.add_job(
         update_reauth_list,
         'interval',
         seconds=5,
-        args=[app, (config.UMS_GRPC.HOST, config.UMS_GRPC.PORT)]
+        args=[app, app.state.grpc_channels.ums]
     )
     logging.getLogger('apscheduler.executors.default').setLevel(logging.WARNING)
     scheduler.start()
@@ -39,8 +89,8 @@ def create_start_app_handler(app: FastAPI, config: Config) -> Callable:
     async def start_app() -> None:
         logging.debug("Выполнение FastAPI startup event handler.")
         await init_db(app, config)
-
-        app.state.reauth_session_dict = dict()
+        await init_grpc_channels(app, config)
+        await init_project_service(app, config)
         await init_reauth_checker(app, config)
 
         logging.info("FastAPI Успешно запущен.")
@@ -51,5 +101,9 @@ def create_start_app_handler(app: FastAPI, config: Config) -> Callable:
 def create_stop_app_handler(app: FastAPI) -> Callable:
     async def stop_app() -> None:
         logging.debug("Выполнение FastAPI shutdown event handler.")
+        await app.state.grpc_channels.close()
+        await app.state.db_engine.dispose()
+        if app.state.db_replica_engine:
+            await app.state.db_replica_engine.dispose()
 
     return stop_app
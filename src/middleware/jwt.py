@@ -1,53 +1,50 @@
 from starlette.authentication import AuthCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Scope, Receive, Send
 
-from fastapi.requests import Request
+from src.config import Config
+from src.models.auth import AuthenticatedUser, UnauthenticatedUser, BaseUser
+from src.services.auth import JWTManager, VerifiedTokenCache
 
-from src.models.auth import AuthenticatedUser, UnauthenticatedUser
-from src.services.auth import JWTManager
 
+class JWTMiddleware:
+    """
+    ASGI middleware аутентификации по JWT из кук
 
-class JWTMiddlewareHTTP(BaseHTTPMiddleware):
+    Работает напрямую с scope, без обертки запроса и отдельной задачи на
+    каждый запрос, как BaseHTTPMiddleware. Один JWTManager создается при
+    старте, каждый токен проверяется и декодируется один раз, а с
+    token_cache - один раз за время жизни токена.
+    """
 
-    def __init__(self, app: ExceptionMiddleware):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, config: Config, token_cache: VerifiedTokenCache = None):
+        self.app = app
+        self._jwt = JWTManager(config=config, cache=token_cache)
 
-    async def dispatch(self, request: Request, call_next):
-        jwt = JWTManager(config=request.app.state.config)
-        reauth_session_dict = request.app.state.reauth_session_dict
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            scope["user"], scope["auth"] = self.authenticate(HTTPConnection(scope))
 
-        # States
-        session_id = request.cookies.get("session_id")
-        current_tokens = jwt.get_jwt_cookie(request)
-        is_valid_session = False
+        await self.app(scope, receive, send)
 
-        # ----- pre_process -----
-        is_valid_access_token = jwt.is_valid_access_token(current_tokens.access_token)
-        is_valid_refresh_token = jwt.is_valid_refresh_token(current_tokens.refresh_token)
+    def authenticate(self, conn: HTTPConnection) -> tuple[BaseUser, AuthCredentials]:
+        session_id = conn.cookies.get("session_id")
+        current_tokens = self._jwt.get_jwt_cookie(conn)
 
-        if session_id and current_tokens.refresh_token:
+        if not (session_id and current_tokens.refresh_token):
+            return UnauthenticatedUser(), AuthCredentials()
 
-            # Если требуется обновить данные пользователя, то запрещаем
-            # авторизацию по старому refresh токену, из-за чего пользователю
-            # придется обновить токены или дождаться истечения access токена
+        # Если требуется обновить данные пользователя, то запрещаем
+        # авторизацию по старому refresh токену, из-за чего пользователю
+        # придется обновить токены или дождаться истечения access токена
 
-            bad_ref_token = reauth_session_dict.get(session_id)
-            is_valid_session = (bad_ref_token != current_tokens.refresh_token)
+        bad_ref_token = conn.app.state.reauth_sessions.get(session_id)
+        if bad_ref_token == current_tokens.refresh_token:
+            self._jwt.invalidate_tokens(current_tokens)
+            return UnauthenticatedUser(), AuthCredentials()
 
-        is_auth = (is_valid_access_token and is_valid_refresh_token and is_valid_session)
+        payload = self._jwt.verify_access_token(current_tokens.access_token)
+        if payload is None or self._jwt.verify_refresh_token(current_tokens.refresh_token) is None:
+            return UnauthenticatedUser(), AuthCredentials()
 
-        # Установка данных авторизации
-        if is_auth:
-            payload = jwt.decode_access_token(current_tokens.access_token)
-            request.scope["user"] = AuthenticatedUser(**payload.model_dump())
-            request.scope["auth"] = AuthCredentials(["authenticated"])
-        else:
-            request.scope["user"] = UnauthenticatedUser()
-            request.scope["auth"] = AuthCredentials()
-
-        response = await call_next(request)
-
-        # ----- post_process -----
-
-        return response
+        return AuthenticatedUser(**payload.model_dump()), AuthCredentials(["authenticated"])
@@ -1,3 +1,4 @@
 from . import schemas
 from . import tables
 from . import state
+from . import records
@@ -0,0 +1,85 @@
+"""
+Компактные модели ответов для быстрого пути сериализации
+
+Записи заполняются напрямую из строк запроса без валидации и
+сериализуются в JSON целиком (см. src.utils.serialization). Поля и их
+порядок совпадают со схемами src.models.schemas, поэтому ответы обоих
+путей одинаковы.
+"""
+import uuid
+from dataclasses import dataclass, fields
+from datetime import datetime
+from functools import cache
+from typing import Any, Mapping
+
+
+@dataclass(slots=True)
+class Tag:
+    id: uuid.UUID
+    title: str
+
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class Task:
+    id: uuid.UUID
+    title: str
+    color: str
+    content: str | None
+    story_point: int
+    start_time: datetime | None
+    end_time: datetime | None
+    executor_id: uuid.UUID | None
+    column_id: uuid.UUID
+    child_id: uuid.UUID | None
+    tags: list[Tag] | None
+
+    created_at: datetime
+    updated_at: datetime | None
+
+
+@dataclass(slots=True)
+class Column:
+    id: uuid.UUID
+    title: str
+    child_id: uuid.UUID | None
+    tasks: list[Task] | None
+    wip_limit: int | None
+
+    created_at: datetime
+    updated_at: datetime | None
+
+
+@dataclass(slots=True)
+class ColumnPreview(Column):
+    task_count: int
+    next_cursor: str | None = None
+
+
+@dataclass(slots=True)
+class TaskPage:
+    tasks: list[Task]
+    next_cursor: str | None = None
+
+
+@cache
+def _field_names(record_type: type) -> tuple[str, ...]:
+    return tuple(field.name for field in fields(record_type))
+
+
+def from_row(record_type: type, row: Mapping[str, Any], prefix: str = "", **values):
+    """
+    Запись из строки запроса
+
+    :param record_type: класс записи
+    :param row: строка (row._asdict()), лишние поля игнорируются
+    :param prefix: префикс полей записи в строке
+    :param values: значения, которых нет в строке (вложенные записи)
+    :return:
+    """
+    for name in _field_names(record_type):
+        if name not in values:
+            values[name] = row.get(prefix + name)
+    return record_type(**values)
+
@@ -5,12 +5,16 @@ from .error import Error
 from .error import FieldErrorItem
 
 from .column import Column
+from .column import ColumnPreview
 from .column import ColumnCreate
 from .column import ColumnUpdate
+from .column import ColumnMove
 
 from .task import Task
+from .task import TaskPage
 from .task import TaskCreate
 from .task import TaskUpdate
+from .task import TaskMove
 from .task import TaskCountStat
 
 from .tag import Tag
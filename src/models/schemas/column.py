@@ -20,6 +20,11 @@ class Column(BaseModel):
         from_attributes = True
 
 
+class ColumnPreview(Column):
+    task_count: int
+    next_cursor: str | None = None
+
+
 class ColumnCreate(BaseModel):
     title: str
     wip_limit: int | None = None
@@ -47,3 +52,10 @@ class ColumnUpdate(BaseModel):
         if value and len(value) > 64:
             raise ValueError("Название не может содержать больше 64 символов")
         return value
+
+
+class ColumnMove(BaseModel):
+    child_id: uuid.UUID | None = None
+
+    class Config:
+        extra = 'ignore'
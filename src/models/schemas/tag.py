@@ -31,5 +31,6 @@ class TagCreate(BaseModel):
 
 
 class TagStat(BaseModel):
+    id: uuid.UUID
     title: str
     count: int
@@ -10,7 +10,7 @@ class Task(BaseModel):
     id: uuid.UUID
     title: str
     color: str
-    content: str | None
+    content: str | None = None
     story_point: int
     start_time: datetime | None
     end_time: datetime | None
@@ -26,6 +26,11 @@ class Task(BaseModel):
         from_attributes = True
 
 
+class TaskPage(BaseModel):
+    tasks: list[Task]
+    next_cursor: str | None = None
+
+
 class TaskCreate(BaseModel):
     title: str
     color: str = "#8DA2DB"
@@ -128,6 +133,16 @@ class TaskUpdate(BaseModel):
         return value
 
 
+class TaskMove(BaseModel):
+    column_id: uuid.UUID | None = None
+    child_id: uuid.UUID | None = None
+
+    class Config:
+        extra = 'ignore'
+
+
 class TaskCountStat(BaseModel):
     status: str
     count: int
+    story_point: int = 0
+    column_id: uuid.UUID | None = None
@@ -10,3 +10,16 @@ class UserState(int, Enum):
 
 class NotificationType(int, Enum):
     INFO = 1
+
+
+class TaskStatus(str, Enum):
+    ALL = "all"
+    ACTIVE = "active"
+    DONE = "done"
+
+
+class TaskInclude(str, Enum):
+    """
+    Отложенные поля задачи, загружаемые в списках только по запросу (?include=)
+    """
+    CONTENT = "content"
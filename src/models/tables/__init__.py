@@ -3,4 +3,6 @@ from src.db import Base
 from .column import Column
 from .task import Task
 from .task import TaskTag
+from .task import TaskContent
 from .tag import Tag
+from .board import BoardVersion
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, UUID, BIGINT, DateTime, func
+
+from src.db import Base
+
+
+class BoardVersion(Base):
+    """
+    Версия доски проекта, увеличивается при каждом изменении колонок, задач и тегов
+
+    """
+    __tablename__ = "board_versions"
+
+    project_id = Column(UUID(as_uuid=True), primary_key=True)
+    version = Column(BIGINT, nullable=False, server_default="0")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: {self.project_id}>'
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import UUID, VARCHAR, DateTime, func, INT
+from sqlalchemy import UUID, VARCHAR, DateTime, func, INT, Index
 from sqlalchemy import Column as SAColumn
 from sqlalchemy.orm import relationship
 
@@ -12,13 +12,24 @@ class Column(Base):
     The Column model
     """
     __tablename__ = "columns"
+    __table_args__ = (
+        Index("ix_columns_project_id_position", "project_id", "position"),
+        Index("ix_columns_child_id", "child_id"),
+    )
 
     id = SAColumn(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = SAColumn(VARCHAR(64), nullable=False)
     project_id = SAColumn(UUID(as_uuid=True), nullable=False)
-    tasks = relationship("models.tables.task.Task", back_populates="column")
+    tasks = relationship(
+        "models.tables.task.Task",
+        back_populates="column",
+        order_by="models.tables.task.Task.position"
+    )
     wip_limit = SAColumn(INT, nullable=True)
     child_id = SAColumn(UUID(as_uuid=True), nullable=True)
+    position = SAColumn(VARCHAR(128, collation="C"), nullable=False)
+    # Увеличивается при перебалансировке ключей позиций задач колонки
+    task_position_version = SAColumn(INT, nullable=False, default=0, server_default="0")
 
     created_at = SAColumn(DateTime(timezone=True), server_default=func.now())
     updated_at = SAColumn(DateTime(timezone=True), onupdate=func.now())
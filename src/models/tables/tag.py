@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, UUID, VARCHAR, DateTime, func
+from sqlalchemy import Column, UUID, VARCHAR, DateTime, func, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from src.db import Base
@@ -12,6 +12,9 @@ class Tag(Base):
 
     """
     __tablename__ = "tags"
+    __table_args__ = (
+        UniqueConstraint("project_id", "title", name="uq_tags_project_id_title"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(VARCHAR(32), nullable=False)
@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import UUID, VARCHAR, DateTime, func, ForeignKey, INT
+from sqlalchemy import UUID, VARCHAR, DateTime, func, ForeignKey, INT, Index, UniqueConstraint, BOOLEAN, false
+from sqlalchemy.dialects.postgresql import BYTEA
 from sqlalchemy import Column as SAColumn
 from sqlalchemy.orm import relationship
 
@@ -12,10 +13,13 @@ class Task(Base):
     The Task model
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_column_id_position", "column_id", "position"),
+        Index("ix_tasks_child_id", "child_id"),
+    )
 
     id = SAColumn(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = SAColumn(VARCHAR(64), nullable=False)
-    content = SAColumn(VARCHAR(10000), nullable=True)
     color = SAColumn(VARCHAR(7), nullable=False)
     story_point = SAColumn(INT, nullable=False)
     start_time = SAColumn(DateTime(timezone=True), nullable=True)
@@ -25,6 +29,7 @@ class Task(Base):
     column = relationship("models.tables.column.Column", back_populates="tasks")
     tags = relationship('models.tables.tag.Tag', secondary='task_tags', back_populates='tasks')
     child_id = SAColumn(UUID(as_uuid=True), nullable=True)
+    position = SAColumn(VARCHAR(128, collation="C"), nullable=False)
 
     created_at = SAColumn(DateTime(timezone=True), server_default=func.now())
     updated_at = SAColumn(DateTime(timezone=True), onupdate=func.now())
@@ -33,11 +38,30 @@ class Task(Base):
         return f'<{self.__class__.__name__}: {self.id}>'
 
 
+class TaskContent(Base):
+    """
+    Task content, stored apart from the task and read only on demand
+    Long content is compressed (see src.utils.compression)
+    """
+    __tablename__ = "task_contents"
+
+    task_id = SAColumn(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    data = SAColumn(BYTEA, nullable=False)
+    compressed = SAColumn(BOOLEAN, nullable=False, server_default=false())
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__}: {self.task_id}>'
+
+
 class TaskTag(Base):
     """
     Many-to-many table for Task and Tag
     """
     __tablename__ = "task_tags"
+    __table_args__ = (
+        UniqueConstraint("task_id", "tag_id", name="uq_task_tags_task_id_tag_id"),
+        Index("ix_task_tags_tag_id", "tag_id"),
+    )
 
     id = SAColumn(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     task_id = SAColumn(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
@@ -1,6 +1,7 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Optional as _Optional
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -18,6 +19,18 @@ class IsUserInProjectReply(_message.Message):
     result: bool
     def __init__(self, result: bool = ...) -> None: ...
 
+class UserProjectsRequest(_message.Message):
+    __slots__ = ["user_id"]
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    def __init__(self, user_id: _Optional[str] = ...) -> None: ...
+
+class UserProjectsReply(_message.Message):
+    __slots__ = ["project_ids"]
+    PROJECT_IDS_FIELD_NUMBER: _ClassVar[int]
+    project_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, project_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class CreateNotificationRequest(_message.Message):
     __slots__ = ["owner_id", "type_id", "content_id", "content"]
     OWNER_ID_FIELD_NUMBER: _ClassVar[int]
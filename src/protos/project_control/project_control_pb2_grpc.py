@@ -19,6 +19,11 @@ class ProjectServiceStub(object):
                 request_serializer=project__control__pb2.ProjectRequest.SerializeToString,
                 response_deserializer=project__control__pb2.IsUserInProjectReply.FromString,
                 )
+        self.GetUserProjects = channel.unary_unary(
+                '/greet.ProjectService/GetUserProjects',
+                request_serializer=project__control__pb2.UserProjectsRequest.SerializeToString,
+                response_deserializer=project__control__pb2.UserProjectsReply.FromString,
+                )
         self.SendNotification = channel.unary_unary(
                 '/greet.ProjectService/SendNotification',
                 request_serializer=project__control__pb2.CreateNotificationRequest.SerializeToString,
@@ -36,6 +41,12 @@ class ProjectServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUserProjects(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SendNotification(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -50,6 +61,11 @@ def add_ProjectServiceServicer_to_server(servicer, server):
                     request_deserializer=project__control__pb2.ProjectRequest.FromString,
                     response_serializer=project__control__pb2.IsUserInProjectReply.SerializeToString,
             ),
+            'GetUserProjects': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUserProjects,
+                    request_deserializer=project__control__pb2.UserProjectsRequest.FromString,
+                    response_serializer=project__control__pb2.UserProjectsReply.SerializeToString,
+            ),
             'SendNotification': grpc.unary_unary_rpc_method_handler(
                     servicer.SendNotification,
                     request_deserializer=project__control__pb2.CreateNotificationRequest.FromString,
@@ -82,6 +98,23 @@ class ProjectService(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetUserProjects(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/greet.ProjectService/GetUserProjects',
+            project__control__pb2.UserProjectsRequest.SerializeToString,
+            project__control__pb2.UserProjectsReply.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def SendNotification(request,
             target,
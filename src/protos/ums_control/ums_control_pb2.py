@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: project_control.proto
+# source: ums_control.proto
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
@@ -13,13 +13,12 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11ums_control.proto\x12\x05greet\"\x10\n\x0eGetListRequest\"(\n\nDictionary\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"3\n\x0fListOfDictReply\x12 \n\x05\x64icts\x18\x01 \x03(\x0b\x32\x11.greet.Dictionary2R\n\x0eUserManagement\x12@\n\x0fGetListOfReauth\x12\x15.greet.GetListRequest\x1a\x16.greet.ListOfDictReplyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11ums_control.proto\x12\x05greet\"\x10\n\x0eGetListRequest\"(\n\nDictionary\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"3\n\x0fListOfDictReply\x12 \n\x05\x64icts\x18\x01 \x03(\x0b\x32\x11.greet.Dictionary\"%\n\x12ReauthDeltaRequest\x12\x0f\n\x07version\x18\x01 \x01(\x03\"f\n\x10ReauthDeltaReply\x12\x0f\n\x07version\x18\x01 \x01(\x03\x12\x0c\n\x04\x66ull\x18\x02 \x01(\x08\x12\"\n\x07upserts\x18\x03 \x03(\x0b\x32\x11.greet.Dictionary\x12\x0f\n\x07removed\x18\x04 \x03(\t2\x98\x01\n\x0eUserManagement\x12@\n\x0fGetListOfReauth\x12\x15.greet.GetListRequest\x1a\x16.greet.ListOfDictReply\x12\x44\n\x0eGetReauthDelta\x12\x19.greet.ReauthDeltaRequest\x1a\x17.greet.ReauthDeltaReplyb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ums_control_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
-
   DESCRIPTOR._options = None
   _globals['_GETLISTREQUEST']._serialized_start=28
   _globals['_GETLISTREQUEST']._serialized_end=44
@@ -27,6 +26,10 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_DICTIONARY']._serialized_end=86
   _globals['_LISTOFDICTREPLY']._serialized_start=88
   _globals['_LISTOFDICTREPLY']._serialized_end=139
-  _globals['_USERMANAGEMENT']._serialized_start=141
-  _globals['_USERMANAGEMENT']._serialized_end=223
+  _globals['_REAUTHDELTAREQUEST']._serialized_start=141
+  _globals['_REAUTHDELTAREQUEST']._serialized_end=178
+  _globals['_REAUTHDELTAREPLY']._serialized_start=180
+  _globals['_REAUTHDELTAREPLY']._serialized_end=282
+  _globals['_USERMANAGEMENT']._serialized_start=285
+  _globals['_USERMANAGEMENT']._serialized_end=437
 # @@protoc_insertion_point(module_scope)
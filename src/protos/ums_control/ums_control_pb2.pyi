@@ -22,3 +22,21 @@ class ListOfDictReply(_message.Message):
     DICTS_FIELD_NUMBER: _ClassVar[int]
     dicts: _containers.RepeatedCompositeFieldContainer[Dictionary]
     def __init__(self, dicts: _Optional[_Iterable[_Union[Dictionary, _Mapping]]] = ...) -> None: ...
+
+class ReauthDeltaRequest(_message.Message):
+    __slots__ = ["version"]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    version: int
+    def __init__(self, version: _Optional[int] = ...) -> None: ...
+
+class ReauthDeltaReply(_message.Message):
+    __slots__ = ["version", "full", "upserts", "removed"]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    FULL_FIELD_NUMBER: _ClassVar[int]
+    UPSERTS_FIELD_NUMBER: _ClassVar[int]
+    REMOVED_FIELD_NUMBER: _ClassVar[int]
+    version: int
+    full: bool
+    upserts: _containers.RepeatedCompositeFieldContainer[Dictionary]
+    removed: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, version: _Optional[int] = ..., full: bool = ..., upserts: _Optional[_Iterable[_Union[Dictionary, _Mapping]]] = ..., removed: _Optional[_Iterable[str]] = ...) -> None: ...
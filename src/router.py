@@ -4,11 +4,13 @@ from src.controllers import stats
 from src.controllers import task
 from src.controllers import column
 from src.controllers import permission
+from src.controllers import board
 
 
 def register_api_router(is_debug: bool) -> APIRouter:
     root_api_router = APIRouter(prefix="/api/v1" if is_debug else "")
 
+    root_api_router.include_router(board.router, prefix="/board", tags=["Board"])
     root_api_router.include_router(column.router, prefix="/column", tags=["Column"])
     root_api_router.include_router(task.router, prefix="/task", tags=["Task"])
     root_api_router.include_router(permission.router, prefix="/permission", tags=["Permission"])
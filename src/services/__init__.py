@@ -1,10 +1,13 @@
+import uuid
+
 from src.models.auth import BaseUser
 from . import auth
 from . import repository
 from .kanban import KanbanApplicationService
 from .permission import PermissionApplicationService
-from .project import is_user_in_project
+from .project import ProjectServiceClient
 from .stats import StatsApplicationService
+from .auth import VerifiedTokenCache
 from ..config import Config
 
 
@@ -15,10 +18,21 @@ class ServiceFactory:
             *,
             current_user: BaseUser,
             config: Config,
+            project_service: ProjectServiceClient,
+            token_cache: VerifiedTokenCache = None,
     ):
         self._repo = repo_factory
         self._current_user = current_user
         self._config = config
+        self._project_service = project_service
+        self._token_cache = token_cache
+
+    async def _is_user_in_project(self, project_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        return await self._project_service.is_user_in_project(
+            project_id,
+            user_id,
+            exp=self._current_user.access_exp,
+        )
 
     @property
     def kanban(self) -> KanbanApplicationService:
@@ -27,14 +41,9 @@ class ServiceFactory:
             column_repo=self._repo.column,
             task_repo=self._repo.task,
             tag_repo=self._repo.tag,
-            is_user_in_project=lambda project_id, user_id: is_user_in_project(
-                project_id=project_id,
-                user_id=user_id,
-                project_service_conn=(
-                    self._config.PROJECT_SERVICE_GRPC.HOST,
-                    self._config.PROJECT_SERVICE_GRPC.PORT,
-                ),
-            ),
+            board_version_repo=self._repo.board_version,
+            uow=self._repo.uow,
+            is_user_in_project=self._is_user_in_project,
         )
 
     @property
@@ -42,16 +51,12 @@ class ServiceFactory:
         return StatsApplicationService(
             current_user=self._current_user,
             config=self._config,
+            project_service=self._project_service,
+            token_cache=self._token_cache,
             tag_repo=self._repo.tag,
             task_repo=self._repo.task,
-            is_user_in_project=lambda project_id, user_id: is_user_in_project(
-                project_id=project_id,
-                user_id=user_id,
-                project_service_conn=(
-                    self._config.PROJECT_SERVICE_GRPC.HOST,
-                    self._config.PROJECT_SERVICE_GRPC.PORT,
-                ),
-            ),
+            uow=self._repo.uow,
+            is_user_in_project=self._is_user_in_project,
         )
 
     @property
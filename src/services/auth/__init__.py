@@ -1,2 +1,4 @@
 from .filters import permission_filter, state_filter
 from .jwt import JWTManager
+from .jwt import VerifiedTokenCache
+from .reauth import ReauthSessionCache
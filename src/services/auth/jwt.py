@@ -1,11 +1,47 @@
+import hashlib
 import time
 
 import jwt
-from fastapi import Request
 from pydantic import ValidationError
+from starlette.requests import HTTPConnection
 
 from src.config import Config
 from src.models import schemas
+from src.utils.cache import TTLCache
+
+
+class VerifiedTokenCache:
+    """
+    LRU кэш проверенных токенов
+
+    Ключ - SHA-256 от секретного ключа и токена, поэтому сами токены в
+    памяти не хранятся, а при смене секрета старые записи не находятся.
+    Запись живет до истечения токена (exp). Невалидные токены не кэшируются.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self._cache = TTLCache(maxsize)
+
+    @staticmethod
+    def _key(token: str, secret_key: str) -> bytes:
+        return hashlib.sha256(f"{secret_key}.{token}".encode()).digest()
+
+    def get(self, token: str, secret_key: str) -> schemas.TokenPayload | None:
+        payload = self._cache.get(self._key(token, secret_key))
+        if payload is not None and payload.exp > time.time():
+            return payload
+        return None
+
+    def set(self, token: str, secret_key: str, payload: schemas.TokenPayload) -> None:
+        ttl = payload.exp - time.time()
+        if ttl > 0:
+            self._cache.set(self._key(token, secret_key), payload, ttl=ttl)
+
+    def invalidate(self, token: str, secret_key: str) -> None:
+        self._cache.pop(self._key(token, secret_key))
+
+    def stats(self) -> dict:
+        return self._cache.stats()
 
 
 class JWTManager:
@@ -16,8 +52,9 @@ class JWTManager:
     COOKIE_ACCESS_KEY = "access_token"
     COOKIE_REFRESH_KEY = "refresh_token"
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cache: VerifiedTokenCache = None):
         self._config = config
+        self._cache = cache
 
         self.JWT_ACCESS_SECRET_KEY = config.JWT.ACCESS_SECRET_KEY
         self.JWT_REFRESH_SECRET_KEY = config.JWT.REFRESH_SECRET_KEY
@@ -44,6 +81,42 @@ class JWTManager:
 
         return self._is_valid_jwt(token, self.JWT_ACCESS_SECRET_KEY)
 
+    def verify_access_token(self, token: str | None) -> schemas.TokenPayload | None:
+        """
+        Проверяет и декодирует access-токен за одно декодирование
+        :param token:
+        :return: payload или None, если токен невалиден
+        """
+        if not token:
+            return None
+
+        return self._verify_jwt(token, self.JWT_ACCESS_SECRET_KEY)
+
+    def verify_refresh_token(self, token: str | None) -> schemas.TokenPayload | None:
+        """
+        Проверяет и декодирует refresh-токен за одно декодирование
+        :param token:
+        :return: payload или None, если токен невалиден
+        """
+        if not token:
+            return None
+
+        return self._verify_jwt(token, self.JWT_REFRESH_SECRET_KEY)
+
+    def invalidate_tokens(self, tokens: schemas.Tokens) -> None:
+        """
+        Удаляет токены из кэша проверенных токенов
+        :param tokens:
+        :return:
+        """
+        if self._cache is None:
+            return
+
+        if tokens.access_token:
+            self._cache.invalidate(tokens.access_token, self.JWT_ACCESS_SECRET_KEY)
+        if tokens.refresh_token:
+            self._cache.invalidate(tokens.refresh_token, self.JWT_REFRESH_SECRET_KEY)
+
     def decode_access_token(self, token: str) -> schemas.TokenPayload:
         """
         Декодирует access-токен (получает payload)
@@ -60,7 +133,7 @@ class JWTManager:
         """
         return self._decode_jwt(token, self.JWT_REFRESH_SECRET_KEY)
 
-    def get_jwt_cookie(self, req_obj: Request) -> schemas.Tokens:
+    def get_jwt_cookie(self, req_obj: HTTPConnection) -> schemas.Tokens:
         """
         Получает из кук access и refresh-токены
         :param req_obj:
@@ -71,17 +144,34 @@ class JWTManager:
         return schemas.Tokens(access_token=access_token, refresh_token=refresh_token)
 
     def _is_valid_jwt(self, token: str, secret_key: str) -> bool:
+        return self._verify_jwt(token, secret_key) is not None
+
+    def _verify_jwt(self, token: str, secret_key: str) -> schemas.TokenPayload | None:
+        """
+        param: token: токен
+        param: secret_key: секретный ключ
+        :return: payload или None, если подпись, срок действия или payload невалидны
+        """
+        if self._cache is not None:
+            payload = self._cache.get(token, secret_key)
+            if payload is not None:
+                return payload
+
         try:
-            data = jwt.decode(token, secret_key, algorithms=self.ALGORITHM)
-            schemas.TokenPayload.model_validate(data)
+            payload = schemas.TokenPayload.model_validate(
+                jwt.decode(token, secret_key, algorithms=self.ALGORITHM)
+            )
         except (
                 jwt.exceptions.InvalidTokenError,
                 jwt.exceptions.ExpiredSignatureError,
                 jwt.exceptions.DecodeError,
                 ValidationError
         ):
-            return False
-        return True
+            return None
+
+        if self._cache is not None:
+            self._cache.set(token, secret_key, payload)
+        return payload
 
     def _generate_token(self, exp: int, secret_key: str, **kwargs) -> str:
         """
@@ -0,0 +1,83 @@
+import logging
+import time
+
+import grpc
+from src.protos.ums_control import ums_control_pb2
+from src.protos.ums_control import ums_control_pb2_grpc
+
+
+class ReauthSessionCache:
+    """
+    Сессии, требующие повторной авторизации (session_id -> устаревший refresh токен)
+
+    Синхронизируется с UMS дельтами по версии (GetReauthDelta). Новое
+    состояние собирается отдельно и подменяется одним присваиванием, поэтому
+    читатели всегда видят полный список, а при ошибке синхронизации остается
+    предыдущий. Если UMS не поддерживает GetReauthDelta, загружается
+    полный список (GetListOfReauth).
+    """
+
+    UNSUPPORTED_RETRY_INTERVAL = 300
+
+    def __init__(self):
+        self._sessions: dict[str, str] = dict()
+        self._version = 0
+        self._delta_unsupported_until = 0.0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, session_id: str) -> str | None:
+        """
+        :param session_id:
+        :return: устаревший refresh токен сессии или None
+        """
+        return self._sessions.get(session_id)
+
+    def apply(self, reply: ums_control_pb2.ReauthDeltaReply) -> None:
+        """
+        Применяет ответ GetReauthDelta
+
+        :param reply:
+        :return:
+        """
+        if reply.full:
+            self._sessions = {d.key: d.value for d in reply.upserts}
+        elif reply.upserts or reply.removed:
+            sessions = dict(self._sessions)
+            sessions.update((d.key, d.value) for d in reply.upserts)
+            for session_id in reply.removed:
+                sessions.pop(session_id, None)
+            self._sessions = sessions
+
+        self._version = reply.version
+
+    def replace(self, sessions: dict[str, str]) -> None:
+        self._sessions = sessions
+        self._version = 0
+
+    async def sync(self, channel: grpc.aio.Channel) -> None:
+        """
+        Загружает изменения списка из UMS
+
+        :param channel: канал к UMS
+        :raises grpc.RpcError: ошибка запроса, состояние не меняется
+        """
+        stub = ums_control_pb2_grpc.UserManagementStub(channel)
+
+        if self._delta_unsupported_until <= time.monotonic():
+            try:
+                self.apply(await stub.GetReauthDelta(ums_control_pb2.ReauthDeltaRequest(version=self._version)))
+                return
+            except grpc.aio.AioRpcError as error:
+                if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                logging.warning("UMS не поддерживает GetReauthDelta, используется GetListOfReauth")
+                self._delta_unsupported_until = time.monotonic() + self.UNSUPPORTED_RETRY_INTERVAL
+
+        response = await stub.GetListOfReauth(ums_control_pb2.GetListRequest())
+        self.replace({d.key: d.value for d in response.dicts})
+
+    def __len__(self) -> int:
+        return len(self._sessions)
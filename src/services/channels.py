@@ -0,0 +1,70 @@
+import asyncio
+import itertools
+import logging
+
+import grpc
+
+from src.config import Config, UMSGRPC, ProjectServiceGRPC
+
+
+class ChannelPool:
+    """
+    Пул долгоживущих gRPC каналов к одному сервису
+
+    Каналы мультиплексируют вызовы поверх HTTP/2, поэтому один канал
+    обслуживает много одновременных запросов. Несколько каналов с локальными
+    пулами подключений распределяют нагрузку по разным TCP соединениям.
+    """
+
+    def __init__(
+            self,
+            target: str,
+            *,
+            size: int = 1,
+            keepalive_time_ms: int = 30000,
+            keepalive_timeout_ms: int = 10000,
+    ):
+        options = [
+            ("grpc.keepalive_time_ms", keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+        ]
+        if size > 1:
+            options.append(("grpc.use_local_subchannel_pool", 1))
+
+        self._target = target
+        self._channels = [grpc.aio.insecure_channel(target, options=options) for _ in range(max(size, 1))]
+        self._counter = itertools.count()
+
+    @classmethod
+    def from_config(cls, config: UMSGRPC | ProjectServiceGRPC) -> "ChannelPool":
+        return cls(
+            f"{config.HOST}:{config.PORT}",
+            size=config.POOL_SIZE,
+            keepalive_time_ms=config.KEEPALIVE_TIME_MS,
+            keepalive_timeout_ms=config.KEEPALIVE_TIMEOUT_MS,
+        )
+
+    def get(self) -> grpc.aio.Channel:
+        """
+        Возвращает канал пула (round-robin)
+        """
+        return self._channels[next(self._counter) % len(self._channels)]
+
+    async def close(self) -> None:
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+        logging.debug(f"gRPC каналы к {self._target} закрыты")
+
+
+class ChannelManager:
+    """
+    gRPC каналы приложения, создаются при старте и закрываются при остановке
+    """
+
+    def __init__(self, config: Config):
+        self.project_service = ChannelPool.from_config(config.PROJECT_SERVICE_GRPC)
+        self.ums = ChannelPool.from_config(config.UMS_GRPC)
+
+    async def close(self) -> None:
+        await asyncio.gather(self.project_service.close(), self.ums.close())
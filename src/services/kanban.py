@@ -1,15 +1,168 @@
 import uuid
-from typing import Callable, Coroutine, Any
+from functools import partial
+from typing import Callable, Collection, Coroutine, Any
 
 from src import exceptions
-from src.models import schemas
+from src.models import schemas, records
 from src.models.auth import BaseUser
 from src.models.permission import Permission
 from src.models.state import UserState
 from src.services.auth.filters import permission_filter
 from src.services.auth.filters import state_filter
 from src.services.repository import ColumnRepo, TagRepo
-from src.services.repository import TaskRepo
+from src.services.repository import TaskRepo, TaskProjection, BoardVersionRepo
+from src.services.repository.task import TAG_ARRAYS
+from src.services.repository import UnitOfWork, transaction, read_only
+from src.utils.compression import decompress_text
+from src.utils.cursor import encode_cursor, decode_cursor
+
+
+def _prefixed(row: dict, prefix: str) -> dict:
+    return {key[len(prefix):]: value for key, value in row.items() if key.startswith(prefix)}
+
+
+TASK_FIELDS = tuple(schemas.Task.model_fields)
+
+
+def _board_from_rows(
+        rows,
+        preview: bool = False,
+        task_from_row: Callable[[dict], records.Task | dict] = None
+) -> list[records.Column]:
+    """
+    Колонки доски из строк get_board / get_preview
+
+    :param rows:
+    :param preview: строки get_preview (колонки records.ColumnPreview)
+    :param task_from_row: построение задачи из строки (по умолчанию _task_from_row)
+    :return:
+    """
+    task_from_row = task_from_row or _task_from_row
+    column_type = records.ColumnPreview if preview else records.Column
+    columns = []
+    for row in rows:
+        row = row._asdict()
+        if not columns or columns[-1].id != row["column_id"]:
+            columns.append(records.from_row(column_type, row, "column_", tasks=[]))
+
+        if row["task_id"] is None:
+            continue
+
+        columns[-1].tasks.append(task_from_row(row))
+
+        # Курсор продолжения превью указывает на последнюю выбранную задачу
+        if preview:
+            columns[-1].next_cursor = encode_cursor(
+                row["task_position"], row["task_id"], row["column_task_position_version"]
+            )
+
+    if preview:
+        for column in columns:
+            if len(column.tasks) >= column.task_count:
+                column.next_cursor = None
+    return columns
+
+
+def _task_from_row(row: dict) -> records.Task:
+    """
+    Задача из строки с полями task_* и tag_* (содержание - task_content_*,
+    без них content не загружается)
+
+    :param row:
+    :return:
+    """
+    content = decompress_text(row.get("task_content_data"), row.get("task_content_compressed"))
+    tags = [
+        records.Tag(id=tag_id, title=title, created_at=created_at)
+        for tag_id, title, created_at in zip(
+            row["tag_ids"] or [], row["tag_titles"] or [], row["tag_created_ats"] or []
+        )
+    ]
+    return records.from_row(records.Task, row, "task_", tags=tags, content=content)
+
+
+def _expand_fields(names: Collection[str]) -> set[str]:
+    """
+    Проверяет имена полей задачи, tags раскрывается в tags.id, tags.title, tags.created_at
+
+    :param names:
+    :return:
+    """
+    expanded = set()
+    for name in names:
+        if name == "tags":
+            expanded.update(f"tags.{field}" for field in TAG_ARRAYS)
+        elif name in TASK_FIELDS or name.removeprefix("tags.") in TAG_ARRAYS:
+            expanded.add(name)
+        else:
+            raise exceptions.BadRequest(f"Неизвестное поле задачи: {name!r}")
+    return expanded
+
+
+def _task_projection(
+        fields: Collection[str] | None,
+        exclude: Collection[str] | None,
+        include_content: bool
+) -> TaskProjection:
+    """
+    Поля задачи, которые нужно выбрать из БД
+
+    :param fields: выбрать только эти поля (None - все, пустой список - ошибка)
+    :param exclude: исключить поля
+    :param include_content: загрузить содержание, если оно не исключено
+    :return:
+    """
+    if fields is not None and not fields:
+        raise exceptions.BadRequest("Не указаны поля задачи")
+
+    names = _expand_fields(TASK_FIELDS if fields is None else fields) - _expand_fields(exclude or ())
+    return TaskProjection(
+        columns=frozenset(name for name in names if name in TaskProjection().columns),
+        tags=tuple(field for field in TAG_ARRAYS if f"tags.{field}" in names),
+        content="content" in names and (include_content or "content" in (fields or ())),
+    )
+
+
+def _task_reader(
+        fields: Collection[str] | None,
+        exclude: Collection[str] | None,
+        include_content: bool
+) -> tuple[TaskProjection, Callable[[dict], records.Task | dict]]:
+    """
+    Проекция задач и построение задачи из строки: без fields и exclude -
+    records.Task, иначе словарь только с выбранными полями
+
+    :param fields:
+    :param exclude:
+    :param include_content:
+    :return:
+    """
+    projection = _task_projection(fields, exclude, include_content)
+    if fields is None and exclude is None:
+        return projection, _task_from_row
+    return projection, partial(_sparse_task_from_row, projection=projection)
+
+
+def _sparse_task_from_row(row: dict, projection: TaskProjection) -> dict:
+    """
+    Задача из строки только с полями projection (id - всегда)
+
+    :param row:
+    :param projection:
+    :return:
+    """
+    task = {}
+    for name in TASK_FIELDS:
+        if name == "id" or name in projection.columns:
+            task[name] = row[f"task_{name}"]
+        elif name == "tags" and projection.tags:
+            task[name] = [
+                dict(zip(projection.tags, values))
+                for values in zip(*(row[TAG_ARRAYS[field]] or [] for field in projection.tags))
+            ]
+        elif name == "content" and projection.content:
+            task[name] = decompress_text(row["task_content_data"], row["task_content_compressed"])
+    return task
 
 
 class KanbanApplicationService:
@@ -20,62 +173,101 @@ class KanbanApplicationService:
             column_repo: ColumnRepo,
             task_repo: TaskRepo,
             tag_repo: TagRepo,
+            board_version_repo: BoardVersionRepo,
+            uow: UnitOfWork,
             is_user_in_project: Callable[[uuid.UUID, uuid.UUID], Coroutine[Any, Any, bool]],
     ):
         self._current_user = current_user
+        self._uow = uow
         self._repo = column_repo
         self._task_repo = task_repo
         self._tag_repo = tag_repo
+        self._board_version_repo = board_version_repo
         self._is_user_in_project = is_user_in_project
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_COLUMN)
-    async def column_list(self, project_id: uuid.UUID) -> list[schemas.Column]:
+    @read_only
+    async def column_list(
+            self,
+            project_id: uuid.UUID,
+            as_records: bool = False,
+            include_content: bool = False,
+            fields: Collection[str] | None = None,
+            exclude: Collection[str] | None = None
+    ) -> list[schemas.Column] | list[records.Column]:
+        """
+        :param project_id:
+        :param as_records: вернуть records.Column для быстрой сериализации
+        :param include_content: загрузить содержание задач
+        :param fields: выбрать только эти поля задач
+        :param exclude: не выбирать эти поля задач
+        :return: с fields или exclude - records.Column с задачами-словарями
+        """
         if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        _ = await self._repo.get_all(project_id=project_id)
-        columns = [schemas.Column.model_validate(column) for column in _]
-        # Сортировка задач колонок
-        for column in columns:
-            task_ids = {el.id for el in column.tasks}
-            task_child_ids = {el.child_id for el in column.tasks}
-            result = list(task_ids - task_child_ids)
-
-            if not result:
-                continue
-
-            sorted_tasks = []
-            current_task = [el for el in column.tasks if el.id == result[0]][0]
-            while True:
-                sorted_tasks.append(current_task)
-                searched = [el for el in column.tasks if el.id == current_task.child_id]
-                if searched:
-                    current_task = searched[0]
-                    continue
-                break
-            column.tasks = sorted_tasks
-
-        # Сортировка колонок
-        column_ids = {el.id for el in columns}
-        column_child_ids = {el.child_id for el in columns}
-        result = list(column_ids - column_child_ids)
-
-        if result:
-            sorted_columns = []
-            current_column = [el for el in columns if el.id == result[0]][0]
-            while True:
-                sorted_columns.append(current_column)
-                searched = [el for el in columns if el.id == current_column.child_id]
-                if searched:
-                    current_column = searched[0]
-                    continue
-                break
-            columns = sorted_columns
-        return columns
+        projection, task_from_row = _task_reader(fields, exclude, include_content)
+        columns = _board_from_rows(await self._repo.get_board(project_id, projection), task_from_row=task_from_row)
+        if as_records or task_from_row is not _task_from_row:
+            return columns
+        return [schemas.Column.model_validate(column) for column in columns]
+
+    @state_filter(UserState.ACTIVE)
+    @permission_filter(Permission.GET_COLUMN, Permission.GET_TASK)
+    @read_only
+    async def column_preview(
+            self,
+            project_id: uuid.UUID,
+            limit: int,
+            as_records: bool = False,
+            include_content: bool = False,
+            fields: Collection[str] | None = None,
+            exclude: Collection[str] | None = None
+    ) -> list[schemas.ColumnPreview] | list[records.ColumnPreview]:
+        """
+        Колонки проекта с первыми limit задачами, общим числом задач
+        и курсором для догрузки остальных через task_list
+
+        :param project_id:
+        :param limit: число задач каждой колонки
+        :param as_records: вернуть records.ColumnPreview для быстрой сериализации
+        :param include_content: загрузить содержание задач
+        :param fields: выбрать только эти поля задач
+        :param exclude: не выбирать эти поля задач
+        :return: с fields или exclude - records.ColumnPreview с задачами-словарями
+        """
+        if not await self._is_user_in_project(project_id, self._current_user.id):
+            raise exceptions.AccessDenied("Доступ запрещен")
+
+        projection, task_from_row = _task_reader(fields, exclude, include_content)
+        columns = _board_from_rows(
+            await self._repo.get_preview(project_id, limit, projection),
+            preview=True,
+            task_from_row=task_from_row,
+        )
+        if as_records or task_from_row is not _task_from_row:
+            return columns
+        return [schemas.ColumnPreview.model_validate(column) for column in columns]
+
+    @state_filter(UserState.ACTIVE)
+    @permission_filter(Permission.GET_COLUMN)
+    @read_only
+    async def column_list_version(self, project_id: uuid.UUID) -> int:
+        """
+        Версия доски для списка колонок, читается без загрузки колонок и задач
+
+        :param project_id:
+        :return:
+        """
+        if not await self._is_user_in_project(project_id, self._current_user.id):
+            raise exceptions.AccessDenied("Доступ запрещен")
+
+        return await self._board_version_repo.get_version(project_id)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_COLUMN)
+    @read_only
     async def get_column(self, column_id: uuid.UUID) -> schemas.Column:
         column = await self._repo.get(id=column_id)
         if not column:
@@ -84,46 +276,37 @@ class KanbanApplicationService:
         if not await self._is_user_in_project(column.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        # Сортировка
-        task_ids = {el.id for el in column.tasks}
-        task_child_ids = {el.child_id for el in column.tasks}
-        result = list(task_ids - task_child_ids)
-
-        if result:
-            sorted_tasks = []
-            current_task = [el for el in column.tasks if el.id == result[0]][0]
-            while True:
-                sorted_tasks.append(current_task)
-                searched = [el for el in column.tasks if el.id == current_task.child_id]
-                if searched:
-                    current_task = searched[0]
-                    continue
-                break
-            column.tasks = sorted_tasks
-
         return schemas.Column.model_validate(column)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.CREATE_COLUMN)
+    @transaction
     async def create_column(self, project_id: uuid.UUID, data: schemas.ColumnCreate) -> schemas.Column:
 
         if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        last_column = await self._repo.get(child_id=None, project_id=project_id)
-        column = await self._repo.create(**data.model_dump(), project_id=project_id)
+        last_column = await self._repo.get_ref(child_id=None, project_id=project_id)
+        column = await self._repo.create(
+            **data.model_dump(),
+            project_id=project_id,
+            position=await self._repo.key_before(project_id, None)
+        )
 
         if last_column:
             await self._repo.update(last_column.id, child_id=column.id)
 
+        await self._board_version_repo.bump(project_id)
+
         # Task preloading
         column = await self._repo.get(id=column.id)
         return schemas.Column.model_validate(column)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.UPDATE_COLUMN)
+    @transaction
     async def update_column(self, column_id: uuid.UUID, data: schemas.ColumnUpdate) -> None:
-        column = await self._repo.get(id=column_id)
+        column = await self._repo.get_ref(id=column_id)
         if not column:
             raise exceptions.NotFound("Колонка не найдена")
 
@@ -132,218 +315,273 @@ class KanbanApplicationService:
 
         # Обновить порядок колонок
         if column.child_id != data.child_id:
+            await self._move_column(column, data.child_id)
 
-            # Дочерняя колонка может быть либо None, либо валидным Column
-            new_child_id = data.child_id
-            if new_child_id:
-                child_column = await self._repo.get(id=new_child_id)
-                if not child_column:
-                    raise exceptions.NotFound("Дочерняя колонка не найдена")
+        await self._repo.update(column_id, **data.model_dump(exclude={"child_id"}))
+        await self._board_version_repo.bump(column.project_id)
 
-                if child_column.project_id != column.project_id:
-                    raise exceptions.BadRequest("Дочерняя колонка не принадлежит данному проекту")
+    @state_filter(UserState.ACTIVE)
+    @permission_filter(Permission.UPDATE_COLUMN)
+    @transaction
+    async def move_column(self, column_id: uuid.UUID, data: schemas.ColumnMove) -> None:
+        column = await self._repo.get_ref(id=column_id)
+        if not column:
+            raise exceptions.NotFound("Колонка не найдена")
 
-            parent_column = await self._repo.get(child_id=column_id)
-            if parent_column:
-                await self._repo.update(parent_column.id, child_id=column.child_id)
+        if not await self._is_user_in_project(column.project_id, self._current_user.id):
+            raise exceptions.AccessDenied("Доступ запрещен")
 
-            # Может быть null
-            if new_child_id:
-                new_parent_column = await self._repo.get(child_id=new_child_id)
-            else:
-                new_parent_column = await self._repo.get(child_id=None)
+        if column.child_id != data.child_id:
+            await self._move_column(column, data.child_id)
+            await self._board_version_repo.bump(column.project_id)
+
+    async def _move_column(self, column, child_id: uuid.UUID | None) -> None:
+        # Дочерняя колонка может быть либо None, либо валидным Column
+        if child_id:
+            if child_id == column.id:
+                raise exceptions.BadRequest("Колонка не может быть дочерней самой себе")
 
-            if new_parent_column:
-                await self._repo.update(new_parent_column.id, child_id=column_id)
+            child_column = await self._repo.get_ref(id=child_id)
+            if not child_column:
+                raise exceptions.NotFound("Дочерняя колонка не найдена")
 
-        await self._repo.update(column_id, **data.model_dump())
+            if child_column.project_id != column.project_id:
+                raise exceptions.BadRequest("Дочерняя колонка не принадлежит данному проекту")
+
+        await self._repo.move(
+            column.id,
+            column.project_id,
+            child_id,
+            position=await self._repo.key_before(column.project_id, child_id, exclude_id=column.id)
+        )
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.DELETE_COLUMN)
+    @transaction
     async def delete_column(self, column_id: uuid.UUID) -> None:
-        column = await self._repo.get(id=column_id)
+        column = await self._repo.get_ref(id=column_id)
         if not column:
             raise exceptions.NotFound("Колонка не найдена")
 
         if not await self._is_user_in_project(column.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        pre_column = await self._repo.get(child_id=column_id)
+        pre_column = await self._repo.get_ref(child_id=column_id)
 
         if pre_column:
             await self._repo.update(pre_column.id, child_id=column.child_id)
 
         await self._repo.delete(id=column_id)
+        await self._board_version_repo.bump(column.project_id)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_TASK)
-    async def task_list(self, column_id: uuid.UUID) -> list[schemas.Task]:
-        column = await self._repo.get(id=column_id)
+    @read_only
+    async def task_list_version(self, column_id: uuid.UUID) -> int:
+        """
+        Версия доски для списка задач колонки, читается без загрузки задач
+
+        :param column_id:
+        :return:
+        """
+        project_id = await self._repo.get_project_id(column_id)
+        if not project_id:
+            raise exceptions.NotFound("Колонка не найдена")
+
+        if not await self._is_user_in_project(project_id, self._current_user.id):
+            raise exceptions.AccessDenied("Доступ запрещен")
+
+        return await self._board_version_repo.get_version(project_id)
+
+    @state_filter(UserState.ACTIVE)
+    @permission_filter(Permission.GET_TASK)
+    @read_only
+    async def task_list(
+            self,
+            column_id: uuid.UUID,
+            limit: int | None = None,
+            cursor: str | None = None,
+            as_records: bool = False,
+            include_content: bool = False,
+            fields: Collection[str] | None = None,
+            exclude: Collection[str] | None = None
+    ) -> schemas.TaskPage | records.TaskPage:
+        """
+        Задачи колонки в порядке доски, постранично
+
+        :param column_id:
+        :param limit: размер страницы (None - все задачи)
+        :param cursor: next_cursor предыдущей страницы
+        :param as_records: вернуть records.TaskPage для быстрой сериализации
+        :param include_content: загрузить содержание задач
+        :param fields: выбрать только эти поля задач
+        :param exclude: не выбирать эти поля задач
+        :return: с fields или exclude - records.TaskPage с задачами-словарями
+        """
+        after, version = None, None
+        if cursor:
+            try:
+                position, task_id, version = decode_cursor(cursor)
+            except ValueError as error:
+                raise exceptions.BadRequest(str(error))
+            after = (position, task_id)
+
+        column = await self._repo.get_ref(id=column_id)
         if not column:
             raise exceptions.NotFound("Колонка не найдена")
 
         if not await self._is_user_in_project(column.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        column = schemas.Column.model_validate(column)
-
-        # Сортировка
-        task_ids = {el.id for el in column.tasks}
-        task_child_ids = {el.child_id for el in column.tasks}
-        result = list(task_ids - task_child_ids)
-
-        if result:
-            sorted_tasks = []
-            current_task = [el for el in column.tasks if el.id == result[0]][0]
-            while True:
-                sorted_tasks.append(current_task)
-                searched = [el for el in column.tasks if el.id == current_task.child_id]
-                if searched:
-                    current_task = searched[0]
-                    continue
-                break
-            column.tasks = sorted_tasks
-        return column.tasks
+        # После перебалансировки ключи задач другие: продолжение по старому
+        # курсору пропустило бы или повторило задачи
+        if cursor and version != column.task_position_version:
+            raise exceptions.BadRequest("Курсор устарел: порядок задач колонки изменился, загрузите список заново")
+
+        projection, task_from_row = _task_reader(fields, exclude, include_content)
+        rows = await self._task_repo.get_rows(column_id, limit + 1 if limit else None, after, projection)
+
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].task_position, rows[-1].task_id, column.task_position_version)
+
+        tasks = [task_from_row(row._asdict()) for row in rows]
+        if as_records or task_from_row is not _task_from_row:
+            return records.TaskPage(tasks=tasks, next_cursor=next_cursor)
+
+        return schemas.TaskPage(
+            tasks=[schemas.Task.model_validate(task) for task in tasks],
+            next_cursor=next_cursor,
+        )
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_TASK)
+    @read_only
     async def get_task(self, task_id: uuid.UUID) -> schemas.Task:
-        task = await self._task_repo.get(id=task_id)
-        if not task:
+        row = await self._task_repo.get_row(task_id)
+        if not row:
             raise exceptions.NotFound("Задача не найдена")
 
-        if not await self._is_user_in_project(task.column.project_id, self._current_user.id):
+        if not await self._is_user_in_project(row.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        return schemas.Task.model_validate(task)
+        return schemas.Task.model_validate(_task_from_row(row._asdict()))
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.CREATE_TASK)
+    @transaction
     async def create_task(self, column_id: uuid.UUID, data: schemas.TaskCreate) -> schemas.Task:
-        column = await self._repo.get(id=column_id)
+        column = await self._repo.get_ref(id=column_id)
         if not column:
             raise exceptions.NotFound("Колонка не найдена")
 
         if not await self._is_user_in_project(column.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        last_task = await self._task_repo.get(child_id=None, column_id=column_id)
-        task = await self._task_repo.create(**data.model_dump(), column_id=column_id)
+        last_task = await self._task_repo.get_ref(child_id=None, column_id=column_id)
+        task = await self._task_repo.create(
+            **data.model_dump(),
+            column_id=column_id,
+            position=await self._task_repo.key_before(column_id, None)
+        )
 
         if last_task:
             await self._task_repo.update(last_task.id, child_id=task.id)
 
-        return schemas.Task.model_validate(task)
+        await self._board_version_repo.bump(column.project_id)
+
+        row = await self._task_repo.get_row(task.id)
+        return schemas.Task.model_validate(_task_from_row(row._asdict()))
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.UPDATE_TASK)
+    @transaction
     async def update_task(self, task_id: uuid.UUID, data: schemas.TaskUpdate) -> None:
-        task = await self._task_repo.get(id=task_id)
+        task = await self._task_repo.get_ref(id=task_id)
+        if not task:
+            raise exceptions.NotFound("Задача не найдена")
+
+        if not await self._is_user_in_project(task.project_id, self._current_user.id):
+            raise exceptions.AccessDenied("Доступ запрещен")
+
+        # Обновить порядок задач
+        column_id = data.column_id or task.column_id
+        if task.column_id != column_id or task.child_id != data.child_id:
+            await self._move_task(task, column_id, data.child_id)
+
+        await self._task_repo.update(task_id, **data.model_dump(exclude_unset=True, exclude={"column_id", "child_id"}))
+        await self._board_version_repo.bump(task.project_id)
+
+    @state_filter(UserState.ACTIVE)
+    @permission_filter(Permission.UPDATE_TASK)
+    @transaction
+    async def move_task(self, task_id: uuid.UUID, data: schemas.TaskMove) -> None:
+        task = await self._task_repo.get_ref(id=task_id)
         if not task:
             raise exceptions.NotFound("Задача не найдена")
 
-        if not await self._is_user_in_project(task.column.project_id, self._current_user.id):
+        if not await self._is_user_in_project(task.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        if data.column_id:
-            new_column = await self._repo.get(id=data.column_id)
+        column_id = data.column_id or task.column_id
+        if task.column_id != column_id or task.child_id != data.child_id:
+            await self._move_task(task, column_id, data.child_id)
+            await self._board_version_repo.bump(task.project_id)
+
+    async def _move_task(self, task, column_id: uuid.UUID, child_id: uuid.UUID | None) -> None:
+        if task.column_id != column_id:
+            new_column = await self._repo.get_ref(id=column_id)
             if not new_column:
                 raise exceptions.NotFound("Новая колонка не найдена")
 
             if not await self._is_user_in_project(new_column.project_id, self._current_user.id):
                 raise exceptions.AccessDenied("Доступ к указанной колонке запрещен")
 
-        # Обновить порядок задач
-        if (not data.column_id or task.column_id == data.column_id) and task.child_id != data.child_id:
-
-            # Дочерняя колонка может быть либо None, либо валидным Column
-            new_child_id = data.child_id
-            if new_child_id:
-                child_task = await self._task_repo.get(id=new_child_id)
-                if not child_task:
-                    raise exceptions.NotFound("Дочерняя карточка не найдена")
-
-                if child_task.column.project_id != task.column.project_id:
-                    raise exceptions.BadRequest("Дочерняя карточка не принадлежит данному проекту")
-
-            parent_task = await self._task_repo.get(child_id=task_id)
-            if parent_task:
-                await self._task_repo.update(parent_task.id, child_id=task.child_id)
-
-            # Может быть null
-            if new_child_id:
-                new_parent_task = await self._task_repo.get(child_id=new_child_id)
-            else:
-                new_parent_task = await self._task_repo.get(child_id=None)
-
-            if new_parent_task:
-                await self._task_repo.update(new_parent_task.id, child_id=task_id)
-
-        elif data.column_id and task.column_id != data.column_id:
-            # Удаление задачи из колонки
-            pre_task = await self._task_repo.get(child_id=task_id)
-            if pre_task:
-                await self._task_repo.update(pre_task.id, child_id=task.child_id)
-
-            await self._task_repo.delete(id=task_id)
-
-            # Создание задачи в новой колонке
-            last_task = await self._task_repo.get(child_id=None, column_id=data.column_id)
-            task = await self._task_repo.create(
-                **schemas.Task.model_validate(task).model_dump(
-                    exclude={"column_id", "child_id"}
-                ),
-                column_id=data.column_id,
-                child_id=None
-            )
+            if new_column.project_id != task.project_id:
+                await self._board_version_repo.bump(new_column.project_id)
 
-            if last_task:
-                await self._task_repo.update(last_task.id, child_id=task.id)
+        # Дочерняя карточка может быть либо None, либо валидным Task
+        if child_id:
+            if child_id == task.id:
+                raise exceptions.BadRequest("Карточка не может быть дочерней самой себе")
 
-            # Перемещение в новой колонке
-            new_child_id = data.child_id
-            if new_child_id:
-                child_task = await self._task_repo.get(id=new_child_id)
-                if not child_task:
-                    raise exceptions.NotFound("Дочерняя карточка не найдена")
+            child_task = await self._task_repo.get_ref(id=child_id)
+            if not child_task:
+                raise exceptions.NotFound("Дочерняя карточка не найдена")
 
-                if child_task.column.project_id != task.column.project_id:
-                    raise exceptions.BadRequest("Дочерняя карточка не принадлежит данному проекту")
+            if child_task.column_id != column_id:
+                raise exceptions.BadRequest("Дочерняя карточка не принадлежит указанной колонке")
 
-            parent_task = await self._task_repo.get(child_id=task_id)
-            if parent_task:
-                await self._task_repo.update(parent_task.id, child_id=task.child_id)
-
-            # Может быть null
-            if new_child_id:
-                new_parent_task = await self._task_repo.get(child_id=new_child_id)
-            else:
-                new_parent_task = await self._task_repo.get(child_id=None)
-
-            if new_parent_task:
-                await self._task_repo.update(new_parent_task.id, child_id=task_id)
-
-        return await self._task_repo.update(task_id, **data.model_dump(exclude_unset=True))
+        await self._task_repo.move(
+            task.id,
+            column_id,
+            child_id,
+            position=await self._task_repo.key_before(column_id, child_id, exclude_id=task.id)
+        )
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.DELETE_TASK)
+    @transaction
     async def delete_task(self, task_id: uuid.UUID) -> None:
-        task = await self._task_repo.get(id=task_id)
+        task = await self._task_repo.get_ref(id=task_id)
         if not task:
             raise exceptions.NotFound("Задача не найдена")
 
-        if not await self._is_user_in_project(task.column.project_id, self._current_user.id):
+        if not await self._is_user_in_project(task.project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        pre_task = await self._task_repo.get(child_id=task_id)
+        pre_task = await self._task_repo.get_ref(child_id=task_id)
 
         if pre_task:
             await self._task_repo.update(pre_task.id, child_id=task.child_id)
 
         await self._task_repo.delete(id=task_id)
+        await self._board_version_repo.bump(task.project_id)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.UPDATE_TASK)
+    @transaction
     async def create_tag(self, project_id: uuid.UUID, data: schemas.TagCreate) -> schemas.Tag:
         if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
@@ -353,22 +591,26 @@ class KanbanApplicationService:
             raise exceptions.BadRequest(f"Тег с названием {data.title!r} уже существует")
 
         tag = await self._tag_repo.create(**data.model_dump(), project_id=project_id)
+        await self._board_version_repo.bump(project_id)
         return schemas.Tag.model_validate(tag)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.UPDATE_TASK)
+    @transaction
     async def delete_tag(self, tag_id: uuid.UUID) -> None:
-        tag = await self._tag_repo.get(id=tag_id)
-        if not tag:
+        project_id = await self._tag_repo.get_project_id(tag_id)
+        if not project_id:
             raise exceptions.NotFound("Тег не найден")
 
-        if not await self._is_user_in_project(tag.project_id, self._current_user.id):
+        if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        await self._tag_repo.delete(tag.id)
+        await self._tag_repo.delete(tag_id)
+        await self._board_version_repo.bump(project_id)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_TASK)
+    @read_only
     async def tag_list(self, project_id: uuid.UUID) -> list[schemas.Tag]:
         if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
@@ -378,38 +620,40 @@ class KanbanApplicationService:
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.UPDATE_TASK)
+    @transaction
     async def set_tag(self, task_id: uuid.UUID, tag_id: uuid.UUID) -> None:
-        task = await self._task_repo.get(id=task_id)
-        if not task:
+        project_id = await self._task_repo.get_project_id(task_id)
+        if not project_id:
             raise exceptions.NotFound("Задача не найдена")
 
-        if not await self._is_user_in_project(task.column.project_id, self._current_user.id):
+        if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        tag = await self._tag_repo.get(id=tag_id)
-        if not tag:
+        if not await self._tag_repo.get_project_id(tag_id):
             raise exceptions.NotFound("Тег не найден")
 
         if await self._task_repo.has_tag(task_id=task_id, tag_id=tag_id):
             raise exceptions.NotFound("Связь уже существует")
 
         await self._task_repo.add_tag(task_id, tag_id)
+        await self._board_version_repo.bump(project_id)
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.UPDATE_TASK)
+    @transaction
     async def unset_tag(self, task_id: uuid.UUID, tag_id: uuid.UUID) -> None:
-        task = await self._task_repo.get(id=task_id)
-        if not task:
+        project_id = await self._task_repo.get_project_id(task_id)
+        if not project_id:
             raise exceptions.NotFound("Задача не найдена")
 
-        if not await self._is_user_in_project(task.column.project_id, self._current_user.id):
+        if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        tag = await self._tag_repo.get(id=tag_id)
-        if not tag:
+        if not await self._tag_repo.get_project_id(tag_id):
             raise exceptions.NotFound("Тег не найден")
 
         if not await self._task_repo.has_tag(task_id=task_id, tag_id=tag_id):
             raise exceptions.NotFound("Не найдена связь тега с карточкой")
 
         await self._task_repo.remove_tag(task_id, tag_id)
+        await self._board_version_repo.bump(project_id)
@@ -1,24 +1,260 @@
 import logging
+import time
 import uuid
+from typing import Awaitable, Callable
 
 import grpc
 from src.protos.project_control import project_control_pb2
 from src.protos.project_control import project_control_pb2_grpc
+from src.services.channels import ChannelPool
+from src.utils.cache import TTLCache, SingleFlight
+
+
+class MembershipCache:
+    """
+    Кэш членства пользователей в проектах
+
+    Положительные и отрицательные ответы хранятся с разным временем жизни,
+    одновременные промахи по одному ключу объединяются в один запрос.
+    Ошибки запроса не кэшируются.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 10000,
+            positive_ttl: float = 60,
+            negative_ttl: float = 5,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cache = TTLCache(maxsize, ttl=positive_ttl, clock=clock)
+        self._positive_ttl = positive_ttl
+        self._negative_ttl = negative_ttl
+        self._single_flight = SingleFlight()
+
+    async def get_or_fetch(
+            self,
+            project_id: uuid.UUID,
+            user_id: uuid.UUID,
+            fetch: Callable[[], Awaitable[bool]]
+    ) -> bool:
+        """
+        Возвращает закэшированный ответ или запрашивает его через fetch
+
+        :param project_id:
+        :param user_id:
+        :param fetch: запрос к сервису проектов
+        :return:
+        """
+        key = (project_id, user_id)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        return await self._single_flight.do(
+            key,
+            fetch,
+            lambda value: self._cache.set(key, value, ttl=self._positive_ttl if value else self._negative_ttl)
+        )
+
+    def invalidate(self, project_id: uuid.UUID, user_id: uuid.UUID = None) -> None:
+        """
+        Сбрасывает кэш пользователя в проекте или всего проекта
+
+        :param project_id:
+        :param user_id: None - все пользователи проекта
+        :return:
+        """
+        if user_id:
+            self._cache.pop((project_id, user_id))
+        else:
+            self._cache.pop_where(lambda key: key[0] == project_id)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+class UserProjectsCache:
+    """
+    Кэш множества проектов пользователя
+
+    Запись живет не дольше ttl (как положительный ответ MembershipCache)
+    и не дольше токена пользователя, поэтому исключение из проекта
+    применяется с той же задержкой, что и при проверке через IsUserInProject.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 10000,
+            ttl: float = 60,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self._cache = TTLCache(maxsize, ttl=ttl, clock=clock)
+        self._ttl = ttl
+        self._single_flight = SingleFlight()
+
+    async def get_or_fetch(
+            self,
+            user_id: uuid.UUID,
+            exp: int,
+            fetch: Callable[[], Awaitable[frozenset[uuid.UUID]]]
+    ) -> frozenset[uuid.UUID]:
+        """
+        :param user_id:
+        :param exp: время истечения токена (unix time)
+        :param fetch: запрос к сервису проектов
+        :return: id проектов пользователя
+        """
+        key = (user_id, exp)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        return await self._single_flight.do(
+            key,
+            fetch,
+            lambda value: self._cache.set(key, value, ttl=min(self._ttl, exp - time.time()))
+        )
+
+    def invalidate(self, user_id: uuid.UUID = None) -> None:
+        """
+        Сбрасывает множество проектов пользователя
+
+        :param user_id: None - всех пользователей
+        :return:
+        """
+        if user_id:
+            self._cache.pop_where(lambda key: key[0] == user_id)
+        else:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+class ProjectServiceClient:
+    """
+    Клиент сервиса проектов
+
+    Проверка членства сначала ищет проект во множестве проектов пользователя
+    (GetUserProjects, кэшируется не дольше положительного ответа
+    IsUserInProject), а если проекта там нет или сервер не поддерживает
+    GetUserProjects - выполняет кэшируемый IsUserInProject.
+    """
+
+    UNSUPPORTED_RETRY_INTERVAL = 300
+
+    def __init__(
+            self,
+            channels: ChannelPool,
+            membership_cache: MembershipCache,
+            user_projects_cache: UserProjectsCache,
+    ):
+        self._channels = channels
+        self._membership_cache = membership_cache
+        self._user_projects_cache = user_projects_cache
+        self._user_projects_unsupported_until = 0.0
+
+    async def is_user_in_project(self, project_id: uuid.UUID, user_id: uuid.UUID, exp: int = None) -> bool:
+        """
+        :param project_id:
+        :param user_id:
+        :param exp: время истечения токена пользователя, без него множество проектов не кэшируется
+        :return:
+        """
+        if exp and exp > time.time():
+            projects = await self.user_projects(user_id, exp)
+            if projects and project_id in projects:
+                return True
+
+        return await is_user_in_project(
+            project_id=project_id,
+            user_id=user_id,
+            channel=self._channels.get(),
+            cache=self._membership_cache,
+        )
+
+    async def user_projects(self, user_id: uuid.UUID, exp: int) -> frozenset[uuid.UUID] | None:
+        """
+        Возвращает проекты пользователя или None, если сервер не поддерживает GetUserProjects
+
+        :param user_id:
+        :param exp: время истечения токена пользователя
+        :return:
+        """
+        if self._user_projects_unsupported_until > time.monotonic():
+            return None
+
+        try:
+            return await self._user_projects_cache.get_or_fetch(
+                user_id,
+                exp,
+                lambda: request_user_projects(user_id, self._channels.get())
+            )
+        except grpc.aio.AioRpcError as error:
+            if error.code() == grpc.StatusCode.UNIMPLEMENTED:
+                logging.warning("Сервис проектов не поддерживает GetUserProjects, используется IsUserInProject")
+                self._user_projects_unsupported_until = time.monotonic() + self.UNSUPPORTED_RETRY_INTERVAL
+            else:
+                logging.error(error)
+            return None
+
+    def invalidate(self, project_id: uuid.UUID, user_id: uuid.UUID = None) -> None:
+        """
+        Сбрасывает оба кэша при изменении состава проекта
+
+        Множества проектов хранятся по пользователю, поэтому без user_id
+        сбрасываются множества всех пользователей.
+
+        :param project_id:
+        :param user_id: None - все пользователи проекта
+        :return:
+        """
+        self._membership_cache.invalidate(project_id, user_id)
+        self._user_projects_cache.invalidate(user_id)
+
+    def stats(self) -> dict:
+        return {
+            "membership": self._membership_cache.stats(),
+            "user_projects": self._user_projects_cache.stats(),
+        }
+
+
+async def request_membership(
+        project_id: uuid.UUID,
+        user_id: uuid.UUID,
+        channel: grpc.aio.Channel
+) -> bool:
+    stub = project_control_pb2_grpc.ProjectServiceStub(channel)
+    response = await stub.IsUserInProject(project_control_pb2.ProjectRequest(
+        project_id=str(project_id),
+        user_id=str(user_id)
+    ))
+    return response.result
+
+
+async def request_user_projects(user_id: uuid.UUID, channel: grpc.aio.Channel) -> frozenset[uuid.UUID]:
+    stub = project_control_pb2_grpc.ProjectServiceStub(channel)
+    response = await stub.GetUserProjects(project_control_pb2.UserProjectsRequest(
+        user_id=str(user_id)
+    ))
+    return frozenset(uuid.UUID(project_id) for project_id in response.project_ids)
 
 
 async def is_user_in_project(
         project_id: uuid.UUID,
         user_id: uuid.UUID,
-        project_service_conn: tuple[str, int]
+        channel: grpc.aio.Channel,
+        cache: MembershipCache = None
 ) -> bool:
     try:
-        async with grpc.aio.insecure_channel(f"{project_service_conn[0]}:{project_service_conn[1]}") as channel:
-            stub = project_control_pb2_grpc.ProjectServiceStub(channel)
-            response = await stub.IsUserInProject(project_control_pb2.ProjectRequest(
-                project_id=str(project_id),
-                user_id=str(user_id)
-            ))
-        return response.result
+        if cache is None:
+            return await request_membership(project_id, user_id, channel)
+
+        return await cache.get_or_fetch(
+            project_id,
+            user_id,
+            lambda: request_membership(project_id, user_id, channel)
+        )
     except grpc.aio.AioRpcError as error:
         logging.error(error)
         return False
@@ -1,20 +1,33 @@
 from .column import ColumnRepo
 from .task import TaskRepo
+from .task import TaskProjection
 from .tag import TagRepo
+from .board import BoardVersionRepo
+from .uow import UnitOfWork
+from .uow import transaction
+from .uow import read_only
 
 
 class RepoFactory:
-    def __init__(self, session):
-        self._session = session
+    def __init__(self, uow: UnitOfWork):
+        self._uow = uow
+
+    @property
+    def uow(self) -> UnitOfWork:
+        return self._uow
 
     @property
     def column(self) -> ColumnRepo:
-        return ColumnRepo(self._session)
+        return ColumnRepo(self._uow)
 
     @property
     def task(self) -> TaskRepo:
-        return TaskRepo(self._session)
+        return TaskRepo(self._uow)
 
     @property
     def tag(self) -> TagRepo:
-        return TagRepo(self._session)
+        return TagRepo(self._uow)
+
+    @property
+    def board_version(self) -> BoardVersionRepo:
+        return BoardVersionRepo(self._uow)
@@ -1,17 +1,21 @@
 import uuid
 from typing import Generic, Type, TypeVar, Optional
 
-from sqlalchemy import update, delete, func, select, text, and_
+from sqlalchemy import update, delete, func, select, text, and_, null, union_all, literal, case, UUID, tuple_, Select
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.utils import rank
+from .uow import UnitOfWork
+
 T = TypeVar('T')
 
 
 class BaseRepository(Generic[T]):
     table: Type[T]
 
-    def __init__(self, session: AsyncSession):
-        self._session = session
+    def __init__(self, uow: UnitOfWork):
+        self._uow = uow
 
     async def create(self, **kwargs) -> T:
         """
@@ -22,7 +26,8 @@ class BaseRepository(Generic[T]):
         """
         model = self.table(**kwargs)
         self._session.add(model)
-        await self._session.commit()
+        await self._session.flush()
+        self._uow.mark_dirty()
         return model
 
     async def get(self, **kwargs) -> Optional[T]:
@@ -32,7 +37,7 @@ class BaseRepository(Generic[T]):
         :param kwargs:
         :return:
         """
-        return (await self._session.execute(select(self.table).filter_by(**kwargs))).scalars().first()
+        return (await self._read_session.execute(select(self.table).filter_by(**kwargs))).scalars().first()
 
     async def get_all(
             self, limit: int = 100,
@@ -49,7 +54,7 @@ class BaseRepository(Generic[T]):
         :param order_by: сортировка
         :return:
         """
-        result = await self._session.execute(
+        result = await self._read_session.execute(
             select(self.table).filter_by(**kwargs).order_by(text(order_by)).limit(limit).offset(offset)
         )
         return result.scalars().all()
@@ -64,7 +69,7 @@ class BaseRepository(Generic[T]):
         """
         if kwargs:
             await self._session.execute(update(self.table).where(self.table.id == id).values(**kwargs))
-            await self._session.commit()
+            self._uow.mark_dirty()
 
     async def delete(self, id: uuid.UUID) -> None:
         """
@@ -74,7 +79,7 @@ class BaseRepository(Generic[T]):
         :return:
         """
         await self._session.execute(delete(self.table).where(self.table.id == id))
-        await self._session.commit()
+        self._uow.mark_dirty()
 
     async def count(self, **kwargs) -> int:
         """
@@ -87,9 +92,162 @@ class BaseRepository(Generic[T]):
             getattr(self.table, key) == value
             for key, value in kwargs.items()
         ]))
-        result = await self._session.execute(stmt)
+        result = await self._read_session.execute(stmt)
         return result.scalar()
 
+    @property
+    def _session(self) -> AsyncSession:
+        return self._uow.session
+
+    @property
+    def _read_session(self) -> AsyncSession:
+        return self._uow.read_session
+
     @property
     def session(self) -> AsyncSession:
         return self._session
+
+
+class RankedRepository(BaseRepository[T]):
+    """
+    Репозиторий записей, упорядоченных по ключу position
+
+    Порядок задается в пределах области (scope), например задачи колонки
+    """
+    scope: str
+
+    def _paginate(
+            self,
+            stmt: Select,
+            scope_id: uuid.UUID,
+            limit: int | None = None,
+            after: tuple[str, uuid.UUID] | None = None,
+    ) -> Select:
+        """
+        Ограничивает запрос страницей области в порядке position (keyset, без OFFSET)
+
+        Следующая страница начинается строго после пары (position, id)
+        последней записи предыдущей страницы, поэтому одновременные вставки
+        не приводят к пропускам и повторам
+
+        :param stmt: запрос к таблице репозитория
+        :param scope_id: id области
+        :param limit: размер страницы (None - все записи)
+        :param after: (position, id) последней записи предыдущей страницы
+        :return:
+        """
+        stmt = stmt.where(
+            getattr(self.table, self.scope) == scope_id
+        ).order_by(self.table.position, self.table.id).limit(limit)
+
+        if after:
+            # position >= .. позволяет использовать индекс (scope, position)
+            stmt = stmt.where(
+                self.table.position >= after[0],
+                tuple_(self.table.position, self.table.id) > tuple_(*after)
+            )
+        return stmt
+
+    async def key_before(
+            self,
+            scope_id: uuid.UUID,
+            child_id: uuid.UUID | None,
+            exclude_id: uuid.UUID | None = None
+    ) -> str:
+        """
+        Вычисляет ключ позиции для вставки перед записью child_id
+
+        :param scope_id: id области
+        :param child_id: id следующей записи (None - вставка в конец)
+        :param exclude_id: id перемещаемой записи
+        :return: ключ позиции
+        """
+        scope = getattr(self.table, self.scope)
+        conditions = [scope == scope_id]
+        if exclude_id:
+            conditions.append(self.table.id != exclude_id)
+
+        if child_id:
+            after = select(self.table.position).where(
+                scope == scope_id, self.table.id == child_id
+            ).scalar_subquery()
+            conditions.append(self.table.position < after)
+        else:
+            after = null()
+
+        before = select(func.max(self.table.position)).where(*conditions).scalar_subquery()
+        before, after = (await self._session.execute(select(before, after))).one()
+
+        if child_id and after is None:
+            raise ValueError(f"Запись {child_id} не найдена в области {scope_id}")
+
+        key = rank.key_between(before, after)
+        if rank.needs_rebalance(key):
+            await self.rebalance(scope_id)
+            return await self.key_before(scope_id, child_id, exclude_id)
+        return key
+
+    async def move(
+            self,
+            id: uuid.UUID,
+            scope_id: uuid.UUID,
+            child_id: uuid.UUID | None,
+            position: str
+    ) -> None:
+        """
+        Перемещает запись перед child_id (None - в конец) области scope_id
+
+        Цепочка child_id перестраивается одним UPDATE: предыдущая запись
+        начинает ссылаться на следующую за перемещаемой, новая предыдущая -
+        на перемещаемую. Идентификатор записи и ее связи сохраняются.
+
+        :param id: id перемещаемой записи
+        :param scope_id: id области назначения
+        :param child_id: id следующей записи в области назначения
+        :param position: ключ позиции (см. key_before)
+        :return:
+        """
+        scope = getattr(self.table, self.scope)
+        moved = select(self.table.id, self.table.child_id).where(self.table.id == id).cte("moved")
+        old_parent = aliased(self.table)
+        new_parent = aliased(self.table)
+
+        changes = union_all(
+            select(old_parent.id, moved.c.child_id).join(moved, old_parent.child_id == moved.c.id),
+            select(new_parent.id, literal(id, UUID)).where(
+                getattr(new_parent, self.scope) == scope_id,
+                new_parent.id != id,
+                new_parent.child_id == child_id if child_id else new_parent.child_id.is_(None)
+            ),
+            select(literal(id, UUID), literal(child_id, UUID)),
+        ).cte("changes")
+
+        await self._session.execute(
+            update(self.table).where(
+                self.table.id == changes.c.id
+            ).values(
+                child_id=changes.c.child_id,
+                position=case((self.table.id == id, position), else_=self.table.position),
+                **{self.scope: case((self.table.id == id, scope_id), else_=scope)},
+            ).execution_options(synchronize_session=False)
+        )
+        self._uow.mark_dirty()
+
+    async def rebalance(self, scope_id: uuid.UUID) -> None:
+        """
+        Равномерно перераспределяет ключи позиций области
+
+        :param scope_id: id области
+        :return:
+        """
+        ids = (await self._session.execute(
+            select(self.table.id).where(
+                getattr(self.table, self.scope) == scope_id
+            ).order_by(self.table.position, self.table.id)
+        )).scalars().all()
+
+        if ids:
+            await self._session.execute(update(self.table), [
+                dict(id=id, position=key) for id, key in zip(ids, rank.spread_keys(len(ids)))
+            ])
+            self._uow.mark_dirty()
@@ -0,0 +1,38 @@
+import uuid
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models import tables
+from .base import BaseRepository
+
+
+class BoardVersionRepo(BaseRepository[tables.BoardVersion]):
+    table = tables.BoardVersion
+
+    async def get_version(self, project_id: uuid.UUID) -> int:
+        """
+        Текущая версия доски проекта
+
+        :param project_id:
+        :return: 0, если доска еще не изменялась
+        """
+        stmt = select(self.table.version).where(self.table.project_id == project_id)
+        return (await self._read_session.execute(stmt)).scalar() or 0
+
+    async def bump(self, project_id: uuid.UUID) -> None:
+        """
+        Увеличивает версию доски в текущей транзакции
+
+        Строка версии блокируется до конца транзакции, поэтому
+        изменения одной доски получают последовательные версии
+
+        :param project_id:
+        :return:
+        """
+        stmt = insert(self.table).values(project_id=project_id, version=1).on_conflict_do_update(
+            index_elements=[self.table.project_id],
+            set_={"version": self.table.version + 1, "updated_at": func.now()},
+        )
+        await self._session.execute(stmt)
+        self._uow.mark_dirty()
@@ -1,28 +1,161 @@
+import uuid
 from typing import Sequence
 
-from sqlalchemy import select
-from sqlalchemy.orm import subqueryload, joinedload
+from sqlalchemy import select, func, Row, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import selectinload, Load
 
 from src.models import tables
-from .base import BaseRepository
-from ...models.tables import Column
+from .base import RankedRepository
+from .task import aggregated_tags, CONTENT_COLUMNS, TaskProjection
 
 
-class ColumnRepo(BaseRepository[tables.Column]):
+class ColumnRepo(RankedRepository[tables.Column]):
+    """
+    Колонка загружается вместе с задачами и их тегами через selectinload:
+    колонка, задачи и теги читаются тремя запросами (задачи и теги - по
+    спискам id через IN), без декартова произведения колонки x задачи x
+    теги, которое дает joinedload.
+
+    Доска проекта целиком читается одним запросом строк (см. get_board).
+    """
     table = tables.Column
+    scope = "project_id"
+
+    def _load_tasks(self) -> Load:
+        return selectinload(self.table.tasks).options(selectinload(tables.Task.tags))
 
     async def get(self, **kwargs) -> tables.Column:
         stmt = select(
             self.table
         ).filter_by(**kwargs).options(
-            joinedload(self.table.tasks).joinedload(tables.Task.tags)
+            self._load_tasks()
         )
-        return (await self._session.execute(stmt)).scalars().first()
+        return (await self._read_session.execute(stmt)).unique().scalars().first()
+
+    async def get_ref(self, **kwargs) -> Row | None:
+        """
+        Ссылка на колонку без загрузки задач: id, project_id, child_id, position,
+        task_position_version
 
-    async def get_all(self, **kwargs) -> Sequence[Column]:
+        :param kwargs: filter by
+        :return:
+        """
         stmt = select(
-            self.table
-        ).filter_by(**kwargs).options(
-            joinedload(self.table.tasks).joinedload(tables.Task.tags)
+            self.table.id,
+            self.table.project_id,
+            self.table.child_id,
+            self.table.position,
+            self.table.task_position_version,
+        ).filter_by(**kwargs)
+        return (await self._read_session.execute(stmt)).first()
+
+    async def get_project_id(self, column_id) -> uuid.UUID | None:
+        """
+        Проект колонки без загрузки задач
+
+        :param column_id:
+        :return:
+        """
+        stmt = select(self.table.project_id).where(self.table.id == column_id)
+        return (await self._read_session.execute(stmt)).scalar()
+
+    async def get_board(self, project_id, projection: TaskProjection = TaskProjection()) -> Sequence[Row]:
+        """
+        Доска проекта одним запросом
+
+        Строка на каждую задачу (или на пустую колонку) в порядке колонок
+        и задач; теги задачи агрегированы в массивы tag_ids, tag_titles,
+        tag_created_ats
+
+        :param project_id:
+        :param projection: выбираемые поля задач
+        :return: строки с полями column_*, task_*, tag_* и task_content_* из projection
+        """
+        stmt = select(
+            *[column.label(f"column_{column.key}") for column in self.table.__table__.columns],
+            *projection.task_columns(tables.Task.__table__.columns),
+        ).outerjoin(
+            tables.Task, tables.Task.column_id == self.table.id
+        ).where(
+            self.table.project_id == project_id
+        ).order_by(
+            self.table.position, self.table.id, tables.Task.position, tables.Task.id
+        )
+
+        if projection.tags:
+            tag_order = (tables.Tag.title, tables.Tag.id)
+            stmt = stmt.add_columns(*[
+                func.array_agg(aggregate_order_by(field, *tag_order)).filter(
+                    tables.Tag.id.isnot(None)
+                ).label(label)
+                for field, label in projection.tag_columns()
+            ]).outerjoin(
+                tables.TaskTag, tables.TaskTag.task_id == tables.Task.id
+            ).outerjoin(
+                tables.Tag, tables.Tag.id == tables.TaskTag.tag_id
+            ).group_by(
+                self.table.id, tables.Task.id
+            )
+
+        if projection.content:
+            stmt = stmt.add_columns(*CONTENT_COLUMNS).outerjoin(
+                tables.TaskContent, tables.TaskContent.task_id == tables.Task.id
+            )
+            if projection.tags:
+                stmt = stmt.group_by(tables.TaskContent.task_id)
+        return (await self._read_session.execute(stmt)).all()
+
+    async def get_preview(
+            self,
+            project_id,
+            limit: int,
+            projection: TaskProjection = TaskProjection()
+    ) -> Sequence[Row]:
+        """
+        Превью доски: колонки с первыми limit задачами одним запросом
+
+        Задачи и теги каждой колонки выбираются LATERAL подзапросами по
+        индексу (column_id, position), поэтому их выборка зависит от
+        limit x число колонок, а не от общего числа задач. Общее число задач
+        считается один раз на колонку по тому же индексу, но эта часть
+        запроса по-прежнему пропорциональна числу задач колонки: отдельного
+        счетчика задач нет
+
+        :param project_id:
+        :param limit: число задач каждой колонки
+        :param projection: выбираемые поля задач
+        :return: строки как у get_board и column_task_count
+        """
+        # LATERAL, а не подзапрос в списке выборки: иначе счет повторяется для каждой строки задачи
+        task_count = select(func.count().label("task_count")).where(
+            tables.Task.column_id == self.table.id
+        ).lateral("task_count")
+
+        tasks = select(
+            *projection.select_columns(tables.Task.__table__.columns)
+        ).where(
+            tables.Task.column_id == self.table.id
+        ).order_by(tables.Task.position, tables.Task.id).limit(limit).lateral("task")
+
+        from_clause = self.table.__table__.join(task_count, true()).outerjoin(tasks, true())
+        columns = [
+            *[column.label(f"column_{column.key}") for column in self.table.__table__.columns],
+            task_count.c.task_count.label("column_task_count"),
+            *projection.task_columns(tasks.c),
+        ]
+        if projection.tags:
+            tags = aggregated_tags(tasks.c.id, projection)
+            from_clause = from_clause.outerjoin(tags, true())
+            columns.extend(tags.c)
+
+        if projection.content:
+            from_clause = from_clause.outerjoin(tables.TaskContent, tables.TaskContent.task_id == tasks.c.id)
+            columns.extend(CONTENT_COLUMNS)
+
+        stmt = select(*columns).select_from(from_clause).where(
+            self.table.project_id == project_id
+        ).order_by(
+            self.table.position, self.table.id, tasks.c.position, tasks.c.id
         )
-        return (await self._session.execute(stmt)).unique().scalars().all()
+        return (await self._read_session.execute(stmt)).all()
@@ -1,18 +1,55 @@
 import uuid
 
+from sqlalchemy import select, func, and_
+
 from src.models import tables
+from src.models.state import TaskStatus
 from src.services.repository.base import BaseRepository
+from src.services.repository.task import TaskRepo
 
 
 class TagRepo(BaseRepository[tables.Tag]):
     table = tables.Tag
 
-    async def get_task_count(self, tag_id: uuid.UUID) -> int:
-        stmt = (
-            self.table.select()
-            .join(tables.TaskTag)
-            .where(tables.TaskTag.tag_id == tag_id)
-            .count()
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar()
+    async def get_project_id(self, tag_id: uuid.UUID) -> uuid.UUID | None:
+        """
+        Проект тега одним скалярным запросом
+
+        :param tag_id:
+        :return:
+        """
+        stmt = select(self.table.project_id).where(self.table.id == tag_id)
+        return (await self._read_session.execute(stmt)).scalar()
+
+    async def get_stat(
+            self,
+            project_id: uuid.UUID,
+            column_id: uuid.UUID = None,
+            status: TaskStatus = TaskStatus.ALL
+    ) -> list[tuple[uuid.UUID, str, int]]:
+        """
+        Количество задач по каждому тегу проекта одним запросом
+
+        Теги без задач возвращаются с нулевым количеством
+
+        :param project_id:
+        :param column_id: учитывать только задачи колонки
+        :param status: учитывать только задачи в статусе
+        :return: список (tag_id, title, count)
+        """
+        task_conditions = [tables.Task.id == tables.TaskTag.task_id, *TaskRepo.status_conditions(status)]
+        if column_id:
+            task_conditions.append(tables.Task.column_id == column_id)
+
+        stmt = select(
+            self.table.id, self.table.title, func.count(tables.Task.id)
+        ).outerjoin(
+            tables.TaskTag, tables.TaskTag.tag_id == self.table.id
+        ).outerjoin(
+            tables.Task, and_(*task_conditions)
+        ).where(
+            self.table.project_id == project_id
+        ).group_by(
+            self.table.id, self.table.title
+        ).order_by(self.table.title)
+        return (await self._read_session.execute(stmt)).tuples().all()
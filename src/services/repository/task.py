@@ -1,74 +1,282 @@
 import uuid
+from dataclasses import dataclass
+from typing import Sequence
 
-from sqlalchemy import select, insert, delete, func
-from sqlalchemy.orm import subqueryload
+from sqlalchemy import select, insert, update, delete, func, and_, true, Row, Lateral, ColumnElement, Select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.sql.base import ReadOnlyColumnCollection
 
 from src.models import tables
-from .base import BaseRepository
+from src.models.state import TaskStatus
+from src.utils.compression import compress_text
+from .base import RankedRepository
 
+# Содержание задачи (tables.TaskContent) в строках задач, см. decompress_text
+CONTENT_COLUMNS = (
+    tables.TaskContent.data.label("task_content_data"),
+    tables.TaskContent.compressed.label("task_content_compressed"),
+)
 
-class TaskRepo(BaseRepository[tables.Task]):
+# Поля тегов и массивы, в которые они агрегируются
+TAG_ARRAYS = {
+    "id": "tag_ids",
+    "title": "tag_titles",
+    "created_at": "tag_created_ats",
+}
+
+
+@dataclass(frozen=True)
+class TaskProjection:
+    """
+    Поля задачи, которые выбираются запросом (sparse fieldsets)
+
+    id и position выбираются всегда: они нужны для порядка и курсора
+    """
+    columns: frozenset[str] = frozenset(column.key for column in tables.Task.__table__.columns)
+    tags: tuple[str, ...] = tuple(TAG_ARRAYS)
+    content: bool = False
+
+    def select_columns(self, source: ReadOnlyColumnCollection) -> list[ColumnElement]:
+        """
+        :param source: столбцы tasks или подзапроса задач
+        :return: выбранные столбцы
+        """
+        return [column for column in source if column.key in self.columns or column.key in ("id", "position")]
+
+    def task_columns(self, source: ReadOnlyColumnCollection) -> list[ColumnElement]:
+        """
+        :param source: столбцы tasks или подзапроса задач
+        :return: выбранные столбцы с метками task_*
+        """
+        return [column.label(f"task_{column.key}") for column in self.select_columns(source)]
+
+    def tag_columns(self) -> list[tuple[ColumnElement, str]]:
+        """
+        :return: выбранные столбцы тегов и метки их массивов
+        """
+        return [(getattr(tables.Tag, field), TAG_ARRAYS[field]) for field in self.tags]
+
+
+def aggregated_tags(task_id: ColumnElement, projection: TaskProjection = TaskProjection()) -> Lateral:
+    """
+    LATERAL подзапрос тегов задачи task_id, агрегированных в массивы
+    tag_ids, tag_titles, tag_created_ats (упорядочены по названию)
+
+    :param task_id: столбец id задачи внешнего запроса
+    :param projection: агрегируются только поля тегов projection.tags
+    :return:
+    """
+    tag_order = (tables.Tag.title, tables.Tag.id)
+    return select(*[
+        func.array_agg(aggregate_order_by(field, *tag_order)).label(label)
+        for field, label in projection.tag_columns()
+    ]).join(
+        tables.TaskTag, tables.TaskTag.tag_id == tables.Tag.id
+    ).where(
+        tables.TaskTag.task_id == task_id
+    ).lateral("task_tag")
+
+
+class TaskRepo(RankedRepository[tables.Task]):
+    """
+    Списки и карточки задач читаются строками (get_rows, get_row) с явным
+    набором столбцов, без создания ORM объектов; проверки доступа
+    и перемещения используют короткие ссылки get_ref
+
+    Содержание задачи хранится в отдельной таблице task_contents и
+    читается только get_row или по projection.content
+    """
     table = tables.Task
+    scope = "column_id"
+
+    def _rows(self, projection: TaskProjection = TaskProjection()) -> Select:
+        from_clause = self.table.__table__
+        columns = projection.task_columns(self.table.__table__.columns)
+        if projection.tags:
+            tags = aggregated_tags(self.table.id, projection)
+            from_clause = from_clause.outerjoin(tags, true())
+            columns.extend(tags.c)
 
-    async def get(self, **kwargs) -> tables.Task:
+        if projection.content:
+            from_clause = from_clause.outerjoin(
+                tables.TaskContent, tables.TaskContent.task_id == self.table.id
+            )
+            columns.extend(CONTENT_COLUMNS)
+
+        return select(*columns).select_from(from_clause)
+
+    async def get_rows(
+            self,
+            column_id: uuid.UUID,
+            limit: int | None = None,
+            after: tuple[str, uuid.UUID] | None = None,
+            projection: TaskProjection = TaskProjection(),
+    ) -> Sequence[Row]:
+        """
+        Страница задач колонки строками (см. RankedRepository._paginate)
+
+        :param column_id:
+        :param limit: размер страницы (None - все задачи)
+        :param after: (position, id) последней задачи предыдущей страницы
+        :param projection: выбираемые поля задач
+        :return: строки с полями task_*, tag_* и task_content_* из projection
+        """
+        stmt = self._paginate(self._rows(projection), column_id, limit, after)
+        return (await self._read_session.execute(stmt)).all()
+
+    async def get_row(self, task_id: uuid.UUID) -> Row | None:
+        """
+        Задача строкой вместе с содержанием и проектом колонки
+
+        :param task_id:
+        :return: строка с полями task_*, tag_*, task_content_* и project_id
+        """
+        stmt = self._rows(TaskProjection(content=True)).add_columns(
+            tables.Column.project_id
+        ).join(
+            tables.Column, tables.Column.id == self.table.column_id
+        ).where(self.table.id == task_id)
+        return (await self._read_session.execute(stmt)).first()
+
+    async def get_ref(self, **kwargs) -> Row | None:
+        """
+        Ссылка на задачу: id, column_id, child_id, position и project_id колонки
+
+        :param kwargs: filter by (столбцы задачи)
+        :return:
+        """
         stmt = select(
-            self.table
-        ).filter_by(**kwargs).options(subqueryload(self.table.column)).options(subqueryload(self.table.tags))
-        return (await self._session.execute(stmt)).scalars().first()
+            self.table.id,
+            self.table.column_id,
+            self.table.child_id,
+            self.table.position,
+            tables.Column.project_id,
+        ).join(
+            tables.Column, tables.Column.id == self.table.column_id
+        ).where(*[getattr(self.table, key) == value for key, value in kwargs.items()])
+        return (await self._read_session.execute(stmt)).first()
+
+    async def get_project_id(self, task_id: uuid.UUID) -> uuid.UUID | None:
+        """
+        Проект задачи одним скалярным запросом
+
+        :param task_id:
+        :return:
+        """
+        stmt = select(tables.Column.project_id).join(
+            self.table, self.table.column_id == tables.Column.id
+        ).where(self.table.id == task_id)
+        return (await self._read_session.execute(stmt)).scalar()
+
+    async def rebalance(self, scope_id: uuid.UUID) -> None:
+        """
+        Перераспределяет ключи позиций задач колонки и увеличивает
+        task_position_version колонки: курсоры, выданные до перебалансировки,
+        указывают на старые ключи и отклоняются (см. KanbanApplicationService.task_list)
+
+        :param scope_id: id колонки
+        :return:
+        """
+        await super().rebalance(scope_id)
+        await self._session.execute(
+            update(tables.Column).where(
+                tables.Column.id == scope_id
+            ).values(task_position_version=tables.Column.task_position_version + 1)
+        )
+        self._uow.mark_dirty()
+
+    @classmethod
+    def status_conditions(cls, status: TaskStatus) -> list:
+        """
+        Условия отбора задач по статусу
+
+        :param status:
+        :return: список условий для where
+        """
+        if status == TaskStatus.ACTIVE:
+            return [cls.table.start_time.isnot(None), cls.table.end_time.is_(None)]
+        if status == TaskStatus.DONE:
+            return [cls.table.start_time.isnot(None), cls.table.end_time.isnot(None)]
+        return []
 
     async def add_tag(self, task_id: uuid.UUID, tag_id: uuid.UUID) -> None:
         stmt = insert(tables.TaskTag).values(task_id=task_id, tag_id=tag_id)
         await self._session.execute(stmt)
-        await self._session.commit()
+        self._uow.mark_dirty()
 
     async def remove_tag(self, task_id: uuid.UUID, tag_id: uuid.UUID) -> None:
         stmt = delete(tables.TaskTag).where(tables.TaskTag.task_id == task_id).where(tables.TaskTag.tag_id == tag_id)
         await self._session.execute(stmt)
-        await self._session.commit()
+        self._uow.mark_dirty()
 
     async def has_tag(self, task_id: uuid.UUID, tag_id: uuid.UUID) -> bool:
         stmt = select(tables.TaskTag).where(tables.TaskTag.task_id == task_id).where(tables.TaskTag.tag_id == tag_id)
-        return (await self._session.execute(stmt)).scalars().first() is not None
-
-    async def create(self, **kwargs) -> tables.Task:
-        model = self.table(**kwargs)
-        self._session.add(model)
-        await self._session.commit()
-        return (await self.session.execute(select(self.table).filter_by(id=model.id).options(
-            subqueryload(self.table.tags)
-        ))).scalars().first()
-
-    async def active_count(self, project_id: uuid.UUID) -> int:
-        stmt = select(func.count(self.table.id)).join(
-            tables.Column
-        ).where(
-            tables.Column.project_id == project_id
-        ).where(
-            self.table.end_time.is_(None)
-        ).where(
-            self.table.start_time.isnot(None)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        return (await self._read_session.execute(stmt)).scalars().first() is not None
 
-    async def done_count(self, project_id: uuid.UUID) -> int:
-        stmt = select(func.count(self.table.id)).join(
-            tables.Column
-        ).where(
-            tables.Column.project_id == project_id
-        ).where(
-            self.table.end_time.isnot(None)
-        ).where(
-            self.table.start_time.isnot(None)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+    async def create(self, content: str | None = None, **kwargs) -> tables.Task:
+        task = await super().create(**kwargs)
+        if content:
+            await self.set_content(task.id, content)
+        return task
+
+    async def update(self, id: uuid.UUID, **kwargs) -> None:
+        if "content" in kwargs:
+            await self.set_content(id, kwargs.pop("content"))
+            kwargs["updated_at"] = func.now()
+        await super().update(id, **kwargs)
+
+    async def set_content(self, task_id: uuid.UUID, content: str | None) -> None:
+        """
+        Сохраняет содержание задачи (длинное - сжатым), пустое удаляет
+
+        :param task_id:
+        :param content:
+        :return:
+        """
+        if content:
+            data, compressed = compress_text(content)
+            stmt = pg_insert(tables.TaskContent).values(
+                task_id=task_id, data=data, compressed=compressed
+            ).on_conflict_do_update(
+                index_elements=[tables.TaskContent.task_id],
+                set_=dict(data=data, compressed=compressed),
+            )
+        else:
+            stmt = delete(tables.TaskContent).where(tables.TaskContent.task_id == task_id)
+
+        await self._session.execute(stmt)
+        self._uow.mark_dirty()
+
+    async def count_stat(self, project_id: uuid.UUID) -> list[dict]:
+        """
+        Количество задач и сумма story point по статусам для каждой колонки проекта
+
+        Все значения считаются за один проход по задачам через COUNT/SUM ... FILTER
 
-    async def all_count(self, project_id):
-        stmt = select(func.count(self.table.id)).join(
+        :param project_id:
+        :return: список словарей column_id, {status}_count, {status}_story_point
+        """
+        columns = [tables.Column.id.label("column_id")]
+        for status in TaskStatus:
+            count = func.count(self.table.id)
+            story_point = func.sum(self.table.story_point)
+            conditions = self.status_conditions(status)
+            if conditions:
+                count = count.filter(and_(*conditions))
+                story_point = story_point.filter(and_(*conditions))
+
+            columns.extend([
+                count.label(f"{status.value}_count"),
+                func.coalesce(story_point, 0).label(f"{status.value}_story_point"),
+            ])
+
+        stmt = select(*columns).select_from(
             tables.Column
+        ).outerjoin(
+            self.table, self.table.column_id == tables.Column.id
         ).where(
             tables.Column.project_id == project_id
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        ).group_by(
+            tables.Column.id, tables.Column.position
+        ).order_by(tables.Column.position)
+        return [dict(row) for row in (await self._read_session.execute(stmt)).mappings().all()]
@@ -0,0 +1,160 @@
+from functools import wraps
+
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction, async_sessionmaker
+
+
+class UnitOfWork:
+    """
+    Единица работы запроса
+
+    Репозитории не фиксируют изменения сами: все записи одного вызова
+    сервиса выполняются в одной транзакции и фиксируются одним commit
+    при выходе из самого внешнего блока `async with uow`.
+
+    Чтения вне транзакции сервиса направляются в реплику (если она
+    настроена), пока запрос ничего не записал; после первой записи
+    все чтения запроса идут в основную БД (read-your-writes).
+
+    Сессии открываются при первом обращении репозитория, а release
+    закрывает их и возвращает соединения в пул, не дожидаясь конца запроса.
+    """
+
+    def __init__(
+            self,
+            session_maker: async_sessionmaker[AsyncSession],
+            replica_session_maker: async_sessionmaker[AsyncSession] = None
+    ):
+        self._session_maker = session_maker
+        self._replica_session_maker = replica_session_maker
+        self._session: AsyncSession | None = None
+        self._replica_session: AsyncSession | None = None
+        self._depth = 0
+        self._is_dirty = False
+        self._has_written = False
+        self.commit_count = 0
+        self.session_count = 0
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_maker()
+            self.session_count += 1
+        return self._session
+
+    @property
+    def read_session(self) -> AsyncSession:
+        """
+        Сессия для чтения: реплика или основная БД (см. описание класса)
+        """
+        if self._replica_session_maker is None or self._depth or self._has_written:
+            return self.session
+
+        if self._replica_session is None:
+            self._replica_session = self._replica_session_maker()
+            self.session_count += 1
+        return self._replica_session
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    def mark_dirty(self) -> None:
+        """
+        Отмечает, что в текущей транзакции есть изменения
+        """
+        self._is_dirty = True
+        self._has_written = True
+
+    def savepoint(self) -> AsyncSessionTransaction:
+        """
+        Вложенная транзакция (SAVEPOINT) для частичного отката:
+
+            async with uow.savepoint():
+                ...
+        """
+        return self.session.begin_nested()
+
+    async def commit(self) -> None:
+        if self._is_dirty and self._session is not None:
+            await self._session.commit()
+            self._is_dirty = False
+            self.commit_count += 1
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+        self._is_dirty = False
+
+    async def release(self) -> None:
+        """
+        Закрывает открытые сессии и возвращает их соединения в пул
+
+        Внутри транзакции ничего не делает. Незафиксированные изменения
+        откатываются. Следующее обращение репозитория откроет новую сессию
+        """
+        if self._depth:
+            return
+
+        for session in (self._session, self._replica_session):
+            if session is not None:
+                await session.close()
+
+        self._session = None
+        self._replica_session = None
+        self._is_dirty = False
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.release()
+
+
+def transaction(func):
+    """
+    Unit of Work decorator for ApplicationServices
+    It is necessary that the class of the method being decorated has a field '_uow'
+
+    :param func: service method
+    :return: wrapper
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        service_class: object = args[0]
+        async with service_class.__getattribute__('_uow'):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def read_only(func):
+    """
+    Read-only decorator for ApplicationServices
+    Returns the database connections to the pool as soon as the method finishes
+    It is necessary that the class of the method being decorated has a field '_uow'
+
+    :param func: service method
+    :return: wrapper
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        service_class: object = args[0]
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            await service_class.__getattribute__('_uow').release()
+
+    return wrapper
@@ -6,9 +6,10 @@ from src import exceptions
 from src.config import Config
 from src.models import schemas
 from src.models.permission import Permission
-from src.models.state import UserState
-from src.services.auth import state_filter, permission_filter
-from src.services.repository import TagRepo, TaskRepo
+from src.models.state import UserState, TaskStatus
+from src.services.auth import state_filter, permission_filter, VerifiedTokenCache
+from src.services.project import ProjectServiceClient
+from src.services.repository import TagRepo, TaskRepo, UnitOfWork, read_only
 
 
 class StatsApplicationService:
@@ -17,14 +18,20 @@ class StatsApplicationService:
             self,
             current_user,
             config: Config,
+            project_service: ProjectServiceClient,
+            token_cache: VerifiedTokenCache | None,
             tag_repo: TagRepo,
             task_repo: TaskRepo,
+            uow: UnitOfWork,
             is_user_in_project: Callable[[UUID, UUID], Coroutine[Any, Any, bool]],
     ):
         self._current_user = current_user
         self._config = config
+        self._project_service = project_service
+        self._token_cache = token_cache
         self._tag_repo = tag_repo
         self._task_repo = task_repo
+        self._uow = uow
         self._is_user_in_project = is_user_in_project
 
     async def get_stats(self, details: bool = False) -> dict:
@@ -41,59 +48,64 @@ class StatsApplicationService:
             )
         return info
 
+    @state_filter(UserState.ACTIVE)
+    async def get_runtime_stats(self) -> dict:
+        """
+        Метрики кэшей сервиса, доступны только при включенном Config.RUNTIME_STATS
+
+        :return:
+        """
+        if not self._config.RUNTIME_STATS:
+            raise exceptions.NotFound("Статистика кэшей отключена")
+
+        return {
+            "project_service_cache": self._project_service.stats(),
+            "token_cache": self._token_cache.stats() if self._token_cache else None,
+        }
+
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_TASK)
-    async def get_tag_stat(self, project_id: UUID) -> list[schemas.TagStat]:
+    @read_only
+    async def get_tag_stat(
+            self,
+            project_id: UUID,
+            column_id: UUID = None,
+            status: TaskStatus = TaskStatus.ALL
+    ) -> list[schemas.TagStat]:
         if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        result = []
-
-        tags = await self._tag_repo.get_all(project_id=project_id)
-        if not tags:
-            return result
-
-        for tag in tags:
-            result.append(
-                schemas.TagStat(
-                    title=tag.title,
-                    count=await self._tag_repo.get_task_count(tag.id)
-                )
-            )
-        return result
+        return [
+            schemas.TagStat(id=tag_id, title=title, count=count)
+            for tag_id, title, count in await self._tag_repo.get_stat(project_id, column_id, status)
+        ]
 
     @state_filter(UserState.ACTIVE)
     @permission_filter(Permission.GET_TASK)
-    async def get_task_stat(self, project_id: UUID) -> list[schemas.TaskCountStat]:
+    @read_only
+    async def get_task_stat(self, project_id: UUID, by_column: bool = False) -> list[schemas.TaskCountStat]:
         if not await self._is_user_in_project(project_id, self._current_user.id):
             raise exceptions.AccessDenied("Доступ запрещен")
 
-        result = []
+        rows = await self._task_repo.count_stat(project_id=project_id)
 
-        all_task_count = await self._task_repo.all_count(project_id=project_id)
-        result.append(
+        result = [
             schemas.TaskCountStat(
-                status="all",
-                count=0 if not all_task_count else all_task_count
+                status=status.value,
+                count=sum(row[f"{status.value}_count"] for row in rows),
+                story_point=sum(row[f"{status.value}_story_point"] for row in rows),
             )
-        )
-
-        active_task_count = await self._task_repo.active_count(project_id=project_id)
-        result.append(
-            schemas.TaskCountStat(
-                status="active",
-                count=0 if not active_task_count else active_task_count
-            )
-        )
-
-        done_task_count = await self._task_repo.done_count(project_id=project_id)
-        result.append(
-            schemas.TaskCountStat(
-                status="done",
-                count=0 if not done_task_count else done_task_count
+            for status in TaskStatus
+        ]
+        if by_column:
+            result.extend(
+                schemas.TaskCountStat(
+                    status=status.value,
+                    count=row[f"{status.value}_count"],
+                    story_point=row[f"{status.value}_story_point"],
+                    column_id=row["column_id"],
+                )
+                for row in rows
+                for status in TaskStatus
             )
-        )
         return result
-
-
-
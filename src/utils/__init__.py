@@ -1,3 +1,10 @@
 from .openapi import custom_openapi
 from . import formators
 from . import validators
+from . import ordering
+from . import rank
+from . import cache
+from . import etag
+from . import cursor
+from . import serialization
+from . import compression
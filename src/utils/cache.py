@@ -0,0 +1,129 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterator
+
+
+class TTLCache:
+    """
+    Ограниченный по размеру LRU кэш с временем жизни записей
+
+    При переполнении вытесняется запись, к которой дольше всего не обращались
+    """
+
+    def __init__(self, maxsize: int, ttl: float = 60, clock: Callable[[], float] = time.monotonic):
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Возвращает значение по ключу или default, если записи нет или она устарела
+
+        :param key:
+        :param default:
+        :return:
+        """
+        item = self._data.get(key)
+        if item is not None:
+            expires_at, value = item
+            if expires_at > self._clock():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        """
+        Сохраняет значение
+
+        :param key:
+        :param value:
+        :param ttl: время жизни записи в секундах (по умолчанию - ttl кэша)
+        :return:
+        """
+        self._data[key] = (self._clock() + (self._ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Удаляет записи, ключи которых удовлетворяют predicate
+        """
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._data),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._data)
+
+
+class SingleFlight:
+    """
+    Объединяет одновременные вызовы с одинаковым ключом в один
+
+    Пока запрос по ключу выполняется, остальные вызовы ждут его результат
+    """
+
+    def __init__(self):
+        self._pending: dict[Hashable, asyncio.Task] = dict()
+
+    async def do(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Awaitable[Any]],
+            on_result: Callable[[Any], None] = None
+    ) -> Any:
+        """
+        :param key: ключ запроса
+        :param fetch: запрос
+        :param on_result: вызывается один раз с успешным результатом запроса
+        :return: результат запроса
+        """
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._done(key, task, on_result))
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task, on_result: Callable[[Any], None] | None) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        if on_result:
+            on_result(task.result())
@@ -0,0 +1,34 @@
+import zlib
+
+MIN_SIZE = 256
+LEVEL = 6
+
+
+def compress_text(text: str, min_size: int = MIN_SIZE) -> tuple[bytes, bool]:
+    """
+    Сжимает текст zlib, если он не короче min_size байт и сжатие дает выигрыш
+
+    :param text:
+    :param min_size: минимальный размер текста в UTF-8 для сжатия
+    :return: данные и признак сжатия
+    """
+    data = text.encode("utf-8")
+    if len(data) >= min_size:
+        compressed = zlib.compress(data, LEVEL)
+        if len(compressed) < len(data):
+            return compressed, True
+    return data, False
+
+
+def decompress_text(data: bytes | None, compressed: bool) -> str | None:
+    """
+    :param data: данные из compress_text
+    :param compressed: признак сжатия
+    :return: исходный текст или None, если данных нет
+    """
+    if data is None:
+        return None
+
+    if compressed:
+        data = zlib.decompress(data)
+    return bytes(data).decode("utf-8")
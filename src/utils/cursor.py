@@ -0,0 +1,36 @@
+import base64
+import binascii
+import json
+import uuid
+
+
+def encode_cursor(position: str, id: uuid.UUID, version: int) -> str:
+    """
+    Курсор постраничной выборки по порядку доски
+
+    Курсор хранит ключ позиции и id последней записи страницы, а не ее
+    номер, поэтому вставки и удаления не сдвигают следующие страницы.
+    Перебалансировка переписывает все ключи области, поэтому в курсоре
+    хранится и версия ключей области: курсор со старой версией устарел
+
+    :param position: ключ позиции последней записи
+    :param id: id последней записи
+    :param version: версия ключей позиций области
+    :return: непрозрачная строка
+    """
+    raw = json.dumps([position, str(id), version], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, uuid.UUID, int]:
+    """
+    :param cursor: строка, полученная из encode_cursor
+    :return: ключ позиции, id и версия ключей области
+    :raises ValueError: курсор поврежден
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position, id, version = json.loads(raw)
+        return str(position), uuid.UUID(id), int(version)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as error:
+        raise ValueError("Некорректный курсор") from error
@@ -0,0 +1,41 @@
+from fastapi import Response
+from fastapi import status as http_status
+
+from src.version import __version__
+
+
+def make_etag(version: int) -> str:
+    """
+    Строгий ETag версии доски
+
+    Версия приложения входит в ETag, чтобы после обновления формата
+    ответа клиенты не получали 304 на старое представление
+
+    :param version: версия доски
+    :return:
+    """
+    return f'"{__version__}-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Проверяет заголовок If-None-Match (слабое сравнение, RFC 9110 13.1.2)
+
+    :param if_none_match: значение заголовка
+    :param etag:
+    :return:
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -27,3 +27,15 @@ def tokenize(string: str) -> list[str]:
     string = re.sub(r'[\s_-]+', ' ', string)
     string = re.sub(r'^-+|-+$', '', string)
     return string.split()
+
+
+def split_list(string: str | None) -> list[str] | None:
+    """
+    Функция для разбора списка значений через запятую (fields=id,title)
+
+    :param string:
+    :return: None, если строка не передана
+    """
+    if string is None:
+        return None
+    return [item.strip() for item in string.split(",") if item.strip()]
@@ -0,0 +1,103 @@
+import logging
+from typing import Any, Callable, Hashable, Iterable, TypeVar
+
+T = TypeVar('T')
+
+
+def _get_id(node) -> Hashable:
+    return node.id
+
+
+def _get_child_id(node) -> Hashable | None:
+    return node.child_id
+
+
+def sort_by_chain(
+        nodes: Iterable[T],
+        *,
+        key: Callable[[T], Any] = None,
+        get_id: Callable[[T], Hashable] = _get_id,
+        get_child_id: Callable[[T], Hashable | None] = _get_child_id,
+) -> list[T]:
+    """
+    Сортирует элементы по цепочке child_id за O(n)
+
+    Индекс id -> элемент строится один раз, после чего цепочка проходится
+    от головы (элемента, на который никто не ссылается) до хвоста.
+
+    Основная цепочка - самая длинная (при равной длине - первая по key).
+    Элементы, не попавшие в нее (разрыв цепочки, цикл, несколько голов),
+    не теряются: они добавляются в конец в детерминированном порядке -
+    сначала оставшиеся головы со своими цепочками, затем элементы циклов.
+    Порядок среди них задает key (по умолчанию - порядок входа).
+
+    :param nodes: элементы с полями id и child_id
+    :param key: ключ сортировки для разрешения неоднозначностей
+    :param get_id: функция получения id элемента
+    :param get_child_id: функция получения child_id элемента
+    :return: отсортированный список
+    """
+    nodes = list(nodes)
+    if not nodes:
+        return nodes
+
+    if key is not None:
+        nodes.sort(key=key)
+
+    index = {}
+    for node in nodes:
+        index.setdefault(get_id(node), node)
+
+    referenced = set()
+    for node in index.values():
+        child_id = get_child_id(node)
+        if child_id is not None and child_id != get_id(node):
+            referenced.add(child_id)
+
+    heads = [node for node in index.values() if get_id(node) not in referenced]
+
+    # Длина цепочки от каждого элемента, цепочки разных голов могут сливаться
+    lengths = {}
+    for head in heads:
+        path, path_ids = [], set()
+        node = head
+        while node is not None and get_id(node) not in lengths and get_id(node) not in path_ids:
+            path.append(node)
+            path_ids.add(get_id(node))
+            node = index.get(get_child_id(node))
+        length = lengths.get(get_id(node), 0) if node is not None else 0
+        for node in reversed(path):
+            length += 1
+            lengths[get_id(node)] = length
+
+    if heads:
+        main = max(heads, key=lambda node: lengths[get_id(node)])
+        heads.remove(main)
+        heads.insert(0, main)
+
+    result = []
+    visited = set()
+
+    def walk(node: T) -> None:
+        while node is not None:
+            node_id = get_id(node)
+            if node_id in visited:
+                return
+            visited.add(node_id)
+            result.append(node)
+            node = index.get(get_child_id(node))
+
+    for head in heads:
+        walk(head)
+
+    if len(result) != len(index):
+        # Остались только элементы циклов
+        for node in index.values():
+            walk(node)
+
+    if len(heads) != 1 or len(result) != len(nodes):
+        logging.warning(
+            "Нарушена цепочка child_id: голов %d, элементов %d, дубликатов %d",
+            len(heads), len(index), len(nodes) - len(index)
+        )
+    return result
@@ -0,0 +1,101 @@
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# При превышении длины ключа позиции области пересчитываются заново
+MAX_KEY_LENGTH = 48
+# Разрядность шага при вставке в начало или конец списка
+STEP_WIDTH = 4
+
+
+def key_between(before: str | None, after: str | None) -> str:
+    """
+    Возвращает ключ позиции, лежащий строго между before и after
+
+    Ключи - дробные числа в системе счисления по основанию 62, записанные
+    без "0." и без завершающих нулей, поэтому они сравниваются как обычные
+    строки (в БД - с collation "C").
+
+    :param before: ключ предыдущего элемента (None - начало списка)
+    :param after: ключ следующего элемента (None - конец списка)
+    :return: новый ключ
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Ключ {before!r} должен быть меньше {after!r}")
+
+    if after is None and before is not None:
+        return _successor(before)
+    if before is None and after is not None:
+        return _predecessor(after)
+    return _midpoint(before or "", after)
+
+
+def spread_keys(count: int) -> list[str]:
+    """
+    Возвращает count равномерно распределенных ключей одинаковой длины
+
+    Используется при первичном заполнении и перебалансировке позиций.
+
+    :param count: количество ключей
+    :return: возрастающий список ключей
+    """
+    width = 1
+    while BASE ** width <= count * 2:
+        width += 1
+
+    step = BASE ** width // (count + 1)
+    return [_encode(step * (i + 1), width) for i in range(count)]
+
+
+def needs_rebalance(key: str) -> bool:
+    return len(key) > MAX_KEY_LENGTH
+
+
+def _successor(key: str) -> str:
+    # Шаг в младшем разряде вместо деления интервала пополам, поэтому
+    # последовательные вставки в конец почти не удлиняют ключ
+    width = max(len(key), STEP_WIDTH)
+    value = _decode(key, width) + 1
+    if value >= BASE ** width:
+        return key + DIGITS[BASE // 2]
+    return _encode(value, width)
+
+
+def _predecessor(key: str) -> str:
+    width = max(len(key), STEP_WIDTH)
+    value = _decode(key, width) - 1
+    if value <= 0:
+        return _midpoint("", key)
+    return _encode(value, width)
+
+
+def _midpoint(before: str, after: str | None) -> str:
+    if after is not None:
+        n = 0
+        while (before[n] if n < len(before) else DIGITS[0]) == after[n]:
+            n += 1
+        if n > 0:
+            return after[:n] + _midpoint(before[n:], after[n:])
+
+    digit_before = DIGITS.index(before[0]) if before else 0
+    digit_after = DIGITS.index(after[0]) if after is not None else BASE
+    if digit_after - digit_before > 1:
+        return DIGITS[(digit_before + digit_after + 1) // 2]
+
+    if after is not None and len(after) > 1:
+        return after[:1]
+    return DIGITS[digit_before] + _midpoint(before[1:], None)
+
+
+def _encode(value: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        chars.append(DIGITS[digit])
+    return "".join(reversed(chars)).rstrip(DIGITS[0])
+
+
+def _decode(key: str, width: int) -> int:
+    value = 0
+    for char in key.ljust(width, DIGITS[0]):
+        value = value * BASE + DIGITS.index(char)
+    return value
@@ -0,0 +1,59 @@
+import dataclasses
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Сериализует записи (src.models.records), словари и списки в JSON за один проход
+
+    Формат UUID и datetime совпадает с pydantic (UTC - с суффиксом Z).
+    Без orjson используется стандартный json
+
+    :param content:
+    :return: UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    JSON ответ без валидации response_model и промежуточного jsonable_encoder
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_serialization(request: Request, endpoint: str) -> bool:
+    """
+    Включен ли быстрый путь сериализации для endpoint (Config.FAST_SERIALIZATION)
+
+    :param request:
+    :param endpoint: имя endpoint, например "board"
+    :return:
+    """
+    return endpoint in request.app.state.config.FAST_SERIALIZATION
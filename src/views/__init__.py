@@ -2,6 +2,7 @@ from .base import BaseView
 
 from .column import ColumnResponse
 from .column import ColumnsResponse
+from .column import ColumnPreviewsResponse
 
 from .task import TaskResponse
 from .task import TasksResponse
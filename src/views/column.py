@@ -8,3 +8,7 @@ class ColumnResponse(BaseView):
 
 class ColumnsResponse(BaseView):
     content: list[schemas.Column]
+
+
+class ColumnPreviewsResponse(BaseView):
+    content: list[schemas.ColumnPreview]
@@ -8,6 +8,7 @@ class TaskResponse(BaseView):
 
 class TasksResponse(BaseView):
     content: list[schemas.Task]
+    next_cursor: str | None = None
 
 
 class TagResponse(BaseView):
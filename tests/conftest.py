@@ -0,0 +1,274 @@
+import os
+import types
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import grpc
+import pytest
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, make_url, text, URL, NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
+
+from src.db import instrument
+from src.dependencies.services import get_services
+from src.exceptions import APIError, handle_api_error, handle_404_error, handle_pydantic_error
+from src.models.auth import AuthenticatedUser
+from src.models.permission import Permission
+from src.models.state import UserState
+from src.router import register_api_router
+from src.services import ServiceFactory
+from src.models import tables
+from src.services.repository import TaskProjection, UnitOfWork, RepoFactory
+from src.utils.rank import spread_keys
+
+ROOT = Path(__file__).parent.parent
+
+
+class Row(dict):
+    """
+    Строка результата запроса (Row._asdict())
+    """
+
+    def _asdict(self) -> dict:
+        return self
+
+
+def make_board_rows(columns: int = 2, tasks: int = 2) -> list[Row]:
+    """
+    Строки ColumnRepo.get_board со всеми полями задач и тегов
+    """
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    tag = (uuid.uuid4(), "tag", now)
+    rows = []
+    for column in range(columns):
+        column_id = uuid.uuid4()
+        for i in range(tasks):
+            rows.append(Row(
+                column_id=column_id,
+                column_title=f"column {column}",
+                column_project_id=uuid.uuid4(),
+                column_child_id=None,
+                column_wip_limit=None,
+                column_position=f"a{column}",
+                column_task_position_version=0,
+                column_created_at=now,
+                column_updated_at=None,
+                task_id=uuid.uuid4(),
+                task_title=f"task {i}",
+                task_color="#ffffff",
+                task_content_data=b"content",
+                task_content_compressed=False,
+                task_story_point=1,
+                task_start_time=None,
+                task_end_time=None,
+                task_executor_id=None,
+                task_column_id=column_id,
+                task_child_id=None,
+                task_position=f"a{i}",
+                task_created_at=now,
+                task_updated_at=None,
+                tag_ids=[tag[0]],
+                tag_titles=[tag[1]],
+                tag_created_ats=[tag[2]],
+            ))
+    return rows
+
+
+class FakeColumnRepo:
+    def __init__(self, rows: list[Row]):
+        self.rows = rows
+        self.projections: list[TaskProjection] = []
+
+    async def get_board(self, project_id, projection: TaskProjection = TaskProjection()) -> list[Row]:
+        self.projections.append(projection)
+        return self.rows
+
+
+class FakeBoardVersionRepo:
+    async def get_version(self, project_id) -> int:
+        return 1
+
+
+class FakeUnitOfWork:
+    async def release(self) -> None:
+        pass
+
+
+class FakeProjectService:
+    async def is_user_in_project(self, project_id, user_id, exp: int) -> bool:
+        return True
+
+
+@pytest.fixture
+def user() -> AuthenticatedUser:
+    return AuthenticatedUser(
+        id=str(uuid.uuid4()),
+        username="user",
+        permissions=[permission.value for permission in Permission],
+        state_id=UserState.ACTIVE.value,
+        exp=2 ** 31,
+    )
+
+
+@pytest.fixture
+def column_repo() -> FakeColumnRepo:
+    return FakeColumnRepo(make_board_rows())
+
+
+@pytest.fixture
+def app(user, column_repo) -> FastAPI:
+    """
+    Приложение с маршрутами и обработчиками ошибок src.app, но без Consul,
+    JWTMiddleware и БД: сервисы работают с FakeColumnRepo
+    """
+    app = FastAPI()
+    app.state.config = types.SimpleNamespace(FAST_SERIALIZATION=frozenset())
+    app.include_router(register_api_router(is_debug=False))
+    app.add_exception_handler(APIError, handle_api_error)
+    app.add_exception_handler(404, handle_404_error)
+    app.add_exception_handler(RequestValidationError, handle_pydantic_error)
+
+    repos = types.SimpleNamespace(
+        column=column_repo,
+        task=None,
+        tag=None,
+        board_version=FakeBoardVersionRepo(),
+        uow=FakeUnitOfWork(),
+    )
+
+    async def services():
+        yield ServiceFactory(
+            repos,
+            current_user=user,
+            config=app.state.config,
+            project_service=FakeProjectService(),
+        )
+
+    app.dependency_overrides[get_services] = services
+    return app
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+async def grpc_server():
+    """
+    Запуск gRPC сервера в процессе теста: start(add_servicer_to_server, servicer) -> адрес
+    """
+    servers = []
+
+    async def start(add_servicer_to_server, servicer) -> str:
+        server = grpc.aio.server()
+        add_servicer_to_server(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        servers.append(server)
+        return f"127.0.0.1:{port}"
+
+    yield start
+    for server in servers:
+        await server.stop(None)
+
+
+@pytest.fixture(scope="session")
+def database_url() -> URL:
+    """
+    Тестовая БД PostgreSQL из TEST_DATABASE_URL, ее схема public пересоздается
+    """
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL не задан")
+    return make_url(url)
+
+
+@pytest.fixture(scope="session")
+def migrated_database(database_url) -> URL:
+    """
+    Пустая БД со всеми миграциями
+    """
+    engine = create_engine(database_url.set(drivername="postgresql+psycopg2"), poolclass=NullPool)
+    with engine.connect() as connection:
+        connection.execute(text("DROP SCHEMA IF EXISTS public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+        connection.commit()
+
+        config = AlembicConfig()
+        config.set_main_option("script_location", str(ROOT / "migrations"))
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+        connection.commit()
+    engine.dispose()
+    return database_url
+
+
+@pytest.fixture
+async def db_engine(migrated_database) -> AsyncEngine:
+    engine = create_async_engine(migrated_database.set(drivername="postgresql+asyncpg"), poolclass=NullPool)
+    instrument(engine)
+    async with engine.begin() as connection:
+        table_names = ", ".join(table.name for table in tables.Base.metadata.sorted_tables)
+        await connection.execute(text(f"TRUNCATE {table_names}"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def uow(db_engine) -> UnitOfWork:
+    uow = UnitOfWork(async_sessionmaker(db_engine, expire_on_commit=False))
+    yield uow
+    await uow.release()
+
+
+def make_services(uow: UnitOfWork, user: AuthenticatedUser) -> ServiceFactory:
+    """
+    Сервисы с репозиториями на БД, пользователь состоит во всех проектах
+    """
+    return ServiceFactory(RepoFactory(uow), current_user=user, config=None, project_service=FakeProjectService())
+
+
+async def create_board(
+        engine: AsyncEngine,
+        columns: int,
+        tasks: int,
+        tags: int = 3,
+        content: str = None
+) -> uuid.UUID:
+    """
+    Создает доску проекта: columns колонок по tasks задач, у каждой задачи tags тегов
+
+    :return: id проекта
+    """
+    project_id = uuid.uuid4()
+    project_tags = [tables.Tag(id=uuid.uuid4(), title=f"tag {i}", project_id=project_id) for i in range(tags)]
+    objects = [*project_tags]
+    column_ids = [uuid.uuid4() for _ in range(columns)]
+    for column_id, child_id, column_position in zip(column_ids, [*column_ids[1:], None], spread_keys(columns)):
+        objects.append(tables.Column(
+            id=column_id, title="column", project_id=project_id, child_id=child_id, position=column_position
+        ))
+        task_ids = [uuid.uuid4() for _ in range(tasks)]
+        for task_id, task_child_id, position in zip(task_ids, [*task_ids[1:], None], spread_keys(tasks)):
+            objects.append(tables.Task(
+                id=task_id, title="task", color="#ffffff", story_point=1, column_id=column_id,
+                child_id=task_child_id, position=position,
+            ))
+            objects.extend(tables.TaskTag(task_id=task_id, tag_id=tag.id) for tag in project_tags)
+            if content:
+                objects.append(tables.TaskContent(task_id=task_id, data=content.encode()))
+
+    session_maker = async_sessionmaker(engine)
+    async with session_maker() as session:
+        # Порядок вставки по внешним ключам: у TaskTag и TaskContent нет relationship
+        for table in (tables.Tag, tables.Column, tables.Task, tables.TaskTag, tables.TaskContent):
+            session.add_all(obj for obj in objects if isinstance(obj, table))
+            await session.flush()
+        await session.commit()
+    return project_id
@@ -0,0 +1,17 @@
+import uuid
+
+import pytest
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_board_is_column_list(app, client, column_repo, fast):
+    app.state.config.FAST_SERIALIZATION = frozenset({"board", "column_list"} if fast else ())
+    params = dict(project_id=str(uuid.uuid4()), include="content")
+
+    board = client.get("/board", params=params)
+    columns = client.get("/column/list", params=params)
+
+    assert board.status_code == columns.status_code == 200
+    assert board.json() == columns.json()
+    assert len(board.json()["content"]) == 2
+    assert [projection.content for projection in column_repo.projections] == [True, True]
@@ -0,0 +1,65 @@
+import uuid
+
+import pytest
+
+URL = "/column/list"
+
+
+def get_columns(client, **params):
+    return client.get(URL, params=dict(project_id=str(uuid.uuid4()), **params))
+
+
+def test_fields_and_exclude(client, column_repo):
+    response = get_columns(client, fields="title,color,tags", exclude="color,tags.created_at")
+
+    assert response.status_code == 200
+    tasks = [task for column in response.json()["content"] for task in column["tasks"]]
+    assert tasks
+    for task in tasks:
+        assert set(task) == {"id", "title", "tags"}
+        assert all(set(tag) == {"id", "title"} for tag in task["tags"])
+
+    projection = column_repo.projections[-1]
+    assert projection.columns == frozenset({"title"})
+    assert projection.tags == ("id", "title")
+    assert not projection.content
+
+
+def test_exclude_all_fields_keeps_id(client):
+    response = get_columns(client, fields="title", exclude="title")
+
+    assert response.status_code == 200
+    tasks = [task for column in response.json()["content"] for task in column["tasks"]]
+    assert all(task.keys() == {"id"} for task in tasks)
+
+
+@pytest.mark.parametrize("params", [
+    dict(fields="title,unknown"),
+    dict(exclude="unknown"),
+    dict(fields="tags.unknown"),
+])
+def test_unknown_field(client, column_repo, params):
+    response = get_columns(client, **params)
+
+    assert response.status_code == 400
+    assert "unknown" in response.json()["error"]["content"]
+    assert not column_repo.projections
+
+
+@pytest.mark.parametrize("fields", ["", ",", " , "])
+def test_empty_fields(client, column_repo, fields):
+    response = get_columns(client, fields=fields)
+
+    assert response.status_code == 400
+    assert not column_repo.projections
+
+
+def test_empty_exclude_selects_all_fields(client):
+    response = get_columns(client, exclude="")
+
+    assert response.status_code == 200
+    task = response.json()["content"][0]["tasks"][0]
+    assert set(task) == {
+        "id", "title", "color", "story_point", "start_time", "end_time", "executor_id",
+        "column_id", "child_id", "tags", "created_at", "updated_at",
+    }
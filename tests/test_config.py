@@ -0,0 +1,55 @@
+import types
+
+import pytest
+
+from src import config as config_module
+from src.config import load_consul_config
+
+
+class KV:
+    """
+    Хранилище ключей Consul: get(path) -> (index, {"Value": bytes})
+    """
+
+    def __init__(self, values: dict[str, str]):
+        self.values = values
+
+    def get(self, path: str):
+        value = self.values.get(path)
+        return None, None if value is None else {"Value": value.encode()}
+
+
+@pytest.fixture
+def load(monkeypatch):
+    for name in ("UMS_GRPC_PORT", "PROJECT_SERVICE_GRPC_PORT"):
+        monkeypatch.setenv(name, "50051")
+
+    def load(values: dict[str, str]):
+        kv = KV({f"kanban/{key}": value for key, value in values.items()})
+        monkeypatch.setattr(config_module.consul, "Consul", lambda **kwargs: types.SimpleNamespace(kv=kv))
+        return load_consul_config("kanban")
+
+    return load
+
+
+def test_pool_defaults(load):
+    db = load({}).DB
+
+    assert (db.POOL.SIZE, db.POOL.MAX_OVERFLOW, db.POOL.TIMEOUT, db.POOL.RECYCLE) == (5, 10, 30.0, 1800)
+    assert (db.STATEMENT_CACHE_SIZE, db.STATEMENT_TIMEOUT_MS) == (100, 30000)
+
+
+def test_pool_values_are_numbers(load):
+    db = load({
+        "DATABASE/POOL/SIZE": "20",
+        "DATABASE/POOL/MAX_OVERFLOW": "0",
+        "DATABASE/POOL/TIMEOUT": "2.5",
+        "DATABASE/POOL/RECYCLE": "-1",
+        "DATABASE/STATEMENT_CACHE_SIZE": "0",
+        "DATABASE/STATEMENT_TIMEOUT_MS": "1500",
+    }).DB
+
+    assert (db.POOL.SIZE, db.POOL.MAX_OVERFLOW, db.POOL.TIMEOUT, db.POOL.RECYCLE) == (20, 0, 2.5, -1)
+    assert type(db.POOL.RECYCLE) is int
+    assert type(db.POOL.TIMEOUT) is float
+    assert (db.STATEMENT_CACHE_SIZE, db.STATEMENT_TIMEOUT_MS) == (0, 1500)
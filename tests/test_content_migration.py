@@ -0,0 +1,24 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from src.utils.compression import compress_text, decompress_text
+
+MIGRATION = Path(__file__).parent.parent / "migrations" / "versions" / "8c4b2e7d1f93_moved_task_content.py"
+
+
+@pytest.fixture(scope="module")
+def migration():
+    spec = importlib.util.spec_from_file_location("moved_task_content", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("text", ["", "short", "Описание задачи " * 100, "a" * 10000])
+def test_migrated_content_is_readable(migration, text):
+    data, compressed = migration.compress_text(text)
+
+    assert decompress_text(data, compressed) == text
+    assert migration.decompress_text(*compress_text(text)) == text
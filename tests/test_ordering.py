@@ -0,0 +1,103 @@
+import importlib.util
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import ordering
+
+MIGRATION = Path(__file__).parent.parent / "migrations" / "versions" / "b7e2c41d9a53_added_position_rank.py"
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("added_position_rank", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module", params=["module", "migration"])
+def sort_by_chain(request):
+    """
+    src.utils.ordering.sort_by_chain и ее замороженная копия в миграции b7e2c41d9a53
+    """
+    if request.param == "module":
+        return ordering.sort_by_chain
+    return load_migration().sort_by_chain
+
+
+def make_rows(chains: list[list[int]], created: list[int] = None) -> list[SimpleNamespace]:
+    """
+    Строки с цепочками child_id; created - порядок создания (по умолчанию - по id)
+    """
+    order = {id_: i for i, id_ in enumerate(created or sorted(id_ for chain in chains for id_ in chain))}
+    start = datetime(2026, 1, 1)
+    rows = []
+    for chain in chains:
+        for id_, child_id in zip(chain, [*chain[1:], None]):
+            rows.append(SimpleNamespace(
+                id=id_, child_id=child_id, created_at=start + timedelta(seconds=order[id_])
+            ))
+    random.shuffle(rows)
+    return rows
+
+
+def sort_ids(sort_by_chain, rows) -> list[int]:
+    return [row.id for row in sort_by_chain(rows, key=lambda row: (row.created_at, row.id))]
+
+
+def test_single_chain(sort_by_chain):
+    assert sort_ids(sort_by_chain, make_rows([[5, 3, 1, 4, 2]])) == [5, 3, 1, 4, 2]
+
+
+def test_older_orphan_goes_after_main_chain(sort_by_chain):
+    rows = make_rows([[9], [1, 2, 3]], created=[9, 1, 2, 3])
+
+    assert sort_ids(sort_by_chain, rows) == [1, 2, 3, 9]
+
+
+def test_other_heads_follow_in_creation_order(sort_by_chain):
+    rows = make_rows([[7, 8], [1, 2, 3], [5, 6]], created=[7, 8, 5, 6, 1, 2, 3])
+
+    assert sort_ids(sort_by_chain, rows) == [1, 2, 3, 7, 8, 5, 6]
+
+
+def test_equal_chains_keep_creation_order(sort_by_chain):
+    rows = make_rows([[4, 5], [1, 2]], created=[4, 5, 1, 2])
+
+    assert sort_ids(sort_by_chain, rows) == [4, 5, 1, 2]
+
+
+def test_merged_chains(sort_by_chain):
+    # 9 ссылается на середину основной цепочки
+    rows = make_rows([[1, 2, 3, 4]], created=[9, 1, 2, 3, 4])
+    rows.append(SimpleNamespace(id=9, child_id=3, created_at=datetime(2025, 1, 1)))
+
+    assert sort_ids(sort_by_chain, rows) == [1, 2, 3, 4, 9]
+
+
+def test_cycle_is_not_lost(sort_by_chain):
+    rows = make_rows([[1, 2]])
+    start = datetime(2026, 2, 1)
+    rows += [
+        SimpleNamespace(id=10, child_id=11, created_at=start),
+        SimpleNamespace(id=11, child_id=10, created_at=start + timedelta(seconds=1)),
+    ]
+
+    assert sort_ids(sort_by_chain, rows) == [1, 2, 10, 11]
+
+
+def test_long_chain_is_linear(sort_by_chain):
+    ids = list(range(50_000))
+    rows = make_rows([ids], created=list(reversed(ids)))
+
+    assert sort_ids(sort_by_chain, rows) == ids
+
+
+def test_custom_accessors():
+    nodes = [dict(key=3, next=None), dict(key=1, next=2), dict(key=2, next=3)]
+
+    result = ordering.sort_by_chain(nodes, get_id=lambda node: node["key"], get_child_id=lambda node: node["next"])
+    assert [node["key"] for node in result] == [1, 2, 3]
@@ -0,0 +1,19 @@
+import pytest
+
+from src.utils import rank
+from tests.test_ordering import load_migration
+
+
+@pytest.fixture(scope="module")
+def migration():
+    return load_migration()
+
+
+@pytest.mark.parametrize("count", [1, 2, 30, 31, 1000])
+def test_spread_keys(migration, count):
+    keys = migration.spread_keys(count)
+
+    assert len(keys) == count
+    assert keys == sorted(keys)
+    assert len(set(keys)) == count
+    assert keys == rank.spread_keys(count)
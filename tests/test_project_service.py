@@ -0,0 +1,255 @@
+import asyncio
+import time
+import types
+import uuid
+
+import grpc
+import pytest
+
+from src.protos.project_control import project_control_pb2
+from src.protos.project_control import project_control_pb2_grpc
+from src.services import project
+from src.services.channels import ChannelPool
+from src.services.project import MembershipCache, UserProjectsCache, ProjectServiceClient
+
+
+class ProjectService(project_control_pb2_grpc.ProjectServiceServicer):
+    """
+    Сервис проектов: members - пары (project_id, user_id), projects - проекты пользователей
+    """
+
+    def __init__(self, members=(), projects=None, user_projects_implemented: bool = True):
+        self.members = set(members)
+        self.projects = projects or {}
+        self.user_projects_implemented = user_projects_implemented
+        self.membership_calls = 0
+        self.user_projects_calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def IsUserInProject(self, request, context):
+        self.membership_calls += 1
+        await self.release.wait()
+        return project_control_pb2.IsUserInProjectReply(
+            result=(uuid.UUID(request.project_id), uuid.UUID(request.user_id)) in self.members
+        )
+
+    async def GetUserProjects(self, request, context):
+        self.user_projects_calls += 1
+        if not self.user_projects_implemented:
+            await context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not implemented!")
+        return project_control_pb2.UserProjectsReply(
+            project_ids=[str(project_id) for project_id in self.projects.get(uuid.UUID(request.user_id), ())]
+        )
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+async def start_service(grpc_server):
+    pools = []
+
+    async def start(service: ProjectService, size: int = 1) -> ChannelPool:
+        target = await grpc_server(project_control_pb2_grpc.add_ProjectServiceServicer_to_server, service)
+        pool = ChannelPool(target, size=size)
+        pools.append(pool)
+        return pool
+
+    yield start
+    for pool in pools:
+        await pool.close()
+
+
+async def check(pool: ChannelPool, cache: MembershipCache, project_id, user_id) -> bool:
+    return await project.is_user_in_project(project_id, user_id, channel=pool.get(), cache=cache)
+
+
+async def test_membership_ttl(start_service, clock):
+    project_id, member, stranger = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, member)})
+    pool = await start_service(service)
+    cache = MembershipCache(positive_ttl=60, negative_ttl=5, clock=clock)
+
+    assert await check(pool, cache, project_id, member)
+    assert not await check(pool, cache, project_id, stranger)
+    assert service.membership_calls == 2
+
+    clock.now += 4
+    assert await check(pool, cache, project_id, member)
+    assert not await check(pool, cache, project_id, stranger)
+    assert service.membership_calls == 2
+
+    # Отрицательный ответ живет negative_ttl, положительный - positive_ttl
+    clock.now += 2
+    assert not await check(pool, cache, project_id, stranger)
+    assert await check(pool, cache, project_id, member)
+    assert service.membership_calls == 3
+
+    clock.now += 60
+    assert await check(pool, cache, project_id, member)
+    assert service.membership_calls == 4
+
+
+async def test_membership_lru_eviction(start_service, clock):
+    project_id = uuid.uuid4()
+    users = [uuid.uuid4() for _ in range(3)]
+    service = ProjectService(members={(project_id, user_id) for user_id in users})
+    pool = await start_service(service)
+    cache = MembershipCache(maxsize=2, clock=clock)
+
+    await check(pool, cache, project_id, users[0])
+    await check(pool, cache, project_id, users[1])
+    await check(pool, cache, project_id, users[0])
+    await check(pool, cache, project_id, users[2])
+    assert service.membership_calls == 3
+
+    # Вытеснен users[1], к которому дольше всего не обращались
+    await check(pool, cache, project_id, users[0])
+    assert service.membership_calls == 3
+    await check(pool, cache, project_id, users[1])
+    assert service.membership_calls == 4
+    assert cache.stats()["size"] == 2
+
+
+async def test_membership_single_flight(start_service, clock):
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, user_id)})
+    service.release.clear()
+    pool = await start_service(service, size=2)
+    cache = MembershipCache(clock=clock)
+
+    checks = [asyncio.create_task(check(pool, cache, project_id, user_id)) for _ in range(20)]
+    while service.membership_calls == 0:
+        await asyncio.sleep(0.01)
+    service.release.set()
+
+    assert await asyncio.gather(*checks) == [True] * 20
+    assert service.membership_calls == 1
+
+
+async def test_membership_errors_are_not_cached(start_service, clock):
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, user_id)})
+    pool = await start_service(service)
+    cache = MembershipCache(clock=clock)
+
+    server_stopped = ChannelPool("127.0.0.1:1")
+    try:
+        assert not await check(server_stopped, cache, project_id, user_id)
+    finally:
+        await server_stopped.close()
+
+    assert await check(pool, cache, project_id, user_id)
+    assert service.membership_calls == 1
+
+
+def make_client(pool: ChannelPool, clock: Clock) -> ProjectServiceClient:
+    return ProjectServiceClient(
+        channels=pool,
+        membership_cache=MembershipCache(clock=clock),
+        user_projects_cache=UserProjectsCache(clock=clock),
+    )
+
+
+async def test_user_projects(start_service, clock):
+    project_id, other_project_id, user_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(other_project_id, user_id)}, projects={user_id: [project_id]})
+    client = make_client(await start_service(service), clock)
+    exp = int(time.time()) + 60
+
+    for _ in range(3):
+        assert await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert service.user_projects_calls == 1
+    assert service.membership_calls == 0
+
+    # Проекта нет во множестве (например, пользователь добавлен позже) - IsUserInProject
+    assert await client.is_user_in_project(other_project_id, user_id, exp=exp)
+    assert service.membership_calls == 1
+
+
+async def test_user_projects_expire_with_membership_ttl(start_service, clock):
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, user_id)}, projects={user_id: [project_id]})
+    client = make_client(await start_service(service), clock)
+    exp = int(time.time()) + 3600
+
+    assert await client.is_user_in_project(project_id, user_id, exp=exp)
+
+    # Пользователь исключен из проекта: множество живет не дольше положительного ответа
+    service.members.clear()
+    service.projects.clear()
+    clock.now += 59
+    assert await client.is_user_in_project(project_id, user_id, exp=exp)
+    clock.now += 2
+    assert not await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert service.user_projects_calls == 2
+
+
+async def test_invalidate(start_service, clock):
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, user_id)}, projects={user_id: [project_id]})
+    client = make_client(await start_service(service), clock)
+    exp = int(time.time()) + 3600
+
+    assert await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert await client.is_user_in_project(project_id, user_id)
+
+    service.members.clear()
+    service.projects.clear()
+    client.invalidate(project_id, user_id)
+    assert not await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert not await client.is_user_in_project(project_id, user_id)
+
+
+async def test_user_projects_unimplemented(start_service, clock, monkeypatch):
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, user_id)}, user_projects_implemented=False)
+    client = make_client(await start_service(service), clock)
+    exp = int(time.time()) + 600
+
+    monotonic = Clock()
+    monkeypatch.setattr(project, "time", types.SimpleNamespace(time=time.time, monotonic=monotonic))
+
+    assert await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert service.user_projects_calls == 1
+    assert service.membership_calls == 1
+
+    # До истечения UNSUPPORTED_RETRY_INTERVAL GetUserProjects не вызывается
+    monotonic.now += ProjectServiceClient.UNSUPPORTED_RETRY_INTERVAL - 1
+    clock.now += 120
+    assert await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert service.user_projects_calls == 1
+    assert service.membership_calls == 2
+
+    monotonic.now += 2
+    service.user_projects_implemented = True
+    service.projects = {user_id: [project_id]}
+    assert await client.is_user_in_project(project_id, user_id, exp=exp)
+    assert service.user_projects_calls == 2
+    assert service.membership_calls == 2
+
+
+async def test_channel_pool_round_robin(start_service):
+    project_id, user_id = uuid.uuid4(), uuid.uuid4()
+    service = ProjectService(members={(project_id, user_id)})
+    pool = await start_service(service, size=3)
+
+    channels = [pool.get() for _ in range(6)]
+    assert len(set(map(id, channels))) == 3
+    assert channels[:3] == channels[3:]
+
+    results = await asyncio.gather(*(
+        project.request_membership(project_id, user_id, channel) for channel in channels
+    ))
+    assert results == [True] * 6
@@ -0,0 +1,78 @@
+"""
+Число запросов и строк при загрузке доски
+
+Запросы считаются через count_queries на БД после миграций: число запросов
+не должно зависеть от размера доски (нет N+1), число строк - соответствовать
+загруженным колонкам, задачам и тегам.
+"""
+import pytest
+from sqlalchemy import select
+
+from src.db import count_queries
+from src.models import tables
+from src.services.repository import ColumnRepo
+from tests.conftest import create_board, make_services
+
+
+@pytest.mark.parametrize("columns, tasks", [(2, 3), (6, 40)])
+async def test_get_board(uow, db_engine, columns, tasks):
+    project_id = await create_board(db_engine, columns=columns, tasks=tasks)
+
+    with count_queries() as counter:
+        rows = await ColumnRepo(uow).get_board(project_id)
+
+    assert counter.queries == 1
+    assert counter.rows == len(rows) == columns * tasks
+    assert all(len(row.tag_ids) == 3 for row in rows)
+
+
+async def test_get_board_empty_columns(uow, db_engine):
+    project_id = await create_board(db_engine, columns=4, tasks=0)
+
+    with count_queries() as counter:
+        rows = await ColumnRepo(uow).get_board(project_id)
+
+    assert (counter.queries, counter.rows) == (1, 4)
+    assert all(row.task_id is None for row in rows)
+
+
+@pytest.mark.parametrize("tasks", [3, 40])
+async def test_get_column(uow, db_engine, user, tasks):
+    project_id = await create_board(db_engine, columns=3, tasks=tasks, tags=2)
+    async with db_engine.connect() as connection:
+        column_id = (await connection.execute(
+            select(tables.Column.id).where(tables.Column.project_id == project_id)
+        )).scalars().first()
+
+    with count_queries() as counter:
+        column = await make_services(uow, user).kanban.get_column(column_id)
+
+    # Колонка, задачи и пары задача-тег, без декартова произведения
+    assert counter.queries == 3
+    assert counter.rows == 1 + tasks + tasks * 2
+    assert len(column.tasks) == tasks
+    assert all(len(task.tags) == 2 for task in column.tasks)
+
+
+@pytest.mark.parametrize("columns, tasks", [(2, 3), (6, 40)])
+async def test_column_list(uow, db_engine, user, columns, tasks):
+    project_id = await create_board(db_engine, columns=columns, tasks=tasks)
+
+    with count_queries() as counter:
+        result = await make_services(uow, user).kanban.column_list(project_id)
+
+    assert counter.queries == 1
+    assert counter.rows == columns * tasks
+    assert [len(column.tasks) for column in result] == [tasks] * columns
+
+
+@pytest.mark.parametrize("tasks", [3, 40])
+async def test_get_preview(uow, db_engine, tasks):
+    project_id = await create_board(db_engine, columns=4, tasks=tasks)
+
+    with count_queries() as counter:
+        rows = await ColumnRepo(uow).get_preview(project_id, limit=5)
+
+    assert counter.queries == 1
+    assert counter.rows == len(rows) == 4 * min(tasks, 5)
+    assert all(row.column_task_count == tasks for row in rows)
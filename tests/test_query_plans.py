@@ -0,0 +1,127 @@
+"""
+Планы запросов списка задач, превью доски и перемещения задачи
+
+Запросы репозиториев выполняются на БД после миграций, затем для каждого
+выполненного запроса строится EXPLAIN с enable_seqscan = off: если индекс
+применим, планировщик выбирает его, иначе в плане остается Seq Scan.
+"""
+import json
+from typing import Iterator
+
+import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.models import tables
+from src.services.repository import ColumnRepo, TaskRepo, TaskProjection
+from tests.conftest import create_board
+
+
+@pytest.fixture
+def statements(db_engine) -> Iterator[list[tuple[str, tuple]]]:
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append((statement, parameters))
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+async def board(db_engine) -> dict:
+    project_id = await create_board(db_engine, columns=5, tasks=50, content="content")
+    # Остальные проекты: доска занимает малую часть таблиц, полный обход индекса не выгоден
+    for _ in range(9):
+        await create_board(db_engine, columns=5, tasks=50, content="content")
+    async with db_engine.begin() as connection:
+        await connection.execute(text("ANALYZE"))
+        column_id = (await connection.execute(
+            select(tables.Column.id).where(tables.Column.project_id == project_id).order_by(tables.Column.position)
+        )).scalars().first()
+        task_ids = (await connection.execute(
+            select(tables.Task.id).where(tables.Task.column_id == column_id).order_by(tables.Task.position)
+        )).scalars().all()
+    return dict(project_id=project_id, column_id=column_id, task_ids=task_ids)
+
+
+async def explain(engine: AsyncEngine, statement: str, parameters) -> dict:
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+
+def scans(plan: dict) -> Iterator[tuple[str, str | None, str | None]]:
+    """
+    Узлы чтения таблиц плана: (тип узла, таблица, индекс)
+    """
+    if "Relation Name" in plan or "Index Name" in plan:
+        yield plan["Node Type"], plan.get("Relation Name"), plan.get("Index Name")
+    for child in plan.get("Plans", ()):
+        yield from scans(child)
+
+
+async def plan_scans(engine: AsyncEngine, statements: list) -> list[set]:
+    # EXPLAIN выполняется через тот же движок, его запросы не разбираются
+    statements = list(statements)
+    assert statements
+    return [set(scans(await explain(engine, *statement))) for statement in statements]
+
+
+def indexes(plan_scans: set) -> set[str]:
+    return {index for _, _, index in plan_scans if index}
+
+
+def assert_no_seq_scan(plan_scans: set) -> None:
+    seq_scans = {relation for node, relation, _ in plan_scans if node == "Seq Scan"}
+    assert not seq_scans, f"Seq Scan: {seq_scans}"
+
+
+async def test_task_list(db_engine, uow, board, statements):
+    repo = TaskRepo(uow)
+    projection = TaskProjection(content=True)
+    rows = await repo.get_rows(board["column_id"], limit=20, projection=projection)
+    await repo.get_rows(board["column_id"], limit=20, after=(rows[-1].task_position, rows[-1].task_id),
+                        projection=projection)
+
+    for plan in await plan_scans(db_engine, statements):
+        assert_no_seq_scan(plan)
+        assert {
+            "ix_tasks_column_id_position", "uq_task_tags_task_id_tag_id", "task_contents_pkey"
+        } <= indexes(plan)
+
+
+async def test_preview(db_engine, uow, board, statements):
+    await ColumnRepo(uow).get_preview(board["project_id"], limit=5, projection=TaskProjection(content=True))
+
+    [plan] = await plan_scans(db_engine, statements)
+    assert_no_seq_scan(plan)
+    assert {
+        "ix_columns_project_id_position", "ix_tasks_column_id_position", "uq_task_tags_task_id_tag_id"
+    } <= indexes(plan)
+
+
+async def test_board(db_engine, uow, board, statements):
+    await ColumnRepo(uow).get_board(board["project_id"])
+
+    [plan] = await plan_scans(db_engine, statements)
+    assert_no_seq_scan(plan)
+    assert {"ix_columns_project_id_position", "uq_task_tags_task_id_tag_id"} <= indexes(plan)
+
+
+async def test_move(db_engine, uow, board, statements):
+    repo = TaskRepo(uow)
+    task_id, child_id = board["task_ids"][-1], board["task_ids"][10]
+
+    async with uow:
+        position = await repo.key_before(board["column_id"], child_id, exclude_id=task_id)
+        await repo.move(task_id, board["column_id"], child_id, position)
+
+    key_before, move = await plan_scans(db_engine, statements)
+    assert_no_seq_scan(key_before)
+    assert "ix_tasks_column_id_position" in indexes(key_before)
+    assert_no_seq_scan(move)
+    assert "ix_tasks_child_id" in indexes(move)
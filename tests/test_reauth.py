@@ -0,0 +1,245 @@
+import importlib
+import types
+
+import grpc
+import pytest
+from starlette.types import Scope
+
+from src.middleware.jwt import JWTMiddleware
+from src.protos.ums_control import ums_control_pb2
+from src.protos.ums_control import ums_control_pb2_grpc
+from src.services.auth import reauth, VerifiedTokenCache, JWTManager
+from src.services.auth.reauth import ReauthSessionCache
+from src.services.auth.scheduler import update_reauth_list
+from src.services.channels import ChannelPool
+
+jwt_module = importlib.import_module("src.services.auth.jwt")
+
+
+class UserManagement(ums_control_pb2_grpc.UserManagementServicer):
+    """
+    UMS со списком сессий и журналом изменений по версиям
+    """
+
+    def __init__(self, sessions: dict[str, str] = None, delta_implemented: bool = True):
+        self.sessions = dict(sessions or {})
+        self.version = 1
+        self.changes: dict[int, tuple[dict[str, str], set[str]]] = {}
+        self.delta_implemented = delta_implemented
+        self.fail = False
+        self.delta_requests: list[int] = []
+        self.list_calls = 0
+
+    def change(self, upserts: dict[str, str] = None, removed: set[str] = frozenset()) -> None:
+        self.version += 1
+        self.sessions.update(upserts or {})
+        for session_id in removed:
+            self.sessions.pop(session_id, None)
+        self.changes[self.version] = (upserts or {}, set(removed))
+
+    async def GetReauthDelta(self, request, context):
+        self.delta_requests.append(request.version)
+        if not self.delta_implemented:
+            await context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not implemented!")
+        if self.fail:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "unavailable")
+
+        # Версия клиента неизвестна (0 или старше журнала) - полный список
+        if request.version != self.version and request.version + 1 not in self.changes:
+            return ums_control_pb2.ReauthDeltaReply(
+                version=self.version, full=True, upserts=self._dicts(self.sessions)
+            )
+
+        upserts, removed = {}, set()
+        for version in range(request.version + 1, self.version + 1):
+            version_upserts, version_removed = self.changes[version]
+            upserts.update(version_upserts)
+            removed.update(version_removed)
+            removed.difference_update(version_upserts)
+        return ums_control_pb2.ReauthDeltaReply(
+            version=self.version, upserts=self._dicts(upserts), removed=sorted(removed)
+        )
+
+    async def GetListOfReauth(self, request, context):
+        self.list_calls += 1
+        return ums_control_pb2.ListOfDictReply(dicts=self._dicts(self.sessions))
+
+    @staticmethod
+    def _dicts(sessions: dict[str, str]) -> list:
+        return [ums_control_pb2.Dictionary(key=key, value=value) for key, value in sessions.items()]
+
+
+@pytest.fixture
+async def start_ums(grpc_server):
+    pools = []
+
+    async def start(ums: UserManagement) -> ChannelPool:
+        pool = ChannelPool(await grpc_server(ums_control_pb2_grpc.add_UserManagementServicer_to_server, ums))
+        pools.append(pool)
+        return pool
+
+    yield start
+    for pool in pools:
+        await pool.close()
+
+
+async def test_full_load_and_delta(start_ums):
+    ums = UserManagement({"s1": "r1", "s2": "r2"})
+    pool = await start_ums(ums)
+    cache = ReauthSessionCache()
+
+    await cache.sync(pool.get())
+    assert (cache.get("s1"), cache.get("s2"), len(cache)) == ("r1", "r2", 2)
+    assert cache.version == 1
+
+    ums.change(upserts={"s3": "r3", "s2": "r2-new"}, removed={"s1"})
+    ums.change(upserts={"s4": "r4"})
+    await cache.sync(pool.get())
+    assert ums.delta_requests == [0, 1]
+    assert cache.version == 3
+    assert (cache.get("s1"), cache.get("s2"), cache.get("s3"), cache.get("s4")) == (None, "r2-new", "r3", "r4")
+
+    # Без изменений состояние не пересобирается
+    sessions = cache._sessions
+    await cache.sync(pool.get())
+    assert cache._sessions is sessions
+    assert ums.list_calls == 0
+
+
+async def test_full_reply_replaces_state(start_ums):
+    ums = UserManagement({"s1": "r1"})
+    pool = await start_ums(ums)
+    cache = ReauthSessionCache()
+    cache.replace({"stale": "r0"})
+    cache._version = 100
+
+    await cache.sync(pool.get())
+    assert cache.get("stale") is None
+    assert cache.get("s1") == "r1"
+    assert cache.version == 1
+
+
+async def test_atomic_swap(start_ums):
+    ums = UserManagement({"s1": "r1", "s2": "r2"})
+    pool = await start_ums(ums)
+    cache = ReauthSessionCache()
+    await cache.sync(pool.get())
+
+    # Читатели, получившие состояние до синхронизации, видят его целиком
+    before = cache._sessions
+    ums.change(upserts={"s3": "r3"}, removed={"s1", "s2"})
+    await cache.sync(pool.get())
+
+    assert before == {"s1": "r1", "s2": "r2"}
+    assert cache._sessions == {"s3": "r3"}
+
+
+async def test_failed_sync_keeps_state(start_ums):
+    ums = UserManagement({"s1": "r1"})
+    pool = await start_ums(ums)
+    app = types.SimpleNamespace(state=types.SimpleNamespace(reauth_sessions=ReauthSessionCache()))
+    await update_reauth_list(app, pool)
+
+    ums.change(removed={"s1"})
+    ums.fail = True
+    with pytest.raises(grpc.RpcError):
+        await app.state.reauth_sessions.sync(pool.get())
+    await update_reauth_list(app, pool)
+
+    assert app.state.reauth_sessions.get("s1") == "r1"
+    assert app.state.reauth_sessions.version == 1
+
+
+async def test_delta_unimplemented(start_ums, monkeypatch):
+    ums = UserManagement({"s1": "r1"}, delta_implemented=False)
+    pool = await start_ums(ums)
+    cache = ReauthSessionCache()
+
+    monotonic = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(reauth, "time", types.SimpleNamespace(monotonic=lambda: monotonic.now))
+
+    await cache.sync(pool.get())
+    assert cache.get("s1") == "r1"
+    assert (len(ums.delta_requests), ums.list_calls) == (1, 1)
+
+    monotonic.now += ReauthSessionCache.UNSUPPORTED_RETRY_INTERVAL - 1
+    ums.change(upserts={"s2": "r2"})
+    await cache.sync(pool.get())
+    assert cache.get("s2") == "r2"
+    assert (len(ums.delta_requests), ums.list_calls) == (1, 2)
+
+    monotonic.now += 2
+    ums.delta_implemented = True
+    await cache.sync(pool.get())
+    assert (len(ums.delta_requests), ums.list_calls) == (2, 2)
+    assert cache.version == ums.version
+
+
+CONFIG = types.SimpleNamespace(JWT=types.SimpleNamespace(ACCESS_SECRET_KEY="access", REFRESH_SECRET_KEY="refresh"))
+
+
+def make_tokens(refresh_lifetime: int = 600) -> tuple[str, str]:
+    manager = JWTManager(CONFIG)
+    payload = dict(id="8f5a3c6e-1f0a-4c4b-9e0a-2a7c1b5d9e11", username="user", permissions=[], state_id=1)
+    return (
+        manager._generate_token(60, CONFIG.JWT.ACCESS_SECRET_KEY, **payload),
+        manager._generate_token(refresh_lifetime, CONFIG.JWT.REFRESH_SECRET_KEY, **payload),
+    )
+
+
+async def authenticate(middleware: JWTMiddleware, reauth_sessions: ReauthSessionCache, cookies: dict) -> Scope:
+    scopes = []
+
+    async def app(scope, receive, send):
+        scopes.append(scope)
+
+    middleware.app = app
+    cookie = "; ".join(f"{key}={value}" for key, value in cookies.items())
+    scope = {
+        "type": "http",
+        "headers": [(b"cookie", cookie.encode())],
+        "app": types.SimpleNamespace(state=types.SimpleNamespace(reauth_sessions=reauth_sessions)),
+    }
+    await middleware(scope, None, None)
+    return scopes[0]
+
+
+async def test_middleware_rejects_revoked_refresh_token(monkeypatch):
+    access_token, refresh_token = make_tokens()
+    cookies = dict(session_id="s1", access_token=access_token, refresh_token=refresh_token)
+    token_cache = VerifiedTokenCache()
+    middleware = JWTMiddleware(None, config=CONFIG, token_cache=token_cache)
+    reauth_sessions = ReauthSessionCache()
+
+    scope = await authenticate(middleware, reauth_sessions, cookies)
+    assert scope["user"].is_authenticated
+    assert len(token_cache._cache) == 2
+
+    decoded = []
+    decode = jwt_module.jwt.decode
+    monkeypatch.setattr(jwt_module.jwt, "decode", lambda *args, **kwargs: decoded.append(args) or decode(*args, **kwargs))
+
+    reauth_sessions.replace({"s1": refresh_token})
+    scope = await authenticate(middleware, reauth_sessions, cookies)
+    assert not scope["user"].is_authenticated
+    assert scope["auth"].scopes == []
+    assert decoded == []
+    # Токены удалены из кэша проверенных токенов
+    assert len(token_cache._cache) == 0
+
+    # Другая сессия с тем же списком проходит проверку
+    scope = await authenticate(middleware, reauth_sessions, dict(cookies, session_id="s2"))
+    assert scope["user"].is_authenticated
+    assert len(decoded) == 2
+
+
+async def test_middleware_accepts_new_refresh_token():
+    access_token, refresh_token = make_tokens()
+    _, new_refresh_token = make_tokens(refresh_lifetime=1200)
+    middleware = JWTMiddleware(None, config=CONFIG)
+    reauth_sessions = ReauthSessionCache()
+    reauth_sessions.replace({"s1": refresh_token})
+
+    cookies = dict(session_id="s1", access_token=access_token, refresh_token=new_refresh_token)
+    scope = await authenticate(middleware, reauth_sessions, cookies)
+    assert scope["user"].is_authenticated
@@ -0,0 +1,83 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src import exceptions
+from src.models import tables
+from src.services.repository import TaskRepo, UnitOfWork
+from src.utils.cursor import encode_cursor, decode_cursor
+from tests.conftest import create_board, make_services
+
+
+def test_cursor_round_trip():
+    task_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor("a0", task_id, 3)) == ("a0", task_id, 3)
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", encode_cursor("a0", uuid.uuid4(), 0)[:-4]])
+def test_broken_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.fixture
+async def column(db_engine) -> dict:
+    project_id = await create_board(db_engine, columns=1, tasks=25)
+    async with db_engine.connect() as connection:
+        column_id = (await connection.execute(
+            select(tables.Column.id).where(tables.Column.project_id == project_id)
+        )).scalar()
+        task_ids = (await connection.execute(
+            select(tables.Task.id).where(tables.Task.column_id == column_id).order_by(tables.Task.position)
+        )).scalars().all()
+    return dict(project_id=project_id, column_id=column_id, task_ids=task_ids)
+
+
+async def rebalance(db_engine, column_id: uuid.UUID) -> None:
+    uow = UnitOfWork(async_sessionmaker(db_engine, expire_on_commit=False))
+    async with uow:
+        await TaskRepo(uow).rebalance(column_id)
+    await uow.release()
+
+
+async def test_pages_cover_column(uow, user, column):
+    column_id, task_ids = column["column_id"], column["task_ids"]
+    kanban = make_services(uow, user).kanban
+
+    seen, cursor = [], None
+    while True:
+        page = await kanban.task_list(column_id, limit=10, cursor=cursor)
+        seen.extend(task.id for task in page.tasks)
+        if not (cursor := page.next_cursor):
+            break
+
+    assert seen == task_ids
+
+
+async def test_rebalance_invalidates_cursor(db_engine, uow, user, column):
+    column_id, task_ids = column["column_id"], column["task_ids"]
+    kanban = make_services(uow, user).kanban
+    page = await kanban.task_list(column_id, limit=10)
+
+    await rebalance(db_engine, column_id)
+
+    with pytest.raises(exceptions.BadRequest):
+        await kanban.task_list(column_id, limit=10, cursor=page.next_cursor)
+
+    # Курсор новой первой страницы снова действует
+    page = await kanban.task_list(column_id, limit=10)
+    page = await kanban.task_list(column_id, limit=10, cursor=page.next_cursor)
+    assert [task.id for task in page.tasks] == task_ids[10:20]
+
+
+async def test_preview_cursor_continues_task_list(db_engine, uow, user, column):
+    column_id, task_ids = column["column_id"], column["task_ids"]
+    kanban = make_services(uow, user).kanban
+    await rebalance(db_engine, column_id)
+
+    [preview] = await kanban.column_preview(column["project_id"], limit=5)
+    page = await kanban.task_list(column_id, limit=5, cursor=preview.next_cursor)
+    assert [task.id for task in page.tasks] == task_ids[5:10]